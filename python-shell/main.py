@@ -277,7 +277,7 @@ class Shell:
 
 						ip = input('Enter the IP address : ')
 
-					if len(token["arguments"]) >= 4:
+					if len(token["arguments"]) >= 4 and not token["arguments"][2].startswith('-'):
 						# If there are equal or more than 4 arguments entered by the user, then we assume the third argument as the start port and the fourth argument as the end port to scan for
 
 						# Setting the port number range from the arguments
@@ -285,12 +285,12 @@ class Shell:
 						number2 = token["arguments"][3]
 						
 						# Starting a port scan attack on the user specified IP address
-						IP(address = ip).portscan(initial = number1, final = number2)
+						IP(address = ip, arguments = token["arguments"]).portscan(initial = number1, final = number2)
 					else:
 						# If there are less than 4 arguments entered by the user, then we start from 1 to 65500 port number for the scanning
 
 						# Starting a port scan attack on the user specified IP address (with default port number range)
-						IP(address = ip).portscan()
+						IP(address = ip, arguments = token["arguments"]).portscan()
 				elif token["arguments"][0] == 'gethostbyname':
 					# If the argument entered by the user asks for fetching the host IP address by name, then we continue
 
@@ -337,7 +337,7 @@ class Shell:
 
 						ip = input('Enter the hostname : ')
 
-					if len(token["arguments"]) >= 4:
+					if len(token["arguments"]) >= 4 and not token["arguments"][2].startswith('-'):
 						# If there are equal or more than 4 arguments entered by the user, then we assume the third argument as the start port and the fourth argument as the end port to scan for
 
 						# Setting the port number range from the arguments
@@ -345,12 +345,12 @@ class Shell:
 						number2 = token["arguments"][3]
 						
 						# Starting a port scan attack on the user specified host
-						IP(address = ip).portscanhostbyname(initial = number1, final = number2)
+						IP(address = ip, arguments = token["arguments"]).portscanhostbyname(initial = number1, final = number2)
 					else:
 						# If there are less than 4 arguments entered by the user, then we start from 1 to 65500 port number for the scanning
 
 						# Starting a port scan attack on the user specified IP address (with default port number range)
-						IP(address = ip).portscanhostbyname()
+						IP(address = ip, arguments = token["arguments"]).portscanhostbyname()
 				elif token["arguments"][0] == 'all':
 					# If the argument entered by the user asks for executing all the IP address related tasks (fetching information, port scanning etc), then we continue
 
@@ -371,7 +371,7 @@ class Shell:
 
 					# Starting a port scan on the user specified host
 					print(f'\n[ Starting port scan on {ip} ]')
-					if len(token["arguments"]) >= 4:
+					if len(token["arguments"]) >= 4 and not token["arguments"][2].startswith('-'):
 						# If there are equal or more than 4 arguments entered by the user, then we assume the third argument as the start port and the fourth argument as the end port to scan for
 
 						# Setting the port number range from the arguments
@@ -379,12 +379,12 @@ class Shell:
 						number2 = token["arguments"][3]
 						
 						# Starting a port scan attack on the user specified IP address
-						IP(address = ip).portscan(initial = number1, final = number2)
+						IP(address = ip, arguments = token["arguments"]).portscan(initial = number1, final = number2)
 					else:
 						# If there are less than 4 arguments entered by the user, then we start from 1 to 65500 port number for the scanning
 
 						# Starting a port scan attack on the user specified IP address (with default port number range)
-						IP(address = ip).portscan()
+						IP(address = ip, arguments = token["arguments"]).portscan()
 				elif token["arguments"][0] == 'allbyname':
 					# If the argument entered by the user asks for executing all the IP address related tasks (fetching information, port scanning etc) + using the user entered hostname (not IP address), then we continue
 
@@ -405,7 +405,7 @@ class Shell:
 
 					# Starting a port scan on the user specified host
 					print(f'\n[ Starting port scan on {ip} ]')
-					if len(token["arguments"]) >= 4:
+					if len(token["arguments"]) >= 4 and not token["arguments"][2].startswith('-'):
 						# If there are equal or more than 4 arguments entered by the user, then we assume the third argument as the start port and the fourth argument as the end port to scan for
 
 						# Setting the port number range from the arguments
@@ -413,12 +413,12 @@ class Shell:
 						number2 = token["arguments"][3]
 						
 						# Starting a port scan attack on the user specified IP address
-						IP(address = ip).portscanhostbyname(initial = number1, final = number2)
+						IP(address = ip, arguments = token["arguments"]).portscanhostbyname(initial = number1, final = number2)
 					else:
 						# If there are less than 4 arguments entered by the user, then we start from 1 to 65500 port number for the scanning
 
 						# Starting a port scan attack on the user specified IP address (with default port number range)
-						IP(address = ip).portscanhostbyname()
+						IP(address = ip, arguments = token["arguments"]).portscanhostbyname()
 				elif token["arguments"][0] == '--help' or token["arguments"][0] == '-h':
 					# If the argument entered by the user is for displaying the help related information for the ip command, then we continue
 
@@ -536,6 +536,16 @@ class Shell:
 
 					# Passing the arguments to the Connections object with task specified to 'check-ssh'
 					Connections(arguments = token["arguments"], task = 'check-ssh')
+				elif token["arguments"][0] == 'discover':
+					# If the argument entered by the user is to list the devices which are up on a network, then we continue
+
+					# Passing the arguments to the Connections object with task specified to 'discover' (the address can also be specified directly after the task, i.e., connections discover 192.168.43)
+					arguments = token["arguments"]
+					if len(arguments) >= 2 and not arguments[1].startswith('-'):
+						# If the second argument is not an argument token, then we assume it as the IP address
+
+						arguments = arguments + ['--ip-address', arguments[1]]
+					Connections(arguments = arguments, task = 'discover')
 				elif token["arguments"][0] == '--help':
 					# If the argument entered by the user is to display the help / documentation of the connections command / tool, then we continue
 
@@ -605,6 +615,16 @@ class Shell:
 
 					# Launching the encryption.ImageEncrypter class object passing all the parsed argument tokens
 					encryption.ImageEncrypter(arguments = token["arguments"])
+				elif token["arguments"][0] == 'video':
+					# If the argument entered by the user is for encryption / decryption of a video file (or any other large media file), then we continue
+
+					# Launching the encryption.VideoEncrypter class object passing all the parsed argument tokens
+					encryption.VideoEncrypter(arguments = token["arguments"])
+				elif token["arguments"][0] == 'directory':
+					# If the argument entered by the user is for encryption / decryption of an entire directory, then we continue
+
+					# Launching the encryption.DirectoryEncrypter class object passing all the parsed argument tokens
+					encryption.DirectoryEncrypter(arguments = token["arguments"])
 				else:
 					# If the argument entered by the user is not recognized, then we display the error message on the console screen
 
@@ -612,6 +632,56 @@ class Shell:
 					return 0
 		# ----
 
+		# HASH RELATED COMMANDS
+		# ----
+		elif token["command"] == 'hash':
+			# If the user entered command is hashing related tasks, then we continue
+
+			# Checking for the arguments if exists
+			if len(token["arguments"]) == 0:
+				# If there are no arguments entered by the user
+
+				print('[ hash : requires arguments, use hash --help for more info ]')
+			else:
+				# If there are atleast more than 0 arguments entered by the user
+
+				if token["arguments"][0] == 'dictionary-cracker':
+					# If the argument entered by the user is for cracking hashes via the dictionary cracker, then we continue
+
+					# Launching the encryption.Hash.dictionarycracker() function passing all the parsed argument tokens
+					encryption.Hash.dictionarycracker(arguments = token["arguments"])
+				elif token["arguments"][0] == 'crack':
+					# If the argument entered by the user is for cracking a hash, then we continue
+
+					# Launching the encryption.HashCracker class object passing all the parsed argument tokens
+					encryption.HashCracker(arguments = token["arguments"])
+				elif token["arguments"][0] == 'bulk-verify':
+					# If the argument entered by the user is for verifying the (plain string, hash) pairs of a CSV file, then we continue
+
+					# Launching the encryption.Hash.bulkverify() function passing all the parsed argument tokens
+					encryption.Hash.bulkverify(arguments = token["arguments"])
+				elif token["arguments"][0] == 'file':
+					# If the argument entered by the user is for hashing a file (or all of the files of a directory), then we continue
+
+					# Launching the encryption.FileHasher class object passing all the parsed argument tokens
+					encryption.FileHasher(arguments = token["arguments"])
+				elif token["arguments"][0] == 'cache':
+					# If the argument entered by the user is for managing the digest cache of the files, then we continue
+
+					# Launching the encryption.DigestCache class object passing all the parsed argument tokens
+					encryption.DigestCache(arguments = token["arguments"])
+				elif token["arguments"][0] == 'build-table' or token["arguments"][0] == 'lookup':
+					# If the argument entered by the user is for building the lookup table of hashes or looking up a hash in it, then we continue
+
+					# Launching the encryption.HashTable class object passing all the parsed argument tokens
+					encryption.HashTable(arguments = token["arguments"])
+				else:
+					# If the argument entered by the user is for making / verifying a hash, then we continue
+
+					# Launching the encryption.Hash class object passing all the parsed argument tokens
+					encryption.Hash(arguments = token["arguments"])
+		# ----
+
 		# ARITHMETIC COMMANDS
 		# ----
 		elif token["command"] == 'add':
@@ -18,12 +18,27 @@ Authors contributed to this script (Add your name below if you have contributed)
 
 # Importing the required functions and modules
 try:
-	from base64 import b64encode, b64decode, decodebytes
+	from base64 import b64encode, b64decode, decodebytes, urlsafe_b64encode, urlsafe_b64decode
 	from io import TextIOWrapper
-	from os import path, listdir, remove, rename
+	from os import path, listdir, remove, rename, replace, fdopen, walk, stat, utime, fsync, makedirs
+	from shutil import copymode
+	from tempfile import mkstemp
+	from codecs import getincrementaldecoder
+	from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+	from glob import iglob
+	from itertools import repeat
+	from collections import deque
+	from heapq import merge
+	from multiprocessing import Event, Array
+	from signal import signal, SIGINT, SIG_IGN
+	from string import ascii_lowercase, ascii_uppercase, digits, punctuation
 	from sys import stdout
+	from time import monotonic, time_ns
+	from mmap import mmap, ACCESS_READ
 	import hashlib
 	from json import loads, dumps
+	import csv
+	import sqlite3
 	from datetime import datetime
 except Exception as e:
 	# If there are any errors during the importing of the modules, then we display the error on the console screen
@@ -31,6 +46,157 @@ except Exception as e:
 	input(f'\n[ Error : {e} ]\nPress enter key to continue...')
 	exit()
 
+class CipherKernel:
+	""" This class serves the core cipher operation which is shared by all the encryption tools (StringEncrypter, FileEncrypter, ImageEncrypter, VideoEncrypter, DirectoryEncrypter). The cipher shifts each character / byte by the key generated from the password, i.e., (code + key) % 256 for encryption and (code - key) % 256 for decryption.
+
+	Instead of shifting the characters one by one in a python loop, this class precomputes the 256 entry translation tables for the key once, and then applies them to entire buffers at a time using bytes.translate().
+
+	Usage of this class is shown below.
+
+	kernel = CipherKernel(key = 1234)
+
+	# For bytes
+	cipher = kernel.encrypt(b'Some plain bytes')
+	plain = kernel.decrypt(cipher)
+
+	# For strings (the character by character method used by the encryption tools)
+	cipher = kernel.encrypttext('Some plain text')
+	plain = kernel.decrypttext(cipher)
+	"""
+
+	def __init__(self, key):
+		# Setting the key (only the remainder with 256 matters for the cipher)
+		self.key = key % 256
+
+		# Precomputing the translation tables for the encryption and decryption
+		self.encryptiontable = bytes([(code + self.key) % 256 for code in range(256)])
+		self.decryptiontable = bytes([(code - self.key) % 256 for code in range(256)])
+
+	def encrypt(self, data):
+		""" This method / function serves the functionality of encrypting the bytes passed to this function (the parameter data). The function returns the cipher bytes back. """
+
+		return bytes(data).translate(self.encryptiontable)
+
+	def decrypt(self, data):
+		""" This method / function serves the functionality of decrypting the cipher bytes passed to this function (the parameter data). The function returns the plain bytes back. """
+
+		return bytes(data).translate(self.decryptiontable)
+
+	def encrypttext(self, text):
+		""" This method / function serves the functionality of encrypting a string character by character, i.e., each character is converted to chr((ord(character) + key) % 256). This is the same conversion as used by the encryption tools of this module since the beginning, thus the outputs remain the same. The function returns the cipher string back. """
+
+		return self._translatetext(text, self.encryptiontable)
+
+	def decrypttext(self, text):
+		""" This method / function serves the functionality of decrypting a string character by character, i.e., each character is converted to chr((ord(character) - key) % 256). The function returns the plain string back. """
+
+		return self._translatetext(text, self.decryptiontable)
+
+	@staticmethod
+	def _translatetext(text, table):
+		""" This method / function translates the characters of a string using the specified translation table. The characters are first mapped to the range 0-255 (as done by the % 256 in the cipher), and then translated at once. """
+
+		try:
+			# Mapping the characters to bytes directly (works when all of the characters are in the range 0-255)
+			data = text.encode('latin-1')
+		except UnicodeEncodeError:
+			# If there are characters out of the range 0-255, then we map them by the remainder of their code with 256
+
+			data = bytes([ord(character) % 256 for character in text])
+		return data.translate(table).decode('latin-1')
+
+class CipherContainer:
+	""" This class serves the binary container format which is shared by the encryption tools writing encrypted files (FileEncrypter, ImageEncrypter, VideoEncrypter, DirectoryEncrypter). Unlike the legacy format (MD5 hash of the password in the first line, followed by the base64 encoded cipher text), the container stores the raw cipher bytes, thus the encrypted file is just 30 bytes larger than the plain file.
+
+	The layout of the container is shown below.
+	b'PSENC'       -> magic bytes (5 bytes), used for telling the container apart from the legacy format
+	version        -> version of the container format (1 byte)
+	key check      -> raw MD5 hash of the password (16 bytes), used for verifying the password before decryption
+	length         -> length of the plain contents (8 bytes, big endian)
+	cipher bytes   -> the contents encrypted using the CipherKernel
+
+	Usage of this class is shown below.
+
+	container = CipherContainer(password = 'somehardpassword123')
+	header = container.makeheader(length = 1234)
+
+	# Reading the header (None is returned for the files in the legacy format)
+	header = container.readheader(descriptor)
+	container.checkkey(header)
+	"""
+
+	def __init__(self, password = None):
+		# Setting some class properties
+		# ----
+		# The magic bytes and the version of the container format, and the size of the header (magic bytes + version + key check + length)
+		self.magic = b'PSENC'
+		self.version = 1
+		self.headersize = 30
+		# ----
+
+		# Generating the key check from the password (the password is only required for creating / verifying the headers, not for reading them)
+		if password == None:
+			# If the password is not specified, then we leave the key check empty
+
+			self.keycheck = None
+		else:
+			# If the password is specified, then we continue to generate the key check
+
+			self.keycheck = hashlib.md5(password.encode()).digest()
+
+	def makeheader(self, length):
+		""" This method / function serves the functionality of creating the header of the container for the plain contents of the specified length. The function returns the header bytes back. """
+
+		return self.magic + bytes([self.version]) + self.keycheck + length.to_bytes(8, 'big')
+
+	def readheader(self, descriptor):
+		""" This method / function serves the functionality of reading the header of the container from the opened file (the parameter descriptor, opened in binary mode). Only the first few bytes of the file are read.
+
+		The function returns a tuple (key check, length) if the file is in the container format. If the file is in the legacy format, then None is returned and the file position is moved back to where it was. If the file is in the container format but of an unsupported version, then an error is raised. """
+
+		position = descriptor.tell()
+		header = descriptor.read(self.headersize)
+		if len(header) == self.headersize and header[:len(self.magic)] == self.magic:
+			# If the file starts with the magic bytes, then we continue to parse the header
+
+			if header[len(self.magic)] != self.version:
+				# If the version of the format is not supported, then we raise an error with a custom message
+
+				raise ValueError(f'Unsupported version of the encrypted file format ({header[len(self.magic)]}).')
+			return (header[len(self.magic) + 1:len(self.magic) + 17], int.from_bytes(header[len(self.magic) + 17:], 'big'))
+		else:
+			# If the file does not starts with the magic bytes, then the file is in the legacy format
+
+			descriptor.seek(position)
+			return None
+
+	def checkkey(self, header):
+		""" This method / function serves the functionality of verifying the password against the key check of a header (returned by the readheader() method). The function returns True if the password matches, and returns False if the password does not matches. """
+
+		return header != None and header[0] == self.keycheck
+
+	def checkheader(self, descriptor):
+		""" This method / function serves the functionality of reading the header of an encrypted file from the opened file (the parameter descriptor, opened in binary mode) and checking the password of the container against it. Only the header is read, i.e., the 30 bytes container header of the binary format or the first line of the legacy format (a bounded read of at most 34 bytes, the MD5 hash + line break). The file position is left at the start of the cipher contents, so that the same opened file can be used for the decryption.
+
+		The function returns a tuple (match, header). The match is True if the password matches, and the header is the container header (key check, length) for the binary format or None for the legacy format. """
+
+		header = self.readheader(descriptor)
+		if header == None:
+			# If the file is in the legacy format, then we compare the MD5 hash of the password stored in the first line
+
+			line = descriptor.readline(34)
+			return (self.keycheck.hex() == line.strip().decode(errors = 'ignore'), None)
+		else:
+			# If the file is in the binary format, then we compare the key check stored in the header
+
+			return (self.checkkey(header), header)
+
+	def checkfile(self, filename):
+		""" This method / function serves the functionality of checking the password of the container against the header of the encrypted file (the parameter filename), see the checkheader() method. The file is opened only for reading the header, and it is closed even if the header is invalid. The function returns True if the password matches, and returns False if the password does not matches. """
+
+		with open(filename, 'rb') as descriptor:
+			return self.checkheader(descriptor)[0]
+
 class StringEncrypter:
 	""" This class serves the features / functionality of encryption as well as decryption of the strings. The encryption / decryption is carried out with a password (encryption key). The class uses its own seperate ways of encryption. Thus if any text / plain string is encrypted using this class (tool), then it can be only decrypted using the decrypt() method of this class.
 
@@ -221,11 +387,7 @@ class StringEncrypter:
 		key = self.generatekey()
 
 		# Converting each character in the user entered text to cipher format
-		text = ''
-		for character in self.text:
-			# Iterating through each character
-
-			text += chr((ord(character) + key) % 256)
+		text = CipherKernel(key).encrypttext(self.text)
 
 		# Encoding the cipher text into base64 format
 		text = b64encode(text.encode()).decode()
@@ -245,11 +407,7 @@ class StringEncrypter:
 		self.text = b64decode(self.text.encode()).decode()
 
 		# Converting each character from cipher text to plain format
-		text = ''
-		for character in self.text:
-			# Iterating through each character
-
-			text += chr((ord(character) - key) % 256)
+		text = CipherKernel(key).decrypttext(self.text)
 
 		# Setting the decrypted text as the class variable self.text
 		self.text = text
@@ -267,6 +425,9 @@ class FileEncrypter:
 		--file            Used to specify the filename
 		--password        Used to specify the password for encryption / decryption
 		--task            Used to specify the task whether encryption / decryption
+		--format          Used to specify the format of the encrypted file, either binary (default) or legacy
+		--glob            Used to specify a glob pattern for encrypting / decrypting multiple files at once (instead of --file)
+		--jobs            Used to specify the number of processes for encrypting / decrypting the files of the glob pattern in parallel (default is 1)
 
 		The file name should be proper and valid. Below are some points listed for the input of the file parameter :
 		* If there are whitespaces within the filename, then use the whitespace escape sequence '\ ' in order to make sure the filename is properly accepted into the class object.
@@ -277,7 +438,9 @@ class FileEncrypter:
 		Example and syntax of the command is shown below.
 
 		encrypt file --password somehardpassword123 --file /location/to/file.txt --task encrypt
+		encrypt file --password somehardpassword123 --file /location/to/file.txt --task encrypt --format legacy
 		encrypt file --password somehardpassword123 --file /location/to/file.txt --task decrypt
+		encrypt file --password somehardpassword123 --glob 'logs/**/*.txt' --task encrypt --jobs 8
 
 	2. Directly from specified parameters
 
@@ -286,22 +449,38 @@ class FileEncrypter:
 		FileEncrypter(
 			filename = '/location/to/file.txt',
 			password = 'somehardpassword123',
+			format = 'binary',
 		)
 
 		Here, there are no needs to use the whitespace escape sequence in order to input the filenames with whitespaces.
 
+	3. Batch mode (glob pattern)
+
+		In this mode, instead of a single file, a glob pattern is specified using the --glob argument (or the 'pattern' parameter). The pattern is expanded lazily (the '**' matches the files in all of the sub-directories), and the matched files are encrypted / decrypted one by one, or by a pool of processes if more than 1 jobs are specified using the --jobs argument (or the 'jobs' parameter). Only a bounded number of files are queued to the pool at a time, thus even the patterns matching millions of files are handled with a constant memory. At the end, a summary of the number of files processed, the bytes processed, the throughput (MB/s) and the failures is displayed on the console screen.
+
 	There are some points to be noted about this class :
 	1. This class / tool uses the same encryption algorithm as used by the basic StringEncrypter.
 	2. This class before decrypting the file, verifies the user entered password for encryption-decryption. If the password matches, then the process to decrypt the file. If the password does not matches, then an error message is displayed on the console screen.
+	3. The file is encrypted / decrypted in chunks (1 MB by default, see self.chunksize) into a temporary file, which then replaces the original file. Thus even very large files can be processed without loading them entirely into the memory.
+	4. In the binary format (default), the file is written in the container format of the CipherContainer (a 30 bytes header followed by the raw cipher bytes). In the legacy format, the file is written as the MD5 hash of the password in the first line followed by the base64 encoded cipher text (about 33% larger than the plain file). The decryption detects the format from the header, thus both the formats can be decrypted.
 	"""
 
-	def __init__(self, filename = None, password = None, arguments = None):
+	def __init__(self, filename = None, password = None, format = 'binary', pattern = None, jobs = 1, arguments = None):
+		# Setting some class properties
+		# ----
+		# The size (in bytes) of the chunks in which the file is read during the encryption / decryption, this keeps the memory usage bounded irrespective of the size of the file
+		self.chunksize = 1048576
+		# ----
+
 		# Checking if arguments provided or just the parameters directly
 		if arguments == None:
 			# If the arguments are not passed to this function by the user, then we continue to use the default provided values
 
 			self.filename = filename
 			self.password = password
+			self.format = format
+			self.pattern = pattern
+			self.jobs = jobs
 		else:
 			# If the arguments are passed to this function by the user, then we continue to parse the arguments
 
@@ -310,6 +489,9 @@ class FileEncrypter:
 			# Setting the default value of the variables to None
 			self.filename = None
 			self.password = None
+			self.format = 'binary'
+			self.pattern = None
+			self.jobs = 1
 			self.task = None
 			self.documentation = False  # Setting the documentation flag class variable to False by default
 
@@ -347,6 +529,46 @@ class FileEncrypter:
 
 						continue
 
+				if argument == '--format':
+					# If the argument is for specifying the format of the encrypted file, then we continue to parse the next argument as the entered value
+
+					try:
+						self.format = arguments[index + 1].lower()
+					except IndexError:
+						# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
+
+						continue
+
+				if argument == '--glob':
+					# If the argument is for specifying the glob pattern of the files, then we continue to parse the next argument as the entered value
+
+					try:
+						self.pattern = arguments[index + 1]
+					except IndexError:
+						# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
+
+						continue
+
+					# Removing the surrounding quotes of the pattern (the shell does not strip the quotes, thus 'logs/**/*.txt' would otherwise match nothing)
+					if len(self.pattern) >= 2 and self.pattern[0] == self.pattern[-1] and self.pattern[0] in ('"', "'"):
+						# If the pattern is enclosed in a matching pair of quotes, then we remove them
+
+						self.pattern = self.pattern[1:-1]
+
+				if argument == '--jobs':
+					# If the argument is for specifying the number of jobs (processes) for the batch mode, then we continue to parse the next argument as the entered value
+
+					try:
+						self.jobs = int(arguments[index + 1])
+					except IndexError:
+						# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
+
+						continue
+					except ValueError:
+						# If the next argument is not a numeric value, then we raise an error with a custom message
+
+						raise ValueError('Invalid number of jobs specified. Requires to be a numeric value (atleast 1).')
+
 				if argument == '--help':
 					# If the argument is for specifying the help, then we continue to mark the documentation mode to be true
 
@@ -357,14 +579,18 @@ class FileEncrypter:
 			if self.documentation:
 				# If the user specified the documentation mode, then we continue to display the help text on the console screen
 
-				print('encrypt file\nUsage : encrypt file <arguments>\n\n"encrypt file" is a tool which serves the functionality of encryption and decryption of text files (also other readable files). The encryption is done using a password, also the same password will be required for the decryption of the file. This tool uses the same encryption algorithm as used by the rest of the encryption tools. This tool also provides the feature of checking the passwords before decryption.\n\nArguments are :\n--file            Used to specify the filename\n--password        Used to specify the password for encryption / decryption\n--task            Used to specify the task whether encryption / decryption\n--help            Used to display this help text\n\nThe file name should be proper and valid. Below are some points listed for the input of the file parameter :\n* If there are whitespaces within the filename, then use the whitespace escape sequence \'\\ \' in order to make sure the filename is properly accepted into the class object.\n* The file should exists on the local machine as well as proper permission for the current user.\n\nCheck out the docs for more info.')
+				print('encrypt file\nUsage : encrypt file <arguments>\n\n"encrypt file" is a tool which serves the functionality of encryption and decryption of text files (also other readable files). The encryption is done using a password, also the same password will be required for the decryption of the file. This tool uses the same encryption algorithm as used by the rest of the encryption tools. This tool also provides the feature of checking the passwords before decryption.\n\nArguments are :\n--file            Used to specify the filename\n--password        Used to specify the password for encryption / decryption\n--task            Used to specify the task whether encryption / decryption\n--format          Used to specify the format of the encrypted file, either binary (default) or legacy\n--glob            Used to specify a glob pattern for encrypting / decrypting multiple files at once (instead of --file)\n--jobs            Used to specify the number of processes for the files of the glob pattern (default is 1)\n--help            Used to display this help text\n\nThe file name should be proper and valid. Below are some points listed for the input of the file parameter :\n* If there are whitespaces within the filename, then use the whitespace escape sequence \'\\ \' in order to make sure the filename is properly accepted into the class object.\n* The file should exists on the local machine as well as proper permission for the current user.\n\nCheck out the docs for more info.')
 			else:
 				# If the user specified the execution mode, then we continue to execute the task
 
 				# Validating the user entered parameters
 				# ----
 				# Validating the filename parameter input (The name / location of the file that is to be encrypted using this tool)
-				if self.filename == None:
+				if self.pattern != None:
+					# If the glob pattern is specified by the user (batch mode), then the files are taken from the pattern and we skip the validation of the filename
+
+					pass
+				elif self.filename == None:
 					# If the filename parameter is not specified by the user (default), then we raise an error with a custom message
 
 					raise SyntaxError('File name not specified.')
@@ -410,6 +636,18 @@ class FileEncrypter:
 						# If the password parameter input specified by the user is not of str type, then we raise an error on the console screen
 
 						raise TypeError('Password invalid. Password parameter should be in str format.')
+
+				# Validating the format parameter entered by the user
+				if self.format != 'binary' and self.format != 'legacy':
+					# If the format specified by the user is neither binary nor legacy, then we raise an error with a custom message
+
+					raise ValueError('Format not recognized. Binary / legacy are the two recognizable formats.')
+
+				# Validating the number of jobs specified by the user
+				if self.jobs < 1:
+					# If the number of jobs specified by the user is less than 1, then we raise an error with a custom message
+
+					raise ValueError('Invalid number of jobs specified. Requires to be a numeric value (atleast 1).')
 				# ----
 
 				# Checking the task specified and then continuing to execute the task
@@ -420,7 +658,11 @@ class FileEncrypter:
 				elif self.task.lower() == 'encrypt' or self.task.lower() == 'encryption':
 					# If the task specified is for encryption, then we continue to encrypt
 
-					if self.encrypt() == 0:
+					if self.pattern != None:
+						# If the glob pattern is specified, then we continue to encrypt all of the matching files
+
+						self.runbatch('encrypt')
+					elif self.encrypt() == 0:
 						# If the encrypt() method returns 0, then the file has been encrypted successfully and we display the success message on the console screen
 
 						print(f'[ File encrypted : {self.filename} ]')
@@ -431,7 +673,11 @@ class FileEncrypter:
 				elif self.task.lower() == 'decrypt' or self.task.lower() == 'decryption':
 					# If the task specified is for decryption, then we continue to decrypt
 
-					if self.decrypt() == 0:
+					if self.pattern != None:
+						# If the glob pattern is specified, then we continue to decrypt all of the matching files
+
+						self.runbatch('decrypt')
+					elif self.decrypt() == 0:
 						# If the decrypt() method returns 0, then the file has been decrypted successfully and we display the success message on the console screen
 
 						print(f'[ File decrypted : {self.filename} ]')
@@ -480,21 +726,22 @@ class FileEncrypter:
 		# Returning the generating key
 		return key
 
-	def checkpassword(self):
+	def checkpassword(self, descriptor = None):
 		""" This method / function serves the functionality of checking the user entered password against the original password stored in the file. This function uses the value of password from the class variable self.password.
 
-		When a file is encrypted, the original password is also saved along with the encrypted contents of the file. Thus, we can verify the password of the file before decrypting the file. The function returns True if the password matches, and returns False if the password does not matches. """
+		When a file is encrypted, the original password is also saved along with the encrypted contents of the file (the key check in the header of the binary format, or the MD5 hash in the first line of the legacy format). Thus, we can verify the password of the file before decrypting the file. Only the header of the file is read (see the CipherContainer.checkheader() method). If an already opened file is passed (the parameter descriptor), then the header is read from it, otherwise the file is opened here. The function returns True if the password matches, and returns False if the password does not matches. """
 
-		# Reading the contents of the file
-		contents = open(self.filename, 'rb').read()
-		contents = contents.decode()
+		if descriptor == None:
+			# If the opened file is not specified, then we open the file for reading the header
+
+			match = CipherContainer(self.password).checkfile(self.filename)
+		else:
+			# If the opened file is specified, then we read the header from it
 
-		# Reading the password stored in the first line
-		password = contents.split('\n')[0]
-		del contents
+			match = CipherContainer(self.password).checkheader(descriptor)[0]
 
 		# Checking the user entered password against the original password stored in the file
-		if hashlib.md5(self.password.encode()).hexdigest() == password:
+		if match:
 			# If the hashes of user entered password and the original password matches, then we return True
 
 			return True
@@ -504,77 +751,363 @@ class FileEncrypter:
 			return False
 
 	def encrypt(self):
-		""" This method / function serves the feature of encrypting the contents of the file. This function reads the filename location input stored in the class variable self.filename. """
+		""" This method / function serves the feature of encrypting the contents of the file. This function reads the filename location input stored in the class variable self.filename.
 
-		# Reading the contents of the file specified by the user
-		contents = open(self.filename, 'rb').read()
-		contents = contents.decode()
+		The file is processed in fixed size chunks (self.chunksize bytes at a time) instead of reading the entire file into the memory. Each chunk is converted to cipher text, encoded into base64 format and then written to a temporary file created beside the original file. After all the chunks are processed, the temporary file replaces the original file in a single step. Thus, the memory usage remains bounded irrespective of the size of the file, and the original file is left untouched if the process fails midway. The output is in the legacy format (password hash in the first line, followed by the base64 encoded cipher text) if specified in the class variable self.format, otherwise the encryptbinary() method is used. """
+
+		if self.format == 'binary':
+			# If the binary format is specified, then we continue to encrypt the file into the container format
+
+			return self.encryptbinary()
 
 		# Generating the encryption key
 		key = self.generatekey()
+		kernel = CipherKernel(key)
 
-		# Converting the plain text to cipher text
-		text = ''
-		for character in contents:
-			# Iterating through each character
+		# Creating a temporary file in the same directory as the file specified by the user (the encrypted contents are first written here)
+		descriptor, temporaryfile = mkstemp(prefix = '.', suffix = '.encrypting', dir = path.dirname(path.abspath(self.filename)))
 
-			text += chr((ord(character) + key) % 256)
+		try:
+			with open(self.filename, 'rb') as reader, fdopen(descriptor, 'wb') as writer:
+				# Adding the password to the contents of the file
+				writer.write((hashlib.md5(self.password.encode()).hexdigest() + '\n').encode())
 
-		# Changing the encoding of the content to base64 format
-		text = b64encode(text.encode()).decode()
+				# The decoder keeps the incomplete multi-byte characters at the end of a chunk, and decodes them along with the next chunk
+				decoder = getincrementaldecoder('utf-8')()
 
-		# Adding the password to the contents of the file
-		text = hashlib.md5(self.password.encode()).hexdigest() + '\n' + text
+				# The bytes of the cipher text which are left over from the previous chunk (base64 encodes 3 bytes at a time)
+				remainder = b''
 
-		# Saving the encrypted content back to the file
-		open(self.filename, 'wb').write(text.encode())
+				while True:
+					# Reading the next chunk of the file specified by the user
+					chunk = reader.read(self.chunksize)
+					final = len(chunk) == 0
+					contents = decoder.decode(chunk, final)
+
+					# Converting the plain text to cipher text
+					text = kernel.encrypttext(contents)
+					text = remainder + text.encode()
+
+					# Changing the encoding of the content to base64 format (only the multiples of 3 bytes are encoded, unless it is the last chunk)
+					if final:
+						# If the end of the file has been reached, then we encode all of the remaining bytes
+
+						cut = len(text)
+					else:
+						# If the end of the file has not been reached yet, then we keep the trailing bytes for the next chunk
+
+						cut = len(text) - (len(text) % 3)
+					writer.write(b64encode(text[:cut]))
+					remainder = text[cut:]
+
+					if final:
+						# If the end of the file has been reached, then we break the loop
+
+						break
+
+			# Replacing the original file with the encrypted file (retaining the permissions of the original file)
+			copymode(self.filename, temporaryfile)
+			replace(temporaryfile, self.filename)
+		except Exception as e:
+			# If there are any errors encountered during the process, then we remove the temporary file and raise the error again
+
+			if path.isfile(temporaryfile):
+				remove(temporaryfile)
+			raise e
 
 		# Deleting some of the variables declared within this function
-		del text, key, contents
+		del key, kernel, descriptor, temporaryfile, decoder, remainder
 
 		# Returning 0 code (It will indicate that the function executed in success)
 		return 0
 
 	def decrypt(self):
-		""" This method / function serves the feature of decrypting the contents of the file. This function reads the filename location input stored in the class variable self.filename. """
+		""" This method / function serves the feature of decrypting the contents of the file. This function reads the filename location input stored in the class variable self.filename.
 
-		# Validating the password before decrypting
-		if self.checkpassword():
-			# If the password matches, then we continue
+		Just like the encrypt() method, the file is processed in fixed size chunks and the output is written to a temporary file which then replaces the original file. The format of the file (binary / legacy) is detected from its header. The file is opened only once, the header is read for the password check and the format, and then the cipher contents are decrypted from the same opened file. """
 
-			# Reading the contents of the file specified by the user
-			contents = open(self.filename, 'rb').read()
+		# Opening the file and reading its header (the password check and the format of the file)
+		with open(self.filename, 'rb') as reader:
+			match, header = CipherContainer(self.password).checkheader(reader)
 
-			# Removing the password part from the file
-			contents = contents.decode()
-			contents = ' '.join(contents.split('\n')[1:])
+			# Validating the password before decrypting
+			if match:
+				# If the password matches, then we continue
 
-			# Converting the base64 format text to plain text
-			contents = b64decode(contents.encode()).decode()
+				if header != None:
+					# If the file is in the binary format, then we continue to decrypt the file from the container format
 
-			# Generating the encryption key
-			key = self.generatekey()
+					return self.decryptbinary(reader, header[1])
 
-			# Converting the cipher text to plain text
-			text = ''
-			for character in contents:
-				# Iterating through each character
+				# Generating the encryption key
+				key = self.generatekey()
+				kernel = CipherKernel(key)
 
-				text += chr((ord(character) - key) % 256)
+				# Creating a temporary file in the same directory as the file specified by the user (the decrypted contents are first written here)
+				descriptor, temporaryfile = mkstemp(prefix = '.', suffix = '.decrypting', dir = path.dirname(path.abspath(self.filename)))
 
-			# Saving the decrypted content back to the file
-			open(self.filename, 'wb').write(text.encode())
+				try:
+					with reader, fdopen(descriptor, 'wb') as writer:
+						# The decoder keeps the incomplete multi-byte characters at the end of a chunk, and decodes them along with the next chunk
+						decoder = getincrementaldecoder('utf-8')()
 
-			# Deleting some of the variables declared within this function
-			del text, key, contents
+						# The base64 characters which are left over from the previous chunk (base64 decodes 4 characters at a time)
+						remainder = b''
+
+						while True:
+							# Reading the next chunk of the file specified by the user (also removing the line breaks and whitespaces if any)
+							chunk = reader.read(self.chunksize)
+							final = len(chunk) == 0
+							chunk = remainder + chunk.translate(None, b' \t\r\n')
+
+							# Converting the base64 format text to plain text (only the multiples of 4 characters are decoded, unless it is the last chunk)
+							if final:
+								# If the end of the file has been reached, then we decode all of the remaining characters
+
+								cut = len(chunk)
+							else:
+								# If the end of the file has not been reached yet, then we keep the trailing characters for the next chunk
+
+								cut = len(chunk) - (len(chunk) % 4)
+							contents = decoder.decode(b64decode(chunk[:cut]), final)
+							remainder = chunk[cut:]
+
+							# Converting the cipher text to plain text
+							text = kernel.decrypttext(contents)
+
+							# Saving the decrypted content to the temporary file
+							writer.write(text.encode())
+
+							if final:
+								# If the end of the file has been reached, then we break the loop
+
+								break
+
+					# Replacing the original file with the decrypted file (retaining the permissions of the original file)
+					copymode(self.filename, temporaryfile)
+					replace(temporaryfile, self.filename)
+				except Exception as e:
+					# If there are any errors encountered during the process, then we remove the temporary file and raise the error again
+
+					if path.isfile(temporaryfile):
+						remove(temporaryfile)
+					raise e
+
+				# Deleting some of the variables declared within this function
+				del key, kernel, descriptor, temporaryfile, decoder, remainder, reader, header
+
+				# Returning 0 code (It will indicate that the function executed in success)
+				return 0
+			else:
+				# If the password does not matches, then we display the error message on the console screen
+
+				print(f'[ Incorrect password ]')
+				return 403
+
+	def encryptbinary(self):
+		""" This method / function serves the functionality of encrypting the file in the binary format, i.e., the container format of the CipherContainer. The file is processed in fixed size chunks (self.chunksize bytes at a time), the raw bytes of each chunk are encrypted and written to a temporary file (after the header) which then replaces the original file. """
+
+		# Generating the encryption key
+		kernel = CipherKernel(self.generatekey())
+		length = path.getsize(self.filename)
+
+		# Creating a temporary file in the same directory as the file specified by the user (the encrypted contents are first written here)
+		descriptor, temporaryfile = mkstemp(prefix = '.', suffix = '.encrypting', dir = path.dirname(path.abspath(self.filename)))
+
+		try:
+			with open(self.filename, 'rb') as reader, fdopen(descriptor, 'wb') as writer:
+				# Writing the header of the container
+				writer.write(CipherContainer(self.password).makeheader(length))
+
+				# Encrypting the file chunk by chunk (only the length of the file noted in the header is read)
+				remaining = length
+				while remaining > 0:
+					chunk = reader.read(min(self.chunksize, remaining))
+					if len(chunk) == 0:
+						# If the file ended before the noted length (truncated during the process), then we raise an error with a custom message
+
+						raise EOFError(f'{self.filename} was truncated during the encryption.')
+					writer.write(kernel.encrypt(chunk))
+					remaining -= len(chunk)
+
+			# Replacing the original file with the encrypted file (retaining the permissions of the original file)
+			copymode(self.filename, temporaryfile)
+			replace(temporaryfile, self.filename)
+		except Exception as e:
+			# If there are any errors encountered during the process, then we remove the temporary file and raise the error again
+
+			if path.isfile(temporaryfile):
+				remove(temporaryfile)
+			raise e
+
+		# Deleting some of the variables declared within this function
+		del kernel, length, descriptor, temporaryfile, remaining
+
+		# Returning 0 code (It will indicate that the function executed in success)
+		return 0
+
+	def decryptbinary(self, reader, length):
+		""" This method / function serves the functionality of decrypting the file in the binary format, i.e., the container format of the CipherContainer. The opened file positioned right after the header (the parameter reader) and the length of the plain contents (from the header, the parameter length) are passed to this function. The cipher bytes are processed in fixed size chunks and written to a temporary file which then replaces the original file. The opened file is closed by this function. """
+
+		# Validating the length stored in the header against the size of the file
+		container = CipherContainer()
+		if path.getsize(self.filename) != container.headersize + length:
+			# If the size of the file does not match with the length in the header, then the file is truncated / corrupted and we display the error message on the console screen
+
+			reader.close()
+			print(f'[ Error : The encrypted file is corrupted. Expected {length} bytes after the header. ]')
+			return 1
+
+		# Generating the encryption key
+		kernel = CipherKernel(self.generatekey())
+
+		# Creating a temporary file in the same directory as the file specified by the user (the decrypted contents are first written here)
+		descriptor, temporaryfile = mkstemp(prefix = '.', suffix = '.decrypting', dir = path.dirname(path.abspath(self.filename)))
+
+		try:
+			with reader, fdopen(descriptor, 'wb') as writer:
+				# Decrypting the file chunk by chunk (continuing from the end of the header)
+				for chunk in iter(lambda : reader.read(self.chunksize), b''):
+					writer.write(kernel.decrypt(chunk))
+
+			# Replacing the original file with the decrypted file (retaining the permissions of the original file)
+			copymode(self.filename, temporaryfile)
+			replace(temporaryfile, self.filename)
+		except Exception as e:
+			# If there are any errors encountered during the process, then we remove the temporary file and raise the error again
+
+			if path.isfile(temporaryfile):
+				remove(temporaryfile)
+			raise e
+
+		# Deleting some of the variables declared within this function
+		del kernel, container, descriptor, temporaryfile
+
+		# Returning 0 code (It will indicate that the function executed in success)
+		return 0
+
+	def runbatch(self, task):
+		""" This method / function serves the functionality of encrypting / decrypting (the parameter task) all of the files matching the glob pattern stored in the class variable self.pattern. The result of each file is displayed as soon as it completes, and a summary of the files processed, the bytes processed, the throughput (MB/s) and the failures is displayed at the end.
+
+		The function returns 0 if all of the files are processed successfully, otherwise 1 is returned. """
+
+		# Printing the batch message on the console screen
+		print(f'\n[ {task.capitalize()}ing the files matching {self.pattern} ]\n')
+
+		started = monotonic()
+		processed = 0
+		size = 0
+		failures = []
+		for file, length, error in self.batchjobs(task):
+			# Iterating over the result of each file
+
+			if error == None:
+				# If there are no errors encountered during the process, then we count the file and display the success message on the console screen
+
+				processed += 1
+				size += length
+				print(f'[$] {task.capitalize()}ed : {file}')
+			else:
+				# If there are any errors encountered during the process, then we note down the failure and display the error message on the console screen
+
+				failures.append((file, error))
+				print(f'[!] Failed : {file} ({error})')
+		elapsed = max(monotonic() - started, 0.000001)
+
+		# Checking whether the pattern matched any file
+		if processed == 0 and len(failures) == 0:
+			# If the pattern did not match any file, then we display the error on the console screen
+
+			print(f'[ Error : No files matched the glob pattern "{self.pattern}". ]')
+			return 1
+
+		# Displaying the summary of the batch on the console screen
+		print(f'\n[ Summary ]')
+		print(f'[#] Files processed : {processed}')
+		print(f'[#] Bytes processed : {size} ({size / 1048576:.2f} MB)')
+		print(f'[#] Time taken : {elapsed:.2f} seconds ({size / 1048576 / elapsed:.2f} MB/s)')
+		print(f'[#] Failures : {len(failures)}')
+		for file, error in failures:
+			print(f'    {file} : {error}')
+
+		if len(failures) == 0:
+			# If there are no failures, then we return 0
 
-			# Returning 0 code (It will indicate that the function executed in success)
 			return 0
 		else:
-			# If the password does not matches, then we display the error message on the console screen
+			# If there are any failures, then we return 1
 
-			print(f'[ Incorrect password ]')
-			return 403
+			return 1
+
+	def batchjobs(self, task):
+		""" This method / function serves the functionality of running the encryption / decryption (the parameter task) of each file matching the glob pattern stored in the class variable self.pattern. The pattern is expanded lazily using iglob(). If the number of jobs specified in the class variable self.jobs is more than 1, then the files are processed in parallel by a pool of that many processes (with at most 4 files per process queued at a time, so that the pattern is never expanded all at once). Otherwise, the files are processed one by one in the current process.
+
+		The function yields the result of each file (see the processfile() method) in the order in which they are completed. """
+
+		# Expanding the glob pattern lazily (only the files are taken, the directories are skipped)
+		files = (file for file in iglob(self.pattern, recursive = True) if path.isfile(file))
+
+		if self.jobs > 1:
+			# If more than 1 jobs are specified, then we continue to distribute the files among a pool of processes
+
+			with ProcessPoolExecutor(max_workers = self.jobs) as executor:
+				pending = set()
+				for file in files:
+					# Queueing the file to the pool
+					pending.add(executor.submit(FileEncrypter.processfile, file, self.password, task, self.format))
+
+					if len(pending) >= self.jobs * 4:
+						# If enough files are queued, then we wait for atleast one of them to complete before queueing more
+
+						done, pending = wait(pending, return_when = FIRST_COMPLETED)
+						for future in done:
+							yield future.result()
+
+				# Waiting for the remaining files to complete
+				while len(pending) > 0:
+					done, pending = wait(pending, return_when = FIRST_COMPLETED)
+					for future in done:
+						yield future.result()
+		else:
+			# If only 1 job is specified, then we continue to process the files one by one
+
+			for file in files:
+				yield FileEncrypter.processfile(file, self.password, task, self.format)
+
+	@staticmethod
+	def processfile(filename, password, task, format):
+		""" This method / function serves the functionality of encrypting / decrypting (the parameter task) a single file of the batch mode, with the password and the format specified. The function is defined as a static method, so that it can also be executed in the worker processes when the files are processed in parallel.
+
+		The function returns a tuple (filename, size, error). If the file is processed successfully then the error is None and the size is the size of the file before processing (in bytes), otherwise the size is 0 and the error contains the error message. """
+
+		try:
+			size = path.getsize(filename)
+			encrypter = FileEncrypter(filename = filename, password = password, format = format)
+			if task == 'encrypt':
+				# If the task is to encrypt, then we encrypt the file
+
+				code = encrypter.encrypt()
+			else:
+				# If the task is to decrypt, then we decrypt the file
+
+				code = encrypter.decrypt()
+		except Exception as e:
+			# If there are any errors encountered during the process, then we return the error message
+
+			return (filename, 0, str(e))
+
+		if code == 0:
+			# If the file is processed successfully, then we return the size of the file
+
+			return (filename, size, None)
+		elif code == 403:
+			# If the password does not match, then we return the error message
+
+			return (filename, 0, 'Incorrect password')
+		else:
+			# If the file failed to process for any other reasons, then we return the error message
+
+			return (filename, 0, f'Failed with the code {code}')
 
 class ImageEncrypter:
 	""" This class serves the functionality of encryption and decryption of image files (JPG and PNG). The encryption is aided with a password, which is required whenever we want to encrypt / decrypt the file.
@@ -587,6 +1120,7 @@ class ImageEncrypter:
 		--file            Used to specify the image file
 		--password        Used to specify the password for encryption / decryption
 		--task            Used to specify the task whether encryption / decryption
+		--format          Used to specify the format of the encrypted file, either binary (default) or legacy
 
 		The image file name should be proper and valid. Below are some points listed for the input of the file parameter :
 		* If there are whitespaces within the filename, then use the whitespace escape sequence '\ ' in order to make sure the filename is properly accepted into the class object.
@@ -597,6 +1131,7 @@ class ImageEncrypter:
 		Example and syntax of the command is shown below.
 
 		encrypt image --password somehardpassword123 --file /location/to/image.jpg --task encrypt
+		encrypt image --password somehardpassword123 --file /location/to/image.jpg --task encrypt --format legacy
 		encrypt image --password somehardpassword123 --file /location/to/image.jpg --task decrypt
 
 	2. Directly from specified parameters
@@ -606,6 +1141,7 @@ class ImageEncrypter:
 		ImageEncrypter(
 			filename = '/location/to/image.jpg',
 			password = 'somehardpassword123',
+			format = 'binary',
 		)
 
 		Here, there are no needs to use the whitespace escape sequence in order to input the filenames with whitespaces.
@@ -614,15 +1150,23 @@ class ImageEncrypter:
 	1. This class / tool uses the same encryption algorithm as used by the basic StringEncrypter.
 	2. This class before decrypting the file, verifies the user entered password for encryption-decryption. If the password matches, then the process to decrypt the file. If the password does not matches, then an error message is displayed on the console screen.
 	3. The size of the image file will get a little increased after the encryption as well as the image would be unviewable graphically due to encrypted bytes.
+	4. In the binary format (default), the image file is memory mapped and encrypted chunk by chunk into a pre-sized output file, written in the container format of the CipherContainer (a 30 bytes header followed by the encrypted bytes of the image). In the legacy format, the image is base64 encoded, encrypted character by character and base64 encoded again (about 1.8x the size of the image), with the MD5 hash of the password in the first line. The decryption detects the format from the header, thus both the formats can be decrypted.
 	"""
 
-	def __init__(self,filename = None, password = None, arguments = None):
+	def __init__(self,filename = None, password = None, format = 'binary', arguments = None):
+		# Setting some class properties
+		# ----
+		# The size (in bytes) of the chunks in which the memory mapped image file is encrypted / decrypted
+		self.chunksize = 1048576
+		# ----
+
 		# Checking if arguments provided or just the parameters directly
 		if arguments == None:
 			# If the arguments are not passed to this function by the user, then we continue to use the default provided values
 
 			self.filename = filename
 			self.password = password
+			self.format = format
 		else:
 			# If the arguments are passed to this function by the user, then we continue to parse the arguments
 
@@ -631,6 +1175,7 @@ class ImageEncrypter:
 			# Setting the default value of the variables to None
 			self.filename = None
 			self.password = None
+			self.format = 'binary'
 			self.task = None
 			self.documentation = False  # Setting the documentation flag class variable to False by default
 
@@ -668,6 +1213,16 @@ class ImageEncrypter:
 
 						continue
 
+				if argument == '--format':
+					# If the argument is for specifying the format of the encrypted file, then we continue to parse the next argument as the entered value
+
+					try:
+						self.format = arguments[index + 1].lower()
+					except IndexError:
+						# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
+
+						continue
+
 				if argument == '--help':
 					# If the argument is for specifying the help, then we continue to mark the documentation mode to be true
 
@@ -678,7 +1233,7 @@ class ImageEncrypter:
 			if self.documentation:
 				# If the user specified the documentation mode, then we continue to display the help text on the console screen
 
-				print('encrypt image\nUsage : encrypt image <arguments>\n\n"encrypt image" is a tool which serves the functionality of encryption and decryption of image files (JPG and PNG). The encryption is done using a password, also the same password will be required for the decryption of the file. This tool uses the same encryption algorithm as used by the rest of the encryption tools. This tool also provides the feature of checking the passwords before decryption.\n\nArguments are :\n--file            Used to specify the image file\n--password        Used to specify the password for encryption / decryption\n--task            Used to specify the task whether encryption / decryption\n--help            Used to display this help text\n\nThe image file name should be proper and valid. Below are some points listed for the input of the file parameter :\n* If there are whitespaces within the filename, then use the whitespace escape sequence \'\\ \' in order to make sure the filename is properly accepted into the class object.\n* The file should exists on the local machine as well as proper permission for the current user.\n\nCheck out the docs for more info.')
+				print('encrypt image\nUsage : encrypt image <arguments>\n\n"encrypt image" is a tool which serves the functionality of encryption and decryption of image files (JPG and PNG). The encryption is done using a password, also the same password will be required for the decryption of the file. This tool uses the same encryption algorithm as used by the rest of the encryption tools. This tool also provides the feature of checking the passwords before decryption.\n\nArguments are :\n--file            Used to specify the image file\n--password        Used to specify the password for encryption / decryption\n--task            Used to specify the task whether encryption / decryption\n--format          Used to specify the format of the encrypted file, either binary (default) or legacy\n--help            Used to display this help text\n\nThe image file name should be proper and valid. Below are some points listed for the input of the file parameter :\n* If there are whitespaces within the filename, then use the whitespace escape sequence \'\\ \' in order to make sure the filename is properly accepted into the class object.\n* The file should exists on the local machine as well as proper permission for the current user.\n\nCheck out the docs for more info.')
 			else:
 				# If the user specified the execution mode, then we continue to execute the task
 
@@ -738,6 +1293,12 @@ class ImageEncrypter:
 						# If the password parameter input specified by the user is not of str type, then we raise an error on the console screen
 
 						raise TypeError('Password invalid. Password parameter should be in str format.')
+
+				# Validating the format parameter entered by the user
+				if self.format != 'binary' and self.format != 'legacy':
+					# If the format specified by the user is neither binary nor legacy, then we raise an error with a custom message
+
+					raise ValueError('Format not recognized. Binary / legacy are the two recognizable formats.')
 				# ----
 
 				# Checking the task specified and then continuing to execute the task
@@ -808,21 +1369,22 @@ class ImageEncrypter:
 		# Returning the generating key
 		return key
 
-	def checkpassword(self):
+	def checkpassword(self, descriptor = None):
 		""" This method / function serves the functionality of checking the user entered password against the original password stored in the image file. This function uses the value of password from the class variable self.password.
 
-		When a image file is encrypted, the original password is also saved along with the encrypted contents of the image file. Thus, we can verify the password of the file before decrypting the file. The function returns True if the password matches, and returns False if the password does not matches. """
+		When a image file is encrypted, the original password is also saved along with the encrypted contents of the image file (the MD5 hash in the header of the binary format, or in the first line of the legacy format). Thus, we can verify the password of the file before decrypting the file. Only the header of the file is read (see the CipherContainer.checkheader() method). If an already opened file is passed (the parameter descriptor), then the header is read from it, otherwise the file is opened here. The function returns True if the password matches, and returns False if the password does not matches. """
 
-		# Reading the contents of the image file
-		contents = open(self.filename, 'rb').read()
-		contents = contents.decode()
+		if descriptor == None:
+			# If the opened file is not specified, then we open the file for reading the header
+
+			match = CipherContainer(self.password).checkfile(self.filename)
+		else:
+			# If the opened file is specified, then we read the header from it
 
-		# Reading the password stored in the first line
-		password = contents.split('\n')[0]
-		del contents
+			match = CipherContainer(self.password).checkheader(descriptor)[0]
 
 		# Checking the user entered password against the original password stored in the file
-		if hashlib.md5(self.password.encode()).hexdigest() == password:
+		if match:
 			# If the hashes of user entered password and the original password matches, then we return True
 
 			return True
@@ -832,7 +1394,12 @@ class ImageEncrypter:
 			return False
 
 	def encrypt(self):
-		""" This method / function serves the feature of encrypting the contents of the image file. This function reads the filename location input stored in the class variable self.filename. """
+		""" This method / function serves the feature of encrypting the contents of the image file. This function reads the filename location input stored in the class variable self.filename. The format of the encrypted file is chosen as per the class variable self.format (binary / legacy). """
+
+		if self.format == 'binary':
+			# If the binary format is specified, then we continue to encrypt the image file using the memory mapping
+
+			return self.encryptbinary()
 
 		# Reading the contents of the image file specified by the user
 		contents = open(self.filename, 'rb').read()
@@ -842,11 +1409,7 @@ class ImageEncrypter:
 		key = self.generatekey()
 
 		# Converting the plain text to cipher text
-		text = ''
-		for character in contents:
-			# Iterating through each character
-
-			text += chr((ord(character) + key) % 256)
+		text = CipherKernel(key).encrypttext(contents)
 
 		# Changing the encoding of the content to base64 format
 		text = b64encode(text.encode()).decode()
@@ -864,41 +1427,43 @@ class ImageEncrypter:
 		return 0
 
 	def decrypt(self):
-		""" This method / function serves the feature of decrypting the contents of the image file. This function reads the filename location input stored in the class variable self.filename. """
+		""" This method / function serves the feature of decrypting the contents of the image file. This function reads the filename location input stored in the class variable self.filename. The image file is opened only once, the header is read for the password check and the format, and then the cipher contents are decrypted from the same opened file. """
 
-		# Validating the password before decrypting
-		if self.checkpassword():
-			# If the password matches, then we continue
+		# Opening the image file and reading its header (the password check and the format of the file)
+		with open(self.filename, 'rb') as reader:
+			match, header = CipherContainer(self.password).checkheader(reader)
+			if match and header != None:
+				# If the password matches and the image file is in the binary format, then we continue to decrypt the image file using the memory mapping
 
-			# Reading the contents of the image file specified by the user
-			contents = open(self.filename, 'rb').read()
+				return self.decryptbinary(reader, header[1])
+			elif match:
+				# If the password matches and the image file is in the legacy format, then we read the rest of the contents of the image file (the password part is already read)
 
-			# Removing the password part from the file
-			contents = contents.decode()
-			contents = ' '.join(contents.split('\n')[1:])
+				contents = reader.read()
+
+		# Validating the password before decrypting
+		if match:
+			# If the password matches, then we continue
 
-			# Converting the base64 format text to plain text
-			contents = b64decode(contents.encode()).decode()
+			# Converting the base64 format text to plain text (the line breaks are discarded while decoding)
+			contents = b64decode(contents).decode()
 
 			# Generating the encryption key
 			key = self.generatekey()
 
 			# Converting the cipher text to plain text
-			text = ''
-			for character in contents:
-				# Iterating through each character
-
-				text += chr((ord(character) - key) % 256)
+			text = CipherKernel(key).decrypttext(contents)
 
 			# Converting the contents to image file content type
 			text = text.encode()
 			text = decodebytes(text)
 
-			# Saving the decrypted content back to the image file
-			open(self.filename, 'wb').write(text)
+			# Saving the decrypted content back to the image file (the image file is already closed)
+			with open(self.filename, 'wb') as writer:
+				writer.write(text)
 
 			# Deleting some of the variables declared within this function
-			del text, key, contents
+			del text, key, contents, reader, header
 
 			# Returning 0 code (It will indicate that the function executed in success)
 			return 0
@@ -908,155 +1473,158 @@ class ImageEncrypter:
 			print(f'[ Incorrect password ]')
 			return 403
 
-class VideoEncrypter:
-	""" """
+	def encryptbinary(self):
+		""" This method / function serves the functionality of encrypting the image file in the binary format. The image file is memory mapped (thus it is not read into the memory at once), and encrypted chunk by chunk directly into a pre-sized temporary output file (header + encrypted bytes). The temporary file is then moved in place of the image file. """
 
-	def __init__(self):
-		pass
+		# Creating the cipher kernel for the key
+		kernel = CipherKernel(self.generatekey())
+		container = CipherContainer(self.password)
+		length = path.getsize(self.filename)
 
-	def generatekey(self):
-		pass
+		# Creating the temporary output file in the same directory (so that it can be moved in place of the image file)
+		descriptor, temporary = mkstemp(dir = path.dirname(path.abspath(self.filename)), prefix = '.', suffix = '.encrypting')
+		try:
+			with fdopen(descriptor, 'w+b') as output, open(self.filename, 'rb') as source:
+				# Writing the header and pre-sizing the output file
+				output.write(container.makeheader(length))
+				output.truncate(container.headersize + length)
+				output.flush()
+
+				# Encrypting the image file chunk by chunk (an empty file can not be memory mapped, thus it is skipped)
+				if length > 0:
+					with mmap(source.fileno(), 0, access = ACCESS_READ) as inputmap, mmap(output.fileno(), 0) as outputmap:
+						for start in range(0, length, self.chunksize):
+							end = min(length, start + self.chunksize)
+							outputmap[container.headersize + start:container.headersize + end] = kernel.encrypt(inputmap[start:end])
+						outputmap.flush()
+
+			# Moving the encrypted file in place of the image file
+			copymode(self.filename, temporary)
+			replace(temporary, self.filename)
+		except BaseException:
+			# If there are any errors encountered during the process (or the process is interrupted), then we remove the temporary file and raise the error again
+
+			if path.isfile(temporary):
+				remove(temporary)
+			raise
 
-	def checkpassword(self):
-		pass
+		# Deleting some of the variables declared within this function
+		del kernel, container, length, descriptor, temporary
 
-	def encrypt(self):
-		pass
+		# Returning 0 code (It will indicate that the function executed in success)
+		return 0
 
-	def decrypt(self):
-		pass
+	def decryptbinary(self, source, length):
+		""" This method / function serves the functionality of decrypting the image file in the binary format. The opened encrypted file (the parameter source) and the length of the image (from the header, the parameter length) are passed to this function. The encrypted file is memory mapped, and decrypted chunk by chunk directly into a pre-sized temporary output file. The temporary file is then moved in place of the encrypted file. The opened file is closed by this function. """
 
-class DirectoryEncrypter:
-	"""
-	This class serves the funcionality of encryption / decryption of user specified directory. The process of encryption is done using the user specified password. The same password which was used for encryption is used for decryption as well. The encryption algorithm used by this class is close to same as other encryption classes defined in this module file.
+		# Validating the length of the image stored in the header against the size of the file
+		container = CipherContainer()
+		if path.getsize(self.filename) != container.headersize + length:
+			# If the size of the file does not match with the length in the header, then the file is truncated / corrupted and we display the error message on the console screen
 
-	The encryption process here is a bit long and more organised. Each files of the user specified directory are encrypted one by one. Also, there are options for ignoring specific files during the encryption / decryption. The structure and information related to the encryption of a directory are stored in a config file in the user specified directory. The file is named '.encryption_config'.
+			source.close()
+			print(f'[ Error : The encrypted image file is corrupted. Expected {length} bytes after the header. ]')
+			return 1
 
-	The structure of the config file is shown below.
-	{
-		"password" : "...",
-		"ignorefiles" : [],
-		"created_on" : ...,
-		"last_modified" : ...,
-	}
+		# Creating the cipher kernel for the key
+		kernel = CipherKernel(self.generatekey())
 
-	The config file stores the password hash, thus when the user decrypts the directory, the password verification process is done. The user entered password is verified against the original password hash stored in the config file. There are also information stored there like, date of creation, last modfiied, etc.
+		# Creating the temporary output file in the same directory (so that it can be moved in place of the encrypted file)
+		descriptor, temporary = mkstemp(dir = path.dirname(path.abspath(self.filename)), prefix = '.', suffix = '.decrypting')
+		try:
+			with fdopen(descriptor, 'w+b') as output, source:
+				# Pre-sizing the output file
+				output.truncate(length)
+
+				# Decrypting the image file chunk by chunk (an empty file can not be memory mapped, thus it is skipped)
+				if length > 0:
+					with mmap(source.fileno(), 0, access = ACCESS_READ) as inputmap, mmap(output.fileno(), 0) as outputmap:
+						for start in range(0, length, self.chunksize):
+							end = min(length, start + self.chunksize)
+							outputmap[start:end] = kernel.decrypt(inputmap[container.headersize + start:container.headersize + end])
+						outputmap.flush()
+
+			# Moving the decrypted file in place of the encrypted file
+			copymode(self.filename, temporary)
+			replace(temporary, self.filename)
+		except BaseException:
+			# If there are any errors encountered during the process (or the process is interrupted), then we remove the temporary file and raise the error again
+
+			if path.isfile(temporary):
+				remove(temporary)
+			raise
 
-	The class object when created, some of the information are required to be entered by the user. There are two ways of entering the information by the user. The ways are listed below.
+		# Deleting some of the variables declared within this function
+		del kernel, container, descriptor, temporary
 
-	1. Via argument tokens
+		# Returning 0 code (It will indicate that the function executed in success)
+		return 0
 
-		In this mode,
-		The argument tokens entered by the user at the shell (command line) are passed to this class object at the 'arguments' parameters. The syntax is shown below.
+class VideoEncrypter:
+	""" This class serves the functionality of encryption and decryption of video files (also other large media files, of even multiple GBs). The encryption is aided with a password, which is required whenever we want to encrypt / decrypt the file.
 
-		DirectoryEncrypter(arguments = [<argument-list>])
+	This class object takes input from the user in two ways :
+	1. Parsing the argument tokens
 
-		The arguments that are recognized by this class / tool are listed below.
-		--password            Used to specify the password for the encryption / decryption
-		--directory           Used to specify the directory for the encryption / decryption
-		--task                Used to specify whether to encrypt / decrypt
-		--ignore              Used to launch the ignore files mode (the user can mention the files to ignore)
-		--help                Used to launch the documentation mode (the help section is displayed on the console screen)
+		In this mode, the user entered arguments at the shell / terminal are passed to this class object at the parameter 'arguments'. The arguments that are parsed are listed below.
 
-		If there are any whitespaces in the inputs, then use the backslash (\). Below are some examples for the usage of this tool.
+		--file            Used to specify the video file
+		--password        Used to specify the password for encryption / decryption
+		--task            Used to specify the task whether encryption / decryption
 
-		# Command for encryption of a directory with password 'somehardpassword123'
-		encrypt directory --directory /location/to/directory --password somehardpassword123 --task encrypt
+		The video file name should be proper and valid. Below are some points listed for the input of the file parameter :
+		* If there are whitespaces within the filename, then use the whitespace escape sequence '\ ' in order to make sure the filename is properly accepted into the class object.
+		* The video file should exists on the local machine as well as proper permission for the current user.
 
-		# Command for decryption of a directory with password 'somehardpassword123'
-		encrypt directory --directory /location/to/directory --password somehardpassword123 --task decrypt
+		There is also another flag for documentation mode (printing the help section text for the class object / tool). The flag / argument is --help.
 
-		# Command for encryption of a directory + ignoring some specific files
-		encrypt directory --directory /location/to/directory --password somehardpassword123 --task encrypt --ignore
+		Example and syntax of the command is shown below.
 
-		# Command for displaying the help section for the tool
-		encrypt directory --help
+		encrypt video --password somehardpassword123 --file /location/to/video.mp4 --task encrypt
+		encrypt video --password somehardpassword123 --file /location/to/video.mp4 --task decrypt
 
-	2. Directly passing parameters
+	2. Directly from specified parameters
 
-		In this mode,
-		The parameters are passed directly into the class object. The syntax for the usage is listed below.
+		In this mode, the user enters the parameters directly into the class object. Example as well as syntax is shown below.
 
-		DirectoryEncrypter(
-			directory = '/location/to/directory',
-			password = '<password>',
+		VideoEncrypter(
+			filename = '/location/to/video.mp4',
+			password = 'somehardpassword123',
 		)
 
-		There are two parameters to be specified when launching the class object / declaring the class object. The parameters are : directory, password.
-		The 'directory' parameter is used to specify the location of the directory which is needed to be encrypted / decrypted.
-		The 'password' parameter is used to specify the password for the encryption / decryption.
-
-		Further processes are listed below in the form of examples.
-
-		# Declaring the class object
-		enc = DirectoryEncrypter(directory = '/location/to/directory', password = 'somehardpassword123')
-
-		# Specifying the ignorefiles (The files to be ignored while encryption / decryption)
-		enc.ignorefiles = ['filename1.txt', 'filename2.docx', 'filename3.jpeg']
-
-		# Encrypting the directory
-		enc.encrypt()
-
-		# Checking the password before decryption
-		enc.check(password = True)
-
-		# Checking the complete configuration of the encrypted directory before decrypting
-		enc.check(all = True)
-
-		# Decrypting the encrypted directory
-		enc.decrypt()
-
-	Some of the points to be noted about this class are listed below :
-	* The sub-folders in the specified directory are skipped, just the files are encrypted.
-
-	* The complete process of encryption and decryption might have some flaws. There might occur some errors related to key generation, discontinuity, etc, that could lead to serious loss of the data.
-
-	* Security is not ensured by us. If there are situations like the data is completly corrupted during the process, then the authors are not responsible for the loss of the data. The authors are responsible for the bugs, not the mistakes commited by the users / clients. Thus, use this tool / class object safely and with your own risk.
-
-	* For any bugs and errors, kindly create an issue on the github mirror of this repository or contact the author of this module file (Contact address / email addres listed at the top of the document).
-
-	CUSTOM CONFIG
-
-	This class also accepts custom configuration from the user. Using the --use-config flag while launching the command for this, we command this tool to use a custom config file that too is specified by the user. Before encryption / decryption, we then ask the user for entering custom config in two different ways. The ways are listed below.
-	1. .encryption_config at the directory
-
-		In this mode, if there exists a file named '.encryption_config' already present in the user specified directory. Then, the tool loads the config file information from that file only. If the user wants to load information from any other way then there must not exists any file in that directory. This file is loaded in the same way the default config file is loaded in this tool (class object).
-
-	2. Custom config file location
-
-		In this mode, the user is asked to enter the file location which directs the tool to a file which contains the contents of the configuration of the encrypted directory. The file that the user will specify should have proper read permissions and the contents should be valid.
-
-	3. Custom config hash
-
-		In this mode, the user is asked to enter the hash code of the config file. Entering the complete string will be used to extract the configuration of the encrypted directory. The hash code looks something like this, as shown below.
-
-		eyJwYXNzd29yZCI6ICJiOGU5NDZlNmY2NWU3M2Q1MDlkMzlkNzBkOTYzZWNlMyIsICJpZ25vcmVmaWxlcyI6IFsidGVzdDEucG5nIiwgInRlc3QzLmJmIiwgInRlc3QyLnR4dCIsICJ0ZXN0NC5weSJdLCAiY3JlYXRlZF9vbiI6IDE2MjQzMzIxNDMuMDcyNTMzLCAibGFzdF9tb2RpZmllZCI6IDAuMH0=
+		Here, there are no needs to use the whitespace escape sequence in order to input the filenames with whitespaces.
 
-	This custom config feature might be a little different and odd, below are some points that will explain how it makes a difference.
-	1. Even if we specify a custom config file, we still have to specify the password for encryption and decryption.
-	2. The configuration for an encrypted directory stores other properties like ignorefiles, etc. The ignorefiles property is a list of files that are to be ignored during the encryption and decryption process.
+	There are some points to be noted about this class :
+	1. This class / tool uses the same encryption algorithm as used by the basic StringEncrypter, and the container format of the CipherContainer (a 30 bytes header followed by the encrypted bytes of the file).
+	2. The file is streamed in fixed size chunks, thus the memory usage remains constant irrespective of the size of the file. The progress and the throughput (MB/s) of the process is displayed on the console screen.
+	3. The output is written to '<file>.partial', and the number of bytes processed so far is regularly saved to '<file>.checkpoint'. If the process is interrupted, then running the same command again resumes from the last checkpoint instead of starting over. The original file is left untouched until the process completes, after which the partial file is moved in place of the original file.
+	4. This class before decrypting the file, verifies the user entered password for encryption-decryption. If the password matches, then the process to decrypt the file. If the password does not matches, then an error message is displayed on the console screen.
 	"""
 
-	def __init__(self, directory = None, password = None, useconfig = False, arguments = None):
+	def __init__(self, filename = None, password = None, arguments = None):
+		# Setting some class properties
+		# ----
+		# The size (in bytes) of the chunks in which the file is streamed, and the number of bytes after which the checkpoint is saved
+		self.chunksize = 4194304
+		self.checkpointsize = 67108864
+		# ----
+
 		# Checking if arguments provided or just the parameters directly
 		if arguments == None:
 			# If the arguments are not passed to this function by the user, then we continue to use the default provided values
 
-			self.directory = directory
+			self.filename = filename
 			self.password = password
-			self.useconfig = useconfig
 		else:
 			# If the arguments are passed to this function by the user, then we continue to parse the arguments
 
 			# Parsing the arguments entered to this function
 			# ----
 			# Setting the default value of the variables to None
-			self.directory = None
+			self.filename = None
 			self.password = None
-			self.ignore = False
-			self.useconfig = False
-			self.documentation = False
 			self.task = None
+			self.documentation = False  # Setting the documentation flag class variable to False by default
 
 			# Iterating through each argument to filter out the values
 			for index, argument in enumerate(arguments):
@@ -1072,11 +1640,11 @@ class DirectoryEncrypter:
 
 						continue
 
-				if argument == '--directory':
-					# If the argument is for specifying the directory for encryption, then we continue to parse the next argument as the entered value
+				if argument == '--file':
+					# If the argument is for specifying the file, then we continue to parse the next argument as the entered value
 
 					try:
-						self.directory = arguments[index + 1]
+						self.filename = arguments[index + 1]
 					except IndexError:
 						# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
 
@@ -1092,16 +1660,6 @@ class DirectoryEncrypter:
 
 						continue
 
-				if argument == '--ignore':
-					# If the argument is for specifying the ignore flag, then we continue to mark the ignore mode to true in order to ask the user for the files to be ignored
-
-					self.ignore = True
-
-				if argument == '--use-config':
-					# If the argument is for specifying the use-config flag, then we continue to mark the useconfig mode to true in order to further fetch the information from the configuration file
-
-					self.useconfig = True
-
 				if argument == '--help':
 					# If the argument is for specifying the help, then we continue to mark the documentation mode to be true
 
@@ -1112,54 +1670,59 @@ class DirectoryEncrypter:
 			if self.documentation:
 				# If the user specified the documentation mode, then we continue to display the help text on the console screen
 
-				print('encrypt directory\nUsage : encrypt <arguments>\n\n"encrypt directory" is a tool which serves the functionality of encryption / decryption of user specified directories. This tool encrypts an entire directory with a password. There are also features like ignoring certain files while encryption / decryption process. All such properties of the encryption are stored in the config file (.encryption_config). This file is necessary for the proper decryption of an already encrytped directory.\n\nArguments are :\n--password            Used to specify the password for encryption / decryption\n--directory  Used to specify the directory for encryption / decryption\n--task  Used to specify whether to encrypt / decrypt\n--ignore \t\t\t  Used to specify certain files to ignore when encrypting\n--use-config  Used to specify a custom config for the encryption / decryption\n--help(\t\t\t  Used to display this help text\n\nPoints to be noted :\n1. The sub-folders in the specified directory are skipped, just the files are encrypted.\n2. The complete process of encryption and decryption might have some flaws. There might occur some errors related to key generation, discontinuity, etc, that could lead to serious loss of the data.\n3. Security is not ensured by us. If there are situations like the data is completly corrupted during the process, then the authors are not responsible for the loss of the data. The authors are responsible for the bugs, not the mistakes commited by the users / clients. Thus, use this tool / class object safely and with your own risks.\n\nCheck out the docs for more info.')
+				print('encrypt video\nUsage : encrypt video <arguments>\n\n"encrypt video" is a tool which serves the functionality of encryption and decryption of video files (also other large media files). The encryption is done using a password, also the same password will be required for the decryption of the file. The file is processed in fixed size chunks, thus even the files of multiple GBs can be encrypted with a constant memory usage. If the process is interrupted, then running the same command again resumes it from the last checkpoint.\n\nArguments are :\n--file            Used to specify the video file\n--password        Used to specify the password for encryption / decryption\n--task            Used to specify the task whether encryption / decryption\n--help            Used to display this help text\n\nThe video file name should be proper and valid. Below are some points listed for the input of the file parameter :\n* If there are whitespaces within the filename, then use the whitespace escape sequence \'\\ \' in order to make sure the filename is properly accepted into the class object.\n* The file should exists on the local machine as well as proper permission for the current user.\n\nCheck out the docs for more info.')
 			else:
 				# If the user specified the execution mode, then we continue to execute the task
 
-				# Validating the user entered directory location
+				# Validating the user entered parameters
 				# ----
-				# Checking the directory location input type
-				if type(self.directory) == str:
-					# If the directory's value as per entered by the user is a string type variable, then we continue for further validation
+				# Validating the filename parameter input (The name / location of the file that is to be encrypted using this tool)
+				if self.filename == None:
+					# If the filename parameter is not specified by the user (default), then we raise an error with a custom message
 
-					# Checking whether the directory exists or not
-					if path.isdir(self.directory):
-						# If the user specified directory exists in the local machine, then we continue for further validation
+					raise SyntaxError('Video file name not specified.')
+				else:
+					# If the filename parameter is specified by the user, then we continue for further validation
 
-						# Adding a / at the end of the directory location (path) if not present
-						if self.directory[len(self.directory)-1] != '/':
-							# If the '/' is not present at the end of the directory location (path), then we continue to add it
+					if type(self.filename) == str:
+						# If the filename parameter input specified by the user is of str type, then we continue
 
-							self.directory += '/'
+						if path.isfile(self.filename):
+							# If the file specified by the user does exists, then we continue
+
+							pass
+						else:
+							# If the file specified by the user does not exists, then we raise an error with a custom message
+
+							raise FileNotFoundError('Specified video file does not exists.')
 					else:
-						# If the user specified directory does not exists in the local machine, then we raise an error with a custom message
+						# If the filename parameter input specified by the user is not of str type, then we raise an error on the console screen
 
-						raise ValueError(f'No such directory found "{self.directory}".')
+						raise TypeError('Video file name parameter should be in str format.')
+
+				# Validating the password parameter entered by the user
+				if self.password == None:
+					# If the password parameter is not specified by the user (default), then we raise an error with a custom message
+
+					raise SyntaxError('Password not specified.')
 				else:
-					# If the user entered directory's value is a non string variable, then we raise an error with a custom message
+					# If the password parameter is specified by the user, then we continue for further validation
 
-					raise SyntaxError('Directory input is invalid. Requires to be an alphanumeric string.')
-				# ----
+					if type(self.password) == str:
+						# If the password parameter input specified by the user is of str type, then we continue to validate further
 
-				# Validating the user entered password
-				# ----
-				# Checking the password input type
-				if type(self.password) == str:
-					# If the password's value as per entered by the user is a string type variable, then we continue for further validation
+						if len(self.password) > 4:
+							# If the password parameter input specified by the user is more than 4 character length, then we continue
 
-					# Checking for string length
-					if len(self.password) > 4:
-						# If the user specified password has character length more than 4, then we continue
+							pass
+						else:
+							# If the password parameter input specified by the user is less than 4 character length, then we raise an error with a custom message
 
-						pass
+							raise SyntaxError('Password invalid. The password input should be a string with atleast 5 character length.')
 					else:
-						# If the user specified password has character length less than 4 charcters, then we raise an error with a custom message
-
-						raise SyntaxError('Password input is invalid. Requires to be an alphanumeric string with length atleast 5.')
-				else:
-					# If the user entered password's value is a non string variable, then we raise an error with a custom message
+						# If the password parameter input specified by the user is not of str type, then we raise an error on the console screen
 
-					raise SyntaxError('Password input is invalid. Requires to be an alphanumeric string with length atleast 5.')
+						raise TypeError('Password invalid. Password parameter should be in str format.')
 				# ----
 
 				# Checking the task specified and then continuing to execute the task
@@ -1170,79 +1733,36 @@ class DirectoryEncrypter:
 				elif self.task.lower() == 'encrypt' or self.task.lower() == 'encryption':
 					# If the task specified is for encryption, then we continue to encrypt
 
-					# Creating the class variable self.ignorefiles before starting the process of the encryption
-					self.ignorefiles = []
+					if self.encrypt() == 0:
+						# If the encrypt() method returns 0, then the file has been encrypted successfully and we display the success message on the console screen
 
-					# Checking for the ignore and config flag
-					# ----
-					if self.useconfig:
-						# If the useconfig flag is marked true, then we continue to fetch the custom config file
+						print(f'[ Video encrypted : {self.filename} ]')
+					else:
+						# If the encrypt() method does not returns 0, then the file has been failed to encrypt and we display the failure message on the console screen
 
-						# Launching the customconfigloader() method in order to fetch for the custom config file
-						self.customconfigloader()
-					elif self.ignore:
-						# If the ignore flag is marked true, then we continue to ask the user for the files for ignoring
+						print(f'[ Video failed to encrypt : {self.filename} ]')
+				elif self.task.lower() == 'decrypt' or self.task.lower() == 'decryption':
+					# If the task specified is for decryption, then we continue to decrypt
 
-						files = input('\nEnter the files to be ignored during the encryption (seperate with ;)\n> ')
-						files = files.split(';')
+					if self.decrypt() == 0:
+						# If the decrypt() method returns 0, then the file has been decrypted successfully and we display the success message on the console screen
 
-						# Inserting all the files into the ignorefiles list after validating each one of them
-						for file in files:
-							# Iterating through each file specified by the user
+						print(f'[ Video file decrypted : {self.filename} ]')
+					else:
+						# If the decrypt() method does not returns 0, then the file has been failed to decrypt and we display the failure message on the console screen
 
-							if path.isfile(self.directory + file):
-								# If the currently iterated file does exists, then we continue to append it to the ignorefiles list
+						print(f'[ Video file failed to decrypt : {self.filename} ]')
+				else:
+					# If the task specified is not recognized, then we raise an error with a custom message
 
-								self.ignorefiles.append(file)
-							else:
-								# If the currently iterated file does not exists, then we skip it after displaying the not found message on the console screen
+					raise ReferenceError('Task not recognized. Encrypt / decrypt are the two recognizable terms.')
+				del self.task
 
-								print(f'[!] File skipped (not added to ignore list), not found : {file}')
-								continue
-						del files
-					# ----
+	def generatekey(self):
+		""" This method / function serves the purpose of generating a special key for the encryption and decryption using the user entered password. This function takes the value of the user entered password from the class variable self.password.
+		The key is generated in such an algorithm, that the key remains possitive integer.
 
-					# Launching the encrypt() method in order to start the encryption process
-					if self.encrypt() == 0:
-						# If the encrypt() method returns 0, it means that the encryption proces is completed and thus we display the message on the console screen
-
-						print(f'\n[$] Encryption process completed')
-					else:
-						# If the encrypt() method does not returns 0, it means there are some errors in the encryption process and thus we display the message on the console screen
-
-						print(f'\n[!] Encryption process might have encountered some errors, please check the directory for finding them out.')
-				elif self.task.lower() == 'decrypt' or self.task.lower() == 'decryption':
-					# If the task specified is for decryption, then we continue to decrypt
-
-					# Checking for the config flag
-					# ----
-					if self.useconfig:
-						# If the useconfig flag is marked true, then we continue to fetch the custom config file
-
-						# Launching the customconfigloader() method in order to fetch for the custom config file
-						self.ignore = False  # Marking the ignore flag as True in order to avoid any errors
-						self.customconfigloader()
-					# ----
-
-					# Launching the decrypt() method in order to start the decryption process
-					if self.decrypt() == 0:
-						# If the decrypt() method returns 0, it means that the decryption proces is completed and thus we display the message on the console screen
-
-						print(f'\n[$] Decryption process completed')
-					else:
-						# If the decrypt() method does not returns 0, it means there are some errors in the decryption process and thus we display the message on the console screen
-
-						print(f'\n[!] Decryption process might have encountered some errors, please check the directory for finding them out.')
-				else:
-					# If the task specified is not recognized, then we raise an error with a custom message
-
-					raise ReferenceError('Task not recognized. Encrypt / decrypt are the two recognizable terms.')
-				del self.task
-
-	def generatekey(self):
-		""" This method / function serves the purpose of generating a special key for the encryption and decryption using the user entered password. This function reads the encryption password value from the class variable self.password.
-
-		This function returns the int format key back after the generation. """
+		This function returns the int format key back after the generation. """
 
 		# Generating the key from the encryption using the user entered password for encryption / decryption
 		key = 0
@@ -1273,751 +1793,2689 @@ class DirectoryEncrypter:
 		# Returning the generating key
 		return key
 
-	def config(self, display = False):
-		"""
-		This method / function serves the funcionality of checking the config file and loading all the details of the config file into the class object. This function reads the .encryption_config file at the specified folder and loads the details into class variables like
+	def checkpassword(self):
+		""" This method / function serves the functionality of checking the user entered password against the original password stored in the header of the encrypted video file. This function uses the value of password from the class variable self.password. Only the header of the file is read for this.
 
-		self.password_hash			-> stores the password hash
-		self.ignorefiles   			-> stores the list of files to be ignored during the encryption / decryption
-		self.created_on             -> stores the timestamp when the first encryption was applied on this directory
-		self.last_modified           -> stores the timestamp when the encryption / decryption was executed latest
-		
-		The .encryption_config is a JSON file. The structure of the .encryption_config file is given below.
-		{
-			"password" : "...",
-			"ignorefiles" : [],
-			"created_on" : ...,
-			"last_modified" : ...,
-		}
+		The function returns True if the password matches, and returns False if the password does not matches (or if the file is not an encrypted video file). """
 
-		This function also takes one argument 'display'. This display argument determines whether to print the config information on the console screen. If the display argument is marked true, then the config information is printed on the console screen, else nothing happens. The display argument is by default False.
-		"""
+		container = CipherContainer(self.password)
+		with open(self.filename, 'rb') as descriptor:
+			header = container.readheader(descriptor)
 
-		# Fetching the contents of the .encryption_config file
-		# ----
-		# Checking whether the config file exists or not in the user specified directory
-		if self.useconfig:
-			# If the useconfig flag is marked true, then it means the user requested to load a custom config file, and we skip it
+		# Checking the user entered password against the original password stored in the file
+		if container.checkkey(header):
+			# If the hashes of user entered password and the original password matches, then we return True
 
-			pass
-		elif path.isfile(self.directory + '.encryption_config'):
-			# If the config file exist in the user specified directory, then we continue for further checking
+			return True
+		else:
+			# If the hashes of user entered password and the original password does not matches, then we return False
 
-			# Reading the contents of the config file
-			contents = open(f'{self.directory}.encryption_config', 'rb').read()
-			contents = b64decode(contents).decode()
-			contents = loads(contents)
+			return False
 
-			# Setting the information extracted from the config file to the class variables
-			self.password_hash = contents["password"]
-			self.ignorefiles = contents["ignorefiles"]
-			self.created_on = contents["created_on"]
-			self.last_modified = contents["last_modified"]
+	def encrypt(self):
+		""" This method / function serves the feature of encrypting the contents of the video file. This function reads the filename location input stored in the class variable self.filename. The file is streamed chunk by chunk into the '<file>.partial' file (with the header at the start), and resumed from the last checkpoint if a previous encryption of the same file was interrupted. """
 
-			# Validating the information extracted
-			if type(self.password_hash) == str and len(self.password_hash) > 5:
-				# If the hash of the password is of proper length, then we continue
+		length = path.getsize(self.filename)
+		return self.stream('encrypt', 0, length, CipherContainer(self.password).makeheader(length))
 
-				pass
-			else:
-				# If the hash of the password is not of proper length, then we display the error message on the console screen
+	def decrypt(self):
+		""" This method / function serves the feature of decrypting the contents of the video file. This function reads the filename location input stored in the class variable self.filename. The file is streamed chunk by chunk (skipping the header) into the '<file>.partial' file, and resumed from the last checkpoint if a previous decryption of the same file was interrupted. """
 
-				print(f'password hash is invalid in the config file.')
-				return 0
+		# Reading the header of the file (the password check and the length of the video)
+		container = CipherContainer(self.password)
+		with open(self.filename, 'rb') as descriptor:
+			header = container.readheader(descriptor)
 
-			if type(self.ignorefiles) == list:
-				# If the data type of the ignorefiles parameter is of a list, then we continue
+		# Validating the file and the password before decrypting
+		if header == None:
+			# If the file does not have the container header, then it is not an encrypted video file and we display the error message on the console screen
 
-				pass
-			else:
-				# If the data type of the ignorefiles parameter is not a list, then we display the error message on the console screen
+			print(f'[ Error : The file is not an encrypted video file (or its header is corrupted). ]')
+			return 1
+		elif container.checkkey(header):
+			# If the password matches, then we continue
 
-				print(f'ignorefiles is invalid in the config file. Required to be a list / array.')
-				return 0
+			length = header[1]
 
-			if type(self.created_on) == float or type(self.created_on) == int:
-				# If the data type of the created_on parameter is either int or float, then we continue
+			# Validating the length of the video against the size of the file
+			if path.getsize(self.filename) != container.headersize + length:
+				# If the size of the file does not match with the length in the header, then the file is truncated / corrupted and we display the error message on the console screen
 
-				self.created_on = datetime.fromtimestamp(self.created_on).ctime()
-			else:
-				# If the data type of the created_on parameter is neither int nor float, then we display the error message on the console screen
+				print(f'[ Error : The encrypted video file is corrupted. Expected {length} bytes after the header. ]')
+				return 1
 
-				print(f'created_on is invalid. Required to be a timestamp.')
-				return 0
+			return self.stream('decrypt', container.headersize, length, b'')
+		else:
+			# If the password does not matches, then we display the error message on the console screen
 
-			if type(self.last_modified) == float or type(self.last_modified) == int:
-				# If the data type of the last_modified parameter is either int or float, then we continue
+			print(f'[ Incorrect password ]')
+			return 403
 
-				if self.last_modified == 0.0:
-					# If the last_modified parameter is 0.0 i.e., it is not defined, then we define the self.last_modified variable as an empty string
+	def loadcheckpoint(self, task, length, header):
+		""" This method / function serves the functionality of loading the checkpoint of an interrupted encryption / decryption of the video file. The checkpoint ('<file>.checkpoint') is used only if it is for the same task, the same password and the same (unmodified) source file, and the '<file>.partial' file has atleast the checkpointed number of bytes.
 
-					self.last_modified = ''
-				else:
-					# If the last_modified parameter is not 0.0, then we continue to store the ctime value in the self.last_modified class variable
+		The function returns the number of bytes of the source file already processed (0 if there is no usable checkpoint). """
 
-					self.last_modified = datetime.fromtimestamp(self.last_modified).ctime()
-			else:
-				# If the data type of the last_modified parameter is neither int or float, then we display the error message on the console screen
+		try:
+			# Reading the checkpoint file
+			checkpoint = loads(open(self.filename + '.checkpoint', 'r').read())
+			information = stat(self.filename)
 
-				print(f'last_modified is invalid. Required to be a timestamp.')
+			# Validating the checkpoint against the current task, password and source file
+			if checkpoint["task"] != task or checkpoint["password"] != hashlib.md5(self.password.encode()).hexdigest():
 				return 0
-		else:
-			# If the config file does not exists in the user specified directory, then we display the error message on the console screen
+			if checkpoint["length"] != length or checkpoint["size"] != information.st_size or checkpoint["mtime"] != information.st_mtime:
+				return 0
+			if path.getsize(self.filename + '.partial') < len(header) + checkpoint["offset"]:
+				return 0
+			with open(self.filename + '.partial', 'rb') as descriptor:
+				if descriptor.read(len(header)) != header:
+					return 0
+			return checkpoint["offset"]
+		except Exception as e:
+			# If there are any errors encountered while reading the checkpoint (checkpoint or partial file does not exists, or they are invalid), then we start over
 
-			print(f'config file not found in the specified directory "{self.directory}".')
 			return 0
-		# ----
 
-		# Displaying the configs on the console screen
-		# ----
-		# Checking the display argument passed to this function
-		if display:
-			# If the display argument is marked true, then we continue to display the config information
+	def savecheckpoint(self, task, length, offset):
+		""" This method / function serves the functionality of saving the checkpoint of the encryption / decryption of the video file, i.e., the number of bytes of the source file already processed (the parameter offset) along with the details to validate the checkpoint on resume. The checkpoint is first written to a temporary file and then moved in place, thus an interruption while saving never leaves a broken checkpoint. """
 
-			print(f'\nConfig for encryption on this directory ({self.directory}) : ')
-			print('[#] Files to ignore : ')
-			for i in self.ignorefiles:
-				print(i, end = ', ')
-			print('[#] Original filenames : ')
-			for i in self.originalfilenames:
-				print(f'{i["original_name"]} -> {i["encrypted_name"]}', end = ', ')
-			print(f'[#] Created on : {self.created_on}')
-			print(f'[#] Last modified : {self.last_modified}')
-		# ----
+		information = stat(self.filename)
+		open(self.filename + '.checkpoint.tmp', 'w').write(dumps({
+			"task" : task,
+			"password" : hashlib.md5(self.password.encode()).hexdigest(),
+			"length" : length,
+			"size" : information.st_size,
+			"mtime" : information.st_mtime,
+			"offset" : offset,
+			}))
+		replace(self.filename + '.checkpoint.tmp', self.filename + '.checkpoint')
 
-	def check(self, password = False, overall = False):
-		""" This method / function serves the funcionality of checking the password and other required details of the directory. This function gets the value of the password from the class variable self.password. """
+	def stream(self, task, start, length, header):
+		""" This method / function serves the functionality of streaming the video file through the cipher (the parameter task, either encrypt or decrypt). The 'length' number of bytes of the source file after the 'start' offset are processed in chunks and written to the '<file>.partial' file after the header (the parameter header, empty for the decryption). The checkpoint is saved after every self.checkpointsize bytes (the partial file is flushed to the disk before that, so the checkpoint never gets ahead of the data). Once completed, the partial file replaces the source file and the checkpoint is removed.
 
-		# Running the config method in order to extract the information stored in the .encryption_config file
-		self.config()
+		The function returns 0 on success. """
 
-		# Checking for the task to be done (using the arguments specified for this function)
-		if password:
-			# If the password argument is marked true, then we continue to check for the password verification
+		# Creating the cipher kernel for the key
+		kernel = CipherKernel(self.generatekey())
+		if task == 'encrypt':
+			# If the task is to encrypt, then we use the encryption of the cipher kernel
 
-			# Checking the password specified by the user against the hash of the password stored in the config file
-			if type(self.password) == str:
-				# If the password specified by the user is of str type, then we continue
+			function = kernel.encrypt
+		else:
+			# If the task is to decrypt, then we use the decryption of the cipher kernel
 
-				if hashlib.md5(self.password.encode()).hexdigest() == self.password_hash:
-					# If the hash of the password specified by the user matches with the original password hash, then we return True
+			function = kernel.decrypt
 
-					return True
-				else:
-					# If the hash of the password specified by the user does not matches with the original password hash, then we return False
+		# Checking for the checkpoint of an interrupted process
+		offset = self.loadcheckpoint(task, length, header)
+		if offset > 0:
+			# If there is a usable checkpoint, then we continue to resume from it
 
-					return False
-			else:
-				# If the password specified by the user is not of str type, then we raise an error with a custom message
+			print(f'[#] Resuming from {offset / 1048576:.1f} MB')
+			output = open(self.filename + '.partial', 'r+b')
+			output.truncate(len(header) + offset)
+			output.seek(len(header) + offset)
+		else:
+			# If there is no usable checkpoint, then we start over
+
+			output = open(self.filename + '.partial', 'wb')
+			output.write(header)
+
+		# Streaming the source file chunk by chunk
+		started = monotonic()
+		resumed = offset
+		displayed = 0.0
+		checkpointed = offset
+		with output, open(self.filename, 'rb') as source:
+			source.seek(start + offset)
+			while offset < length:
+				chunk = source.read(min(self.chunksize, length - offset))
+				if len(chunk) == 0:
+					# If the source file ended before the expected length, then we raise an error with a custom message
+
+					raise EOFError(f'{self.filename} ended at {offset} bytes, expected {length} bytes.')
+				output.write(function(chunk))
+				offset += len(chunk)
+
+				# Saving the checkpoint
+				if offset - checkpointed >= self.checkpointsize and offset < length:
+					# If enough bytes are processed since the last checkpoint, then we flush the output to the disk and save the checkpoint
+
+					output.flush()
+					fsync(output.fileno())
+					self.savecheckpoint(task, length, offset)
+					checkpointed = offset
+
+				# Displaying the progress and the throughput (at most 4 times a second)
+				if monotonic() - displayed >= 0.25 or offset == length:
+					displayed = monotonic()
+					speed = (offset - resumed) / 1048576 / max(displayed - started, 0.000001)
+					stdout.write('\r')
+					stdout.write(f'[ {task.capitalize()}ing : {offset * 100 / max(length, 1):.1f} % ({offset / 1048576:.1f} / {length / 1048576:.1f} MB) at {speed:.1f} MB/s ]')
+					stdout.flush()
+			output.flush()
+			fsync(output.fileno())
+		print()
+
+		# Moving the partial file in place of the source file and removing the checkpoint
+		copymode(self.filename, self.filename + '.partial')
+		replace(self.filename + '.partial', self.filename)
+		if path.isfile(self.filename + '.checkpoint'):
+			remove(self.filename + '.checkpoint')
 
-				raise TypeError('Password is invalid. Password specified by the user should be a string.')
-		elif overall:
-			# If the overall argument is marked true, then we continue to check for the overall config information verification
+		# Deleting some of the variables declared within this function
+		del kernel, function, offset, resumed, started, displayed, checkpointed
 
-			# Checking for the password by matching the hashes
-			if type(self.password) == str:
-				# If the password specified by the user is of str type, then we continue
+		# Returning 0 code (It will indicate that the function executed in success)
+		return 0
 
-				if hashlib.md5(self.password.encode()).hexdigest() == self.password_hash:
-					# If the hash of the password specified by the user matches with the original password hash, then we pass
+class DirectoryEncrypter:
+	"""
+	This class serves the funcionality of encryption / decryption of user specified directory. The process of encryption is done using the user specified password. The same password which was used for encryption is used for decryption as well. The encryption algorithm used by this class is close to same as other encryption classes defined in this module file.
 
-					pass
-				else:
-					# If the hash of the password specified by the user does not matches with the original password hash, then we return False
+	The encryption process here is a bit long and more organised. Each files of the user specified directory are encrypted one by one. Also, there are options for ignoring specific files during the encryption / decryption. The structure and information related to the encryption of a directory are stored in a config file in the user specified directory. The file is named '.encryption_config'.
 
-					return False
-			else:
-				# If the password specified by the user is not of str type, then we raise an error with a custom message
+	The structure of the config file is shown below.
+	{
+		"password" : "...",
+		"ignorefiles" : [],
+		"created_on" : ...,
+		"last_modified" : ...,
+	}
 
-				raise TypeError('Password is invalid. Password specified by the user should be a string.')
+	The config file stores the password hash, thus when the user decrypts the directory, the password verification process is done. The user entered password is verified against the original password hash stored in the config file. There are also information stored there like, date of creation, last modfiied, etc.
 
-			# Checking for the ignorefiles and originalfilenames fields in the config informatin
-			if type(self.ignorefiles) == list:
-				# If the data type of both the ignorefiles and originalfilenames are of list, then we pass
+	The class object when created, some of the information are required to be entered by the user. There are two ways of entering the information by the user. The ways are listed below.
 
-				pass
-			else:
-				# If the data type of either ignorefiles or originalfilenames is not list, then we return False
+	1. Via argument tokens
 
-				return False
+		In this mode,
+		The argument tokens entered by the user at the shell (command line) are passed to this class object at the 'arguments' parameters. The syntax is shown below.
 
-			# If the code execution reached upto here, then we return True as all the validation of the config information has been passed without any errors
-			return True
-		else:
-			# If neither the password argument not the overall argument are marked true, then we pass
+		DirectoryEncrypter(arguments = [<argument-list>])
 
-			pass
+		The arguments that are recognized by this class / tool are listed below.
+		--password            Used to specify the password for the encryption / decryption
+		--directory           Used to specify the directory for the encryption / decryption
+		--task                Used to specify whether to encrypt / decrypt
+		--ignore              Used to launch the ignore files mode (the user can mention the files to ignore)
+		--jobs                Used to specify the number of processes for encrypting / decrypting the files in parallel (default is 1)
+		--recursive           Used to encrypt the files in the sub-directories as well
+		--incremental         Used to encrypt only the files which are new / modified since the last encryption of the directory
+		--format              Used to specify the format of the encrypted files, either binary (default) or legacy
+		--help                Used to launch the documentation mode (the help section is displayed on the console screen)
 
-	def encrypt(self):
-		""" This method / function serves the funcionality of encrypting the files in the user specified directory. This function reads the directory location input from the class variable self.directory. The process of the encryption / the steps of encryption are listed below :
-		1. Generate the encryption key.
-		2. Encrypt each files in the directory one by one.
-		3. Rename the filenames with the encrypted version of filenames.
-		4. Create the config file in the directory.
-		"""
+		If there are any whitespaces in the inputs, then use the backslash (\). Below are some examples for the usage of this tool.
 
-		# Printing the encryption message on the console screen
-		print(f'\n[ Encrypting {self.directory} ]\n')
+		# Command for encryption of a directory with password 'somehardpassword123'
+		encrypt directory --directory /location/to/directory --password somehardpassword123 --task encrypt
 
-		# Creating the class variables that are not defined before encryption
-		self.created_on = datetime.now().timestamp()
-		self.last_modified = 0.0
+		# Command for decryption of a directory with password 'somehardpassword123'
+		encrypt directory --directory /location/to/directory --password somehardpassword123 --task decrypt
 
-		# Generating the key for the encryption
-		key = self.generatekey()
+		# Command for encryption of a directory + ignoring some specific files
+		encrypt directory --directory /location/to/directory --password somehardpassword123 --task encrypt --ignore
 
-		# Getting the list of the files in the user specified directory
-		files = listdir(self.directory)
+		# Command for encryption of a directory using 8 processes in parallel
+		encrypt directory --directory /location/to/directory --password somehardpassword123 --task encrypt --jobs 8
 
-		# Checking whether the encryption config file is already present in the user specified directory or not
-		if '.encryption_config' in files:
-			# If the encryption_config is already present in the directory, then we continue to ask the user whether to parse information from the config file or not
+		# Command for encryption of a directory along with all of its sub-directories
+		encrypt directory --directory /location/to/directory --password somehardpassword123 --task encrypt --recursive
 
-			choice = input('A config file is already present at {self.directory}. Should we parse information from it? (y/n) : ')
-			if choice.lower() == 'y' or choice.lower() == 'yes':
-				# If the user choosed the option for loading the information from the existsing config file, then we continue
+		# Command for encryption of only the new / modified files of an already encrypted directory
+		encrypt directory --directory /location/to/directory --password somehardpassword123 --task encrypt --incremental
 
-				# Reading the contents of the encryption config
-				contents = open(self.directory + '.encryption_config', 'rb').read()
-				contents = b64decode(contents).decode()
-				contents = loads(contents)
+		# Command for displaying the help section for the tool
+		encrypt directory --help
 
-				# Setting the information extracted from the config file to the class variables
-				self.password_hash = contents["password"]
-				self.created_on = contents["created_on"]
-				self.last_modified = contents["last_modified"]
-				
-				# Adding the ignorefiles item from the config file to class variable list
-				for file in contents["ignorefiles"]:
-					if file not in self.ignorefiles:
-						# If the file is not already listed on the ignorefiles list, then we continue to append it
+	2. Directly passing parameters
 
-						self.ignorefiles.append(contents["ignorefiles"])
+		In this mode,
+		The parameters are passed directly into the class object. The syntax for the usage is listed below.
 
-				# Checking the user entered password against the password hash extracted from the config file
-				if hashlib.md5(self.password.encode()).hexdigest() == self.password_hash:
+		DirectoryEncrypter(
+			directory = '/location/to/directory',
+			password = '<password>',
+		)
+
+		There are two parameters to be specified when launching the class object / declaring the class object. The parameters are : directory, password.
+		The 'directory' parameter is used to specify the location of the directory which is needed to be encrypted / decrypted.
+		The 'password' parameter is used to specify the password for the encryption / decryption.
+		The 'jobs' parameter is optional, it is used to specify the number of processes for encrypting / decrypting the files in parallel (default is 1).
+		The 'recursive' parameter is optional, it is used to specify whether to encrypt the files in the sub-directories as well (default is False).
+		The 'incremental' parameter is optional, it is used to specify whether to encrypt only the files which are new / modified since the last encryption of the directory (default is False).
+		The 'format' parameter is optional, it is used to specify the format of the encrypted files, either 'binary' or 'legacy' (default is 'binary').
+
+		Further processes are listed below in the form of examples.
+
+		# Declaring the class object
+		enc = DirectoryEncrypter(directory = '/location/to/directory', password = 'somehardpassword123')
+
+		# Specifying the ignorefiles (The files to be ignored while encryption / decryption)
+		enc.ignorefiles = ['filename1.txt', 'filename2.docx', 'filename3.jpeg']
+
+		# Encrypting the directory
+		enc.encrypt()
+
+		# Checking the password before decryption
+		enc.check(password = True)
+
+		# Checking the complete configuration of the encrypted directory before decrypting
+		enc.check(all = True)
+
+		# Decrypting the encrypted directory
+		enc.decrypt()
+
+	Some of the points to be noted about this class are listed below :
+	* The sub-folders in the specified directory are skipped, just the files are encrypted. Unless the recursive mode is specified, in which case the files in all the sub-folders are encrypted too (the names of the sub-folders are kept as they are).
+
+	* Along with the config file, a manifest file named '.encryption_manifest' is created in the directory. The manifest maps each encrypted filename (path relative to the directory) to the original filename, size and modification time of the file, i.e., { "<encrypted name>" : ["<original name>", <size>, <mtime>], ... }. The manifest is itself encrypted with the same password. The decryption and the config display uses this manifest for finding the original filenames, instead of decoding each of the encrypted filenames.
+
+	* The config file also records the SHA256 hash, size and modification time of each encrypted file (the "files" entry). In the incremental mode, the existing config file is loaded without asking and only the files which are new or modified since the 'last_modified' timestamp of the config are encrypted. A recorded file whose size is the same and which is not modified after the 'last_modified' timestamp is skipped without even reading it, otherwise its hash is compared with the recorded one.
+
+	* In the binary format (default), each file is written in the container format of the CipherContainer (a 30 bytes header followed by the raw cipher bytes). In the legacy format, each file is base64 encoded, encrypted and base64 encoded again (about 1.8x the size of the file). The decryption detects the format of each file from its header, thus the directories encrypted in either of the formats can be decrypted.
+
+	* The complete process of encryption and decryption might have some flaws. There might occur some errors related to key generation, discontinuity, etc, that could lead to serious loss of the data.
+
+	* Security is not ensured by us. If there are situations like the data is completly corrupted during the process, then the authors are not responsible for the loss of the data. The authors are responsible for the bugs, not the mistakes commited by the users / clients. Thus, use this tool / class object safely and with your own risk.
+
+	* For any bugs and errors, kindly create an issue on the github mirror of this repository or contact the author of this module file (Contact address / email addres listed at the top of the document).
+
+	CUSTOM CONFIG
+
+	This class also accepts custom configuration from the user. Using the --use-config flag while launching the command for this, we command this tool to use a custom config file that too is specified by the user. Before encryption / decryption, we then ask the user for entering custom config in two different ways. The ways are listed below.
+	1. .encryption_config at the directory
+
+		In this mode, if there exists a file named '.encryption_config' already present in the user specified directory. Then, the tool loads the config file information from that file only. If the user wants to load information from any other way then there must not exists any file in that directory. This file is loaded in the same way the default config file is loaded in this tool (class object).
+
+	2. Custom config file location
+
+		In this mode, the user is asked to enter the file location which directs the tool to a file which contains the contents of the configuration of the encrypted directory. The file that the user will specify should have proper read permissions and the contents should be valid.
+
+	3. Custom config hash
+
+		In this mode, the user is asked to enter the hash code of the config file. Entering the complete string will be used to extract the configuration of the encrypted directory. The hash code looks something like this, as shown below.
+
+		eyJwYXNzd29yZCI6ICJiOGU5NDZlNmY2NWU3M2Q1MDlkMzlkNzBkOTYzZWNlMyIsICJpZ25vcmVmaWxlcyI6IFsidGVzdDEucG5nIiwgInRlc3QzLmJmIiwgInRlc3QyLnR4dCIsICJ0ZXN0NC5weSJdLCAiY3JlYXRlZF9vbiI6IDE2MjQzMzIxNDMuMDcyNTMzLCAibGFzdF9tb2RpZmllZCI6IDAuMH0=
+
+	This custom config feature might be a little different and odd, below are some points that will explain how it makes a difference.
+	1. Even if we specify a custom config file, we still have to specify the password for encryption and decryption.
+	2. The configuration for an encrypted directory stores other properties like ignorefiles, etc. The ignorefiles property is a list of files that are to be ignored during the encryption and decryption process.
+	"""
+
+	def __init__(self, directory = None, password = None, useconfig = False, jobs = 1, recursive = False, incremental = False, format = 'binary', arguments = None):
+		# Checking if arguments provided or just the parameters directly
+		if arguments == None:
+			# If the arguments are not passed to this function by the user, then we continue to use the default provided values
+
+			self.directory = directory
+			self.password = password
+			self.useconfig = useconfig
+			self.jobs = jobs
+			self.recursive = recursive
+			self.incremental = incremental
+			self.format = format
+		else:
+			# If the arguments are passed to this function by the user, then we continue to parse the arguments
+
+			# Parsing the arguments entered to this function
+			# ----
+			# Setting the default value of the variables to None
+			self.directory = None
+			self.password = None
+			self.ignore = False
+			self.useconfig = False
+			self.documentation = False
+			self.task = None
+			self.jobs = 1
+			self.recursive = False
+			self.incremental = False
+			self.format = 'binary'
+
+			# Iterating through each argument to filter out the values
+			for index, argument in enumerate(arguments):
+				# Iterating through each argument item
+
+				if argument == '--password':
+					# If the argument is for specifying the password, then we continue to parse the next argument as the entered value
+
+					try:
+						self.password = arguments[index + 1]
+					except IndexError:
+						# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
+
+						continue
+
+				if argument == '--jobs':
+					# If the argument is for specifying the number of jobs (processes) for the encryption / decryption, then we continue to parse the next argument as the entered value
+
+					try:
+						self.jobs = int(arguments[index + 1])
+					except IndexError:
+						# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
+
+						continue
+					except ValueError:
+						# If the next argument is not a numeric value, then we raise an error with a custom message
+
+						raise ValueError('Invalid number of jobs specified. Requires to be a numeric value (atleast 1).')
+
+				if argument == '--directory':
+					# If the argument is for specifying the directory for encryption, then we continue to parse the next argument as the entered value
+
+					try:
+						self.directory = arguments[index + 1]
+					except IndexError:
+						# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
+
+						continue
+
+				if argument == '--task':
+					# If the argument is for specifying the task (encryption / decryption), then we continue to parse the next argument as the entered value
+
+					try:
+						self.task = arguments[index + 1]
+					except IndexError:
+						# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
+
+						continue
+
+				if argument == '--format':
+					# If the argument is for specifying the format of the encrypted files, then we continue to parse the next argument as the entered value
+
+					try:
+						self.format = arguments[index + 1].lower()
+					except IndexError:
+						# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
+
+						continue
+
+				if argument == '--ignore':
+					# If the argument is for specifying the ignore flag, then we continue to mark the ignore mode to true in order to ask the user for the files to be ignored
+
+					self.ignore = True
+
+				if argument == '--recursive':
+					# If the argument is for specifying the recursive flag, then we continue to mark the recursive mode to true in order to encrypt the files in the sub-directories as well
+
+					self.recursive = True
+
+				if argument == '--incremental':
+					# If the argument is for specifying the incremental flag, then we continue to mark the incremental mode to true in order to encrypt only the new / modified files of the directory
+
+					self.incremental = True
+
+				if argument == '--use-config':
+					# If the argument is for specifying the use-config flag, then we continue to mark the useconfig mode to true in order to further fetch the information from the configuration file
+
+					self.useconfig = True
+
+				if argument == '--help':
+					# If the argument is for specifying the help, then we continue to mark the documentation mode to be true
+
+					self.documentation = True
+			# ----
+
+			# Checking whether the task is to be in documentation mode or execution mode
+			if self.documentation:
+				# If the user specified the documentation mode, then we continue to display the help text on the console screen
+
+				print('encrypt directory\nUsage : encrypt <arguments>\n\n"encrypt directory" is a tool which serves the functionality of encryption / decryption of user specified directories. This tool encrypts an entire directory with a password. There are also features like ignoring certain files while encryption / decryption process. All such properties of the encryption are stored in the config file (.encryption_config). This file is necessary for the proper decryption of an already encrytped directory.\n\nArguments are :\n--password            Used to specify the password for encryption / decryption\n--directory  Used to specify the directory for encryption / decryption\n--task  Used to specify whether to encrypt / decrypt\n--ignore \t\t\t  Used to specify certain files to ignore when encrypting\n--use-config  Used to specify a custom config for the encryption / decryption\n--jobs                Used to specify the number of processes for encrypting / decrypting the files in parallel\n--recursive           Used to encrypt the files in the sub-directories as well\n--incremental         Used to encrypt only the new / modified files since the last encryption\n--format              Used to specify the format of the encrypted files, either binary (default) or legacy\n--help(\t\t\t  Used to display this help text\n\nPoints to be noted :\n1. The sub-folders in the specified directory are skipped, just the files are encrypted (unless the --recursive argument is used).\n2. The complete process of encryption and decryption might have some flaws. There might occur some errors related to key generation, discontinuity, etc, that could lead to serious loss of the data.\n3. Security is not ensured by us. If there are situations like the data is completly corrupted during the process, then the authors are not responsible for the loss of the data. The authors are responsible for the bugs, not the mistakes commited by the users / clients. Thus, use this tool / class object safely and with your own risks.\n\nCheck out the docs for more info.')
+			else:
+				# If the user specified the execution mode, then we continue to execute the task
+
+				# Validating the user entered directory location
+				# ----
+				# Checking the directory location input type
+				if type(self.directory) == str:
+					# If the directory's value as per entered by the user is a string type variable, then we continue for further validation
+
+					# Checking whether the directory exists or not
+					if path.isdir(self.directory):
+						# If the user specified directory exists in the local machine, then we continue for further validation
+
+						# Adding a / at the end of the directory location (path) if not present
+						if self.directory[len(self.directory)-1] != '/':
+							# If the '/' is not present at the end of the directory location (path), then we continue to add it
+
+							self.directory += '/'
+					else:
+						# If the user specified directory does not exists in the local machine, then we raise an error with a custom message
+
+						raise ValueError(f'No such directory found "{self.directory}".')
+				else:
+					# If the user entered directory's value is a non string variable, then we raise an error with a custom message
+
+					raise SyntaxError('Directory input is invalid. Requires to be an alphanumeric string.')
+				# ----
+
+				# Validating the user entered password
+				# ----
+				# Checking the password input type
+				if type(self.password) == str:
+					# If the password's value as per entered by the user is a string type variable, then we continue for further validation
+
+					# Checking for string length
+					if len(self.password) > 4:
+						# If the user specified password has character length more than 4, then we continue
+
+						pass
+					else:
+						# If the user specified password has character length less than 4 charcters, then we raise an error with a custom message
+
+						raise SyntaxError('Password input is invalid. Requires to be an alphanumeric string with length atleast 5.')
+				else:
+					# If the user entered password's value is a non string variable, then we raise an error with a custom message
+
+					raise SyntaxError('Password input is invalid. Requires to be an alphanumeric string with length atleast 5.')
+				# ----
+
+				# Validating the number of jobs specified by the user
+				if self.jobs < 1:
+					# If the number of jobs specified by the user is less than 1, then we raise an error with a custom message
+
+					raise ValueError('Invalid number of jobs specified. Requires to be a numeric value (atleast 1).')
+
+				# Validating the format specified by the user
+				if self.format != 'binary' and self.format != 'legacy':
+					# If the format specified by the user is neither binary nor legacy, then we raise an error with a custom message
+
+					raise ValueError('Format not recognized. Binary / legacy are the two recognizable formats.')
+
+				# Checking the task specified and then continuing to execute the task
+				if self.task == None:
+					# If the task to be done is not specified by the user (default value), then we raise an error with a custom message
+
+					raise SyntaxError('Task not specified. The task is needed to be specified whether encrypt / decrypt.')
+				elif self.task.lower() == 'encrypt' or self.task.lower() == 'encryption':
+					# If the task specified is for encryption, then we continue to encrypt
+
+					# Creating the class variable self.ignorefiles before starting the process of the encryption
+					self.ignorefiles = []
+
+					# Checking for the ignore and config flag
+					# ----
+					if self.useconfig:
+						# If the useconfig flag is marked true, then we continue to fetch the custom config file
+
+						# Launching the customconfigloader() method in order to fetch for the custom config file
+						self.customconfigloader()
+					elif self.ignore:
+						# If the ignore flag is marked true, then we continue to ask the user for the files for ignoring
+
+						files = input('\nEnter the files to be ignored during the encryption (seperate with ;)\n> ')
+						files = files.split(';')
+
+						# Inserting all the files into the ignorefiles list after validating each one of them
+						for file in files:
+							# Iterating through each file specified by the user
+
+							if path.isfile(self.directory + file):
+								# If the currently iterated file does exists, then we continue to append it to the ignorefiles list
+
+								self.ignorefiles.append(file)
+							else:
+								# If the currently iterated file does not exists, then we skip it after displaying the not found message on the console screen
+
+								print(f'[!] File skipped (not added to ignore list), not found : {file}')
+								continue
+						del files
+					# ----
+
+					# Launching the encrypt() method in order to start the encryption process
+					if self.encrypt() == 0:
+						# If the encrypt() method returns 0, it means that the encryption proces is completed and thus we display the message on the console screen
+
+						print(f'\n[$] Encryption process completed')
+					else:
+						# If the encrypt() method does not returns 0, it means there are some errors in the encryption process and thus we display the message on the console screen
+
+						print(f'\n[!] Encryption process might have encountered some errors, please check the directory for finding them out.')
+				elif self.task.lower() == 'decrypt' or self.task.lower() == 'decryption':
+					# If the task specified is for decryption, then we continue to decrypt
+
+					# Checking for the config flag
+					# ----
+					if self.useconfig:
+						# If the useconfig flag is marked true, then we continue to fetch the custom config file
+
+						# Launching the customconfigloader() method in order to fetch for the custom config file
+						self.ignore = False  # Marking the ignore flag as True in order to avoid any errors
+						self.customconfigloader()
+					# ----
+
+					# Launching the decrypt() method in order to start the decryption process
+					if self.decrypt() == 0:
+						# If the decrypt() method returns 0, it means that the decryption proces is completed and thus we display the message on the console screen
+
+						print(f'\n[$] Decryption process completed')
+					else:
+						# If the decrypt() method does not returns 0, it means there are some errors in the decryption process and thus we display the message on the console screen
+
+						print(f'\n[!] Decryption process might have encountered some errors, please check the directory for finding them out.')
+				else:
+					# If the task specified is not recognized, then we raise an error with a custom message
+
+					raise ReferenceError('Task not recognized. Encrypt / decrypt are the two recognizable terms.')
+				del self.task
+
+	def generatekey(self):
+		""" This method / function serves the purpose of generating a special key for the encryption and decryption using the user entered password. This function reads the encryption password value from the class variable self.password.
+
+		This function returns the int format key back after the generation. """
+
+		# Generating the key from the encryption using the user entered password for encryption / decryption
+		key = 0
+		isEven = True
+
+		for i in self.password:
+			# Iterating over each character in the encrypted key entered by the user
+				
+			if isEven:
+				# If the current iteration is even number, then we add the char code value
+
+				key += ord(i)
+			else:
+				# If the current iteration is odd number (not even), then we subtract the char code value
+
+				key -= ord(i)
+		del isEven
+
+		# Making the key possitive
+		if key < 0:
+			# If the key value is less than 0, then we change the negative sign to possitive by simply multiplying it with -1
+
+			key *= (-1)
+
+		# Adding the length of the password to itself
+		key += len(self.password)
+
+		# Returning the generating key
+		return key
+
+	def config(self, display = False):
+		"""
+		This method / function serves the funcionality of checking the config file and loading all the details of the config file into the class object. This function reads the .encryption_config file at the specified folder and loads the details into class variables like
+
+		self.password_hash			-> stores the password hash
+		self.ignorefiles   			-> stores the list of files to be ignored during the encryption / decryption
+		self.created_on             -> stores the timestamp when the first encryption was applied on this directory
+		self.last_modified           -> stores the timestamp when the encryption / decryption was executed latest
+		
+		The .encryption_config is a JSON file. The structure of the .encryption_config file is given below.
+		{
+			"password" : "...",
+			"ignorefiles" : [],
+			"created_on" : ...,
+			"last_modified" : ...,
+		}
+
+		This function also takes one argument 'display'. This display argument determines whether to print the config information on the console screen. If the display argument is marked true, then the config information is printed on the console screen, else nothing happens. The display argument is by default False.
+		"""
+
+		# Fetching the contents of the .encryption_config file
+		# ----
+		# Checking whether the config file exists or not in the user specified directory
+		if self.useconfig:
+			# If the useconfig flag is marked true, then it means the user requested to load a custom config file, and we skip it
+
+			pass
+		elif path.isfile(self.directory + '.encryption_config'):
+			# If the config file exist in the user specified directory, then we continue for further checking
+
+			# Reading the contents of the config file
+			contents = open(f'{self.directory}.encryption_config', 'rb').read()
+			contents = b64decode(contents).decode()
+			contents = loads(contents)
+
+			# Setting the information extracted from the config file to the class variables
+			self.password_hash = contents["password"]
+			self.ignorefiles = contents["ignorefiles"]
+			self.created_on = contents["created_on"]
+			self.last_modified = contents["last_modified"]
+
+			# Validating the information extracted
+			if type(self.password_hash) == str and len(self.password_hash) > 5:
+				# If the hash of the password is of proper length, then we continue
+
+				pass
+			else:
+				# If the hash of the password is not of proper length, then we display the error message on the console screen
+
+				print(f'password hash is invalid in the config file.')
+				return 0
+
+			if type(self.ignorefiles) == list:
+				# If the data type of the ignorefiles parameter is of a list, then we continue
+
+				pass
+			else:
+				# If the data type of the ignorefiles parameter is not a list, then we display the error message on the console screen
+
+				print(f'ignorefiles is invalid in the config file. Required to be a list / array.')
+				return 0
+
+			if type(self.created_on) == float or type(self.created_on) == int:
+				# If the data type of the created_on parameter is either int or float, then we continue
+
+				self.created_on = datetime.fromtimestamp(self.created_on).ctime()
+			else:
+				# If the data type of the created_on parameter is neither int nor float, then we display the error message on the console screen
+
+				print(f'created_on is invalid. Required to be a timestamp.')
+				return 0
+
+			if type(self.last_modified) == float or type(self.last_modified) == int:
+				# If the data type of the last_modified parameter is either int or float, then we continue
+
+				if self.last_modified == 0.0:
+					# If the last_modified parameter is 0.0 i.e., it is not defined, then we define the self.last_modified variable as an empty string
+
+					self.last_modified = ''
+				else:
+					# If the last_modified parameter is not 0.0, then we continue to store the ctime value in the self.last_modified class variable
+
+					self.last_modified = datetime.fromtimestamp(self.last_modified).ctime()
+			else:
+				# If the data type of the last_modified parameter is neither int or float, then we display the error message on the console screen
+
+				print(f'last_modified is invalid. Required to be a timestamp.')
+				return 0
+		else:
+			# If the config file does not exists in the user specified directory, then we display the error message on the console screen
+
+			print(f'config file not found in the specified directory "{self.directory}".')
+			return 0
+		# ----
+
+		# Displaying the configs on the console screen
+		# ----
+		# Checking the display argument passed to this function
+		if display:
+			# If the display argument is marked true, then we continue to display the config information
+
+			print(f'\nConfig for encryption on this directory ({self.directory}) : ')
+			print('[#] Files to ignore : ')
+			for i in self.ignorefiles:
+				print(i, end = ', ')
+			print('[#] Original filenames : ')
+			try:
+				# Loading the original filenames from the manifest of the directory
+
+				for encryptedfilename, details in self.loadmanifest().items():
+					print(f'{details[0]} -> {encryptedfilename}', end = ', ')
+			except Exception as e:
+				# If there are any errors encountered while reading the manifest (incorrect password or invalid manifest), then we display the error message on the console screen
+
+				print(f'manifest could not be read.', end = ' ')
+			print(f'[#] Created on : {self.created_on}')
+			print(f'[#] Last modified : {self.last_modified}')
+		# ----
+
+	def check(self, password = False, overall = False):
+		""" This method / function serves the funcionality of checking the password and other required details of the directory. This function gets the value of the password from the class variable self.password. """
+
+		# Running the config method in order to extract the information stored in the .encryption_config file
+		self.config()
+
+		# Checking for the task to be done (using the arguments specified for this function)
+		if password:
+			# If the password argument is marked true, then we continue to check for the password verification
+
+			# Checking the password specified by the user against the hash of the password stored in the config file
+			if type(self.password) == str:
+				# If the password specified by the user is of str type, then we continue
+
+				if hashlib.md5(self.password.encode()).hexdigest() == self.password_hash:
+					# If the hash of the password specified by the user matches with the original password hash, then we return True
+
+					return True
+				else:
+					# If the hash of the password specified by the user does not matches with the original password hash, then we return False
+
+					return False
+			else:
+				# If the password specified by the user is not of str type, then we raise an error with a custom message
+
+				raise TypeError('Password is invalid. Password specified by the user should be a string.')
+		elif overall:
+			# If the overall argument is marked true, then we continue to check for the overall config information verification
+
+			# Checking for the password by matching the hashes
+			if type(self.password) == str:
+				# If the password specified by the user is of str type, then we continue
+
+				if hashlib.md5(self.password.encode()).hexdigest() == self.password_hash:
+					# If the hash of the password specified by the user matches with the original password hash, then we pass
+
+					pass
+				else:
+					# If the hash of the password specified by the user does not matches with the original password hash, then we return False
+
+					return False
+			else:
+				# If the password specified by the user is not of str type, then we raise an error with a custom message
+
+				raise TypeError('Password is invalid. Password specified by the user should be a string.')
+
+			# Checking for the ignorefiles and originalfilenames fields in the config informatin
+			if type(self.ignorefiles) == list:
+				# If the data type of both the ignorefiles and originalfilenames are of list, then we pass
+
+				pass
+			else:
+				# If the data type of either ignorefiles or originalfilenames is not list, then we return False
+
+				return False
+
+			# If the code execution reached upto here, then we return True as all the validation of the config information has been passed without any errors
+			return True
+		else:
+			# If neither the password argument not the overall argument are marked true, then we pass
+
+			pass
+
+	def encrypt(self):
+		""" This method / function serves the funcionality of encrypting the files in the user specified directory. This function reads the directory location input from the class variable self.directory. The process of the encryption / the steps of encryption are listed below :
+		1. Generate the encryption key.
+		2. Encrypt each files in the directory one by one.
+		3. Rename the filenames with the encrypted version of filenames.
+		4. Create the config file in the directory.
+		"""
+
+		# Printing the encryption message on the console screen
+		print(f'\n[ Encrypting {self.directory} ]\n')
+
+		# Creating the class variables that are not defined before encryption
+		self.created_on = datetime.now().timestamp()
+		self.last_modified = 0.0
+
+		# Generating the key for the encryption
+		key = self.generatekey()
+
+		# Getting the list of the files in the user specified directory (also the files in the sub-directories, if the recursive mode is specified)
+		files = self.listfiles()
+
+		# The manifest of the encrypted files (encrypted filename -> [original filename, size, modification time]), and the records of the encrypted files from the previous encryption (encrypted filename -> hash, size and modification time)
+		manifest = {}
+		records = {}
+
+		# Checking whether the encryption config file is already present in the user specified directory or not
+		if path.isfile(self.directory + '.encryption_config'):
+			# If the encryption_config is already present in the directory, then we continue to ask the user whether to parse information from the config file or not (the config file is always loaded in the incremental mode)
+
+			if self.incremental:
+				choice = 'y'
+			else:
+				choice = input(f'A config file is already present at {self.directory}. Should we parse information from it? (y/n) : ')
+			if choice.lower() == 'y' or choice.lower() == 'yes':
+				# If the user choosed the option for loading the information from the existsing config file, then we continue
+
+				# Reading the contents of the encryption config
+				contents = open(self.directory + '.encryption_config', 'rb').read()
+				contents = b64decode(contents).decode()
+				contents = loads(contents)
+
+				# Setting the information extracted from the config file to the class variables
+				self.password_hash = contents["password"]
+				self.created_on = contents["created_on"]
+				self.last_modified = contents["last_modified"]
+				
+				# Adding the ignorefiles item from the config file to class variable list
+				for file in contents["ignorefiles"]:
+					if file not in self.ignorefiles:
+						# If the file is not already listed on the ignorefiles list, then we continue to append it
+
+						self.ignorefiles.append(file)
+
+				# Checking the user entered password against the password hash extracted from the config file
+				if hashlib.md5(self.password.encode()).hexdigest() == self.password_hash:
 					# If the user entered password matches with the original password hash, then we continue
 
-					pass
+					pass
+				else:
+					# If the user entered password does not matches with the original password hash, then we display the warning to the user about the password discontinuity
+
+					print(f'[!] Password match failed with the original password hash')
+					return 1
+
+				# Loading the manifest and the records of the files which are already encrypted (the config files created by the older versions does not have any records)
+				manifest = self.loadmanifest()
+				if "files" in contents and type(contents["files"]) == dict:
+					records = contents["files"]
+				elif self.incremental and not path.isfile(self.directory + '.encryption_manifest'):
+					# If the config file has neither the records nor the manifest (i.e., the directory was encrypted by the oldest versions of this tool), then the already encrypted files can not be told apart from the new files, thus we display the error message on the console screen
+
+					print(f'[ Error : The directory was encrypted by an older version of this tool (no manifest), the incremental mode can not be used. Decrypt and encrypt the directory again without --incremental. ]')
+					return 1
+			else:
+				# If the user choosed the option for skipping the loading process, then we continue to delete the config file (and the manifest) present at the directory
+
+				remove(self.directory + '.encryption_config')
+				if path.isfile(self.directory + '.encryption_manifest'):
+					remove(self.directory + '.encryption_manifest')
+			del choice
+
+		# Encrypting the contents of each file
+		# ----
+		# Filtering out the files which are to be encrypted (the files marked in the ignorefiles list, and the unchanged files in the incremental mode are skipped)
+		tasks = []
+		unchanged = {}
+		modified = []
+		for file in files:
+			# Iterating over the list of the files
+
+			if file in self.ignorefiles:
+				# If the file is marked at the ignore file list, then we skip the encryption part for the currently iterated file
+
+				print(f'[#] Ignored : {file}')
+			elif self.incremental and file in manifest:
+				# If the file is already encrypted in the previous encryption (incremental mode, the file is listed in the manifest), then it is never encrypted again, we only check whether it is modified since then or not
+
+				if file not in records:
+					# If the file has no record (the config file is created by an older version), then we record it now for the next incremental encryption
+
+					record = self.makerecord(file)
+					if record != None:
+						unchanged[file] = record
+					print(f'[#] Unchanged : {file}')
+				else:
+					# If the file has a record, then we compare the file against it
+
+					record = self.checkrecord(file, records[file])
+					if record != None:
+						# If the file is not modified since the previous encryption, then we skip it (keeping its record)
+
+						unchanged[file] = record
+						print(f'[#] Unchanged : {file}')
+					else:
+						# If the encrypted file is modified since the previous encryption, then we report it as an error (keeping its old record, thus it is reported again in the next encryption)
+
+						unchanged[file] = records[file]
+						modified.append(file)
+						print(f'[!] Modified : {file} (the encrypted file is changed since the last encryption, it is not encrypted again)')
+			else:
+				# If the file is not marked at the ignore file list, then we add it to the list of files to be encrypted
+
+				tasks.append(file)
+
+		# Creating the container for the binary format (None for the legacy format)
+		if self.format == 'legacy':
+			container = None
+		else:
+			container = CipherContainer(self.password)
+
+		# Encrypting the files (in parallel if more than 1 jobs are specified), the results are received in the same order as the files
+		for file, encryptedfilename, error, details, record in self.runjobs(DirectoryEncrypter.encryptfile, tasks, key, repeat(container)):
+			# Iterating over the result of each file
+
+			if error == None:
+				# If there are no errors encountered during the process, then we add the file to the manifest (and the records) and display the 'encrypted' message on the console screen
+
+				manifest[encryptedfilename] = details
+				unchanged[encryptedfilename] = record
+				print(f'[$] Encrypted : {file}')
+			else:
+				# If there are any errors encountered during the process, then we skip the current file from being encrypted
+
+				self.ignorefiles.append(file)
+				print(f'[!] Skipping : {file}')
+		records = unchanged
+		del tasks, unchanged, container
+		# ----
+
+		# Updating the last modified timestamp (all the files modified after this timestamp are treated as modified in the next incremental encryption)
+		self.last_modified = datetime.now().timestamp()
+
+		# Creating the config file and the manifest in the directory
+		try:
+			self.savemanifest(manifest)
+			open(self.directory + '.encryption_config', 'wb').write(b64encode(dumps({
+				"password" : hashlib.md5(self.password.encode()).hexdigest(),
+				"ignorefiles" : self.ignorefiles,
+				"created_on" : self.created_on,
+				"last_modified" : self.last_modified,
+				"files" : records,
+				}).encode()))
+		except Exception as e:
+			# If there are any errors encountered during the generation of the encryption config file, then we display the error message on the console screen
+
+			print(f'[ Error : Failed to generate the config file at {self.directory}. {e} ]')
+			return 0
+		else:
+			# If there are no errors encountered during the generation of the encryption config file, then we display the success message on the console screen
+
+			print(f'[ Encryption config file created at {self.directory} ]')
+
+		# Checking for the modified encrypted files (incremental mode)
+		if len(modified) != 0:
+			# If any of the encrypted files are modified since the previous encryption, then we display the error message on the console screen
+
+			print(f'[ Error : {len(modified)} encrypted files are modified since the last encryption, they are left as they are. ]')
+			return 1
+		return 0
+
+	def decrypt(self):
+		""" This method / function serves the funcionality of decrypting the files in the user specified directory. This function reads the directory location input from the class variable self.directory. The process of the decryption / the steps of decryption are listed below :
+		1. Check the password specified by the user against the original password hash.
+		2. Generate the decryption key.
+		3. Decrypt all the files except the ones which are listed in the ignorefiles list.
+		4. Delete the .encryption_config file present in the user specified directory.
+		"""
+
+		# Printing the decryption message on the console screen
+		print(f'\n[ Decrypting {self.directory} ]\n')
+
+		# Launching the check() method in order to read the config file as well as check the password as well
+		if self.check(overall = True):
+			# If the check() methods returns True, then we continue
+
+			pass
+		else:
+			# If the check() method returns False, then we assume password error or config file error, we display the error message on the console screen
+
+			print(f'[ Error : Either incorrect password or errors in the config file. ]')
+			return 1
+
+		# Generating the key for the encryption
+		key = self.generatekey()
+
+		# Loading the manifest of the encrypted files from the directory
+		manifest = self.loadmanifest()
+
+		# Decrypting the contents of each file
+		# ----
+		# Filtering out the files which are to be decrypted (the files marked in the ignorefiles list are skipped)
+		tasks = []
+		details = []
+		if len(manifest) == 0:
+			# If there is no manifest in the directory (i.e., the directory was encrypted by an older version of this tool), then we continue to decrypt the files present in the directory by decoding their names
+
+			for file in listdir(self.directory):
+				# Iterating over the list of files
+
+				if file == '.encryption_config' or file == '.encryption_manifest':
+					# If the file is the config file or the manifest, then we skip it
+
+					continue
+				elif file in self.ignorefiles:
+					# If the currently iterated file is mentioned in the ignorefiles list, then we skip the current iteration
+
+					print(f'[#] Ignored : {file}')
+				else:
+					# If the currently iterated file is not mentioned in the ignorefiles list, then we add it to the list of files to be decrypted
+
+					tasks.append(file)
+					details.append(None)
+		else:
+			# If the manifest is present in the directory, then we continue to decrypt the files listed in it (the original filenames are looked up from the manifest)
+
+			for file in self.ignorefiles:
+				print(f'[#] Ignored : {file}')
+			for file in manifest:
+				tasks.append(file)
+				details.append(manifest[file])
+
+		# Decrypting the files (in parallel if more than 1 jobs are specified), the results are received in the same order as the files
+		for file, decryptedfilename, error in self.runjobs(DirectoryEncrypter.decryptfile, tasks, key, details):
+			# Iterating over the result of each file
+
+			if error == None:
+				# if there are no errors encountered during the process, then we remove the file from the manifest and display the 'decrypted' message on the console screen
+
+				manifest.pop(file, None)
+				print(f'[$] Decrypted : {decryptedfilename}')
+			else:
+				# If there are any errors encountered during the process, then we skip the current file from being decrypted
+
+				print(f'[!] Skipping : {file}')
+		del tasks, details
+
+		# Saving the manifest back with only the files which failed to decrypt (the manifest is removed if all the files are decrypted)
+		self.savemanifest(manifest)
+		# ----
+
+		# Removing the config file from the directory after confirming from the user
+		choice = input('\nRemove the config file? (y/n) : ')
+		if choice.lower() == 'yes' or choice.lower() == 'y':
+			# If the user entered the choice to delete the config file at the directory, then we continue to do so
+
+			remove(self.directory + '.encryption_config')
+			print(f'[$] Removed config file')
+			del choice
+			return 0
+		else:
+			# If the user entered the choice to not delete the config file at the directory, then we skip the process
+
+			del choice
+			return 0
+
+	def listfiles(self):
+		""" This method / function serves the functionality of listing the files which are to be encrypted in the user specified directory. If the recursive mode is specified (the class variable self.recursive), then the files in all of the sub-directories are listed as well. The config file and the manifest are never listed.
+
+		The function returns the list of the files, with their paths relative to the directory (for example, 'file.txt' or 'sub-directory/file.txt'). """
+
+		files = []
+		if self.recursive:
+			# If the recursive mode is specified, then we continue to list the files in the directory as well as all of its sub-directories
+
+			for root, folders, filenames in walk(self.directory):
+				# Iterating over each directory in the tree (in sorted order)
+
+				folders.sort()
+				for filename in sorted(filenames):
+					files.append(path.relpath(path.join(root, filename), self.directory))
+		else:
+			# If the recursive mode is not specified, then we continue to list only the files present in the directory (the sub-directories are skipped)
+
+			for filename in sorted(listdir(self.directory)):
+				if path.isfile(self.directory + filename):
+					files.append(filename)
+
+		# Removing the config file and the manifest from the list
+		return [file for file in files if file != '.encryption_config' and file != '.encryption_manifest']
+
+	def loadmanifest(self):
+		""" This method / function serves the functionality of loading the manifest (.encryption_manifest) of the user specified directory. The manifest is decrypted with the key generated from the password stored in the class variable self.password.
+
+		The function returns the manifest as a dictionary (encrypted filename -> [original filename, size, modification time]). If there is no manifest in the directory, then an empty dictionary is returned. """
+
+		if path.isfile(self.directory + '.encryption_manifest'):
+			# If the manifest exists in the directory, then we continue to load it
+
+			contents = open(self.directory + '.encryption_manifest', 'rb').read()
+			contents = CipherKernel(self.generatekey()).decrypt(b64decode(contents))
+			return loads(contents.decode())
+		else:
+			# If the manifest does not exists in the directory, then we return an empty manifest
+
+			return {}
+
+	def savemanifest(self, manifest):
+		""" This method / function serves the functionality of saving the manifest (the dictionary passed to this function) as the .encryption_manifest file of the user specified directory. The manifest is stored in a compact JSON format, encrypted with the key generated from the password stored in the class variable self.password. If the manifest is empty, then the manifest file is removed from the directory instead. """
+
+		if len(manifest) == 0:
+			# If the manifest is empty, then we continue to remove the manifest file (if present)
+
+			if path.isfile(self.directory + '.encryption_manifest'):
+				remove(self.directory + '.encryption_manifest')
+		else:
+			# If the manifest is not empty, then we continue to save it
+
+			contents = dumps(manifest, separators = (',', ':')).encode()
+			contents = b64encode(CipherKernel(self.generatekey()).encrypt(contents))
+			open(self.directory + '.encryption_manifest', 'wb').write(contents)
+
+	def checkrecord(self, file, record):
+		""" This method / function serves the functionality of checking whether an already encrypted file of the directory is modified since the last encryption or not (used in the incremental mode). The file is compared against its record from the config file ({"hash" : ..., "size" : ..., "mtime" : ...}). If the size of the file is the same and the file is not modified after the 'last_modified' timestamp of the config, then the file is treated as unchanged without reading it. Otherwise, the SHA256 hash of the file is compared with the recorded hash.
+
+		The function returns the (updated) record of the file if it is unchanged, otherwise None is returned. """
+
+		try:
+			# Getting the size and the modification time of the file
+			information = stat(self.directory + file)
+			if information.st_size != record["size"]:
+				# If the size of the file is changed, then the file is modified
+
+				return None
+			elif information.st_mtime <= self.last_modified:
+				# If the file is not modified after the last encryption, then the file is unchanged
+
+				return record
+
+			# Computing the SHA256 hash of the file (in chunks, in order to not load the entire file into the memory)
+			digest = hashlib.sha256()
+			with open(self.directory + file, 'rb') as descriptor:
+				for chunk in iter(lambda : descriptor.read(1048576), b''):
+					digest.update(chunk)
+		except Exception as e:
+			# If there are any errors encountered during the process (invalid record or the file is not accessible), then we treat the file as modified
+
+			return None
+
+		if digest.hexdigest() == record["hash"]:
+			# If the hash of the file matches with the recorded hash, then the file is unchanged (only its modification time is changed)
+
+			return {"hash" : record["hash"], "size" : information.st_size, "mtime" : information.st_mtime}
+		else:
+			# If the hash of the file does not matches with the recorded hash, then the file is modified
+
+			return None
+
+	def makerecord(self, file):
+		""" This method / function serves the functionality of creating the record ({"hash" : ..., "size" : ..., "mtime" : ...}) of an already encrypted file of the directory which has no record yet (used in the incremental mode, for the directories encrypted by the older versions). The function returns the record, or None if the file is not accessible. """
+
+		try:
+			# Computing the SHA256 hash of the file (in chunks, in order to not load the entire file into the memory)
+			information = stat(self.directory + file)
+			digest = hashlib.sha256()
+			with open(self.directory + file, 'rb') as descriptor:
+				for chunk in iter(lambda : descriptor.read(1048576), b''):
+					digest.update(chunk)
+		except OSError:
+			# If the file is not accessible, then we return None
+
+			return None
+		return {"hash" : digest.hexdigest(), "size" : information.st_size, "mtime" : information.st_mtime}
+
+	def runjobs(self, function, files, key, *arguments):
+		""" This method / function serves the functionality of running the encryption / decryption of each file (the function specified, either encryptfile() or decryptfile()) over the list of files. If the number of jobs specified in the class variable self.jobs is more than 1, then the files are processed in parallel by a pool of that many processes. Otherwise, the files are processed one by one in the current process. Any additional lists passed to this function (arguments) are passed to the function along with each file, item by item.
+
+		The function yields the results of the files in the same order as the files are listed, irrespective of the order in which they are completed. """
+
+		if self.jobs > 1 and len(files) > 1:
+			# If more than 1 jobs are specified, then we continue to distribute the files among a pool of processes
+
+			with ProcessPoolExecutor(max_workers = self.jobs) as executor:
+				# Sending the files in batches to the processes, in order to reduce the communication overhead per file
+				for result in executor.map(function, repeat(self.directory), files, repeat(key), *arguments, chunksize = max(1, min(64, len(files) // (self.jobs * 4)))):
+					yield result
+		else:
+			# If only 1 job is specified, then we continue to process the files one by one
+
+			for items in zip(files, *arguments):
+				yield function(self.directory, items[0], key, *items[1:])
+
+	@staticmethod
+	def encryptfile(directory, file, key, container = None):
+		""" This method / function serves the functionality of encrypting a single file of the directory (the contents as well as the filename), with the key specified. The contents are written in the container format if the container (CipherContainer object) is specified, otherwise in the legacy format. The file is specified by its path relative to the directory, only the name of the file is encrypted (the names of the sub-directories in the path are kept as they are). The function is defined as a static method, so that it can also be executed in the worker processes when the directory is encrypted in parallel.
+
+		The function returns a tuple (file, encrypted filename, error, details, record). If the file is encrypted successfully then the error is None, the details contains the manifest entry of the file ([original filename, size, modification time]) and the record contains the SHA256 hash, size and modification time of the encrypted file (for the incremental mode). Otherwise, the encrypted filename, the details and the record are None and the error contains the error message. """
+
+		# Creating the cipher kernel for the key
+		kernel = CipherKernel(key)
+
+		try:
+			# Noting down the details of the original file (for the manifest)
+			information = stat(directory + file)
+			details = [file, information.st_size, information.st_mtime]
+
+			# Reading the contents of the file
+			contents = open(directory + file, 'rb').read()
+
+			# Encrypting the contents of the file
+			if container == None:
+				# If the legacy format is specified, then we encrypt the base64 encoded contents and encode the cipher text to base64 format again
+
+				contents = b64encode(contents).decode()
+				text = kernel.encrypttext(contents)
+				contents = b64encode(text.encode())
+				del text
+			else:
+				# If the binary format is specified, then we encrypt the raw bytes and add the header of the container
+
+				contents = container.makeheader(len(contents)) + kernel.encrypt(contents)
+
+			# Saving the contents back to the file
+			open(directory + file, 'wb').write(contents)
+
+			# Renaming the file with a new encrypted name (URL safe base64 format is used, as the standard base64 format can contain the '/' character)
+			folder, filename = path.split(file)
+			encryptedfilename = kernel.encrypttext(filename)
+			encryptedfilename = path.join(folder, urlsafe_b64encode(encryptedfilename.encode()).decode())
+			rename(directory + file, directory + encryptedfilename)
+
+			# Recording the hash, size and modification time of the encrypted file
+			information = stat(directory + encryptedfilename)
+			record = {"hash" : hashlib.sha256(contents).hexdigest(), "size" : information.st_size, "mtime" : information.st_mtime}
+
+			# Deleting some of variables defined under this scope
+			del contents, information, folder, filename
+		except Exception as e:
+			# If there are any errors encountered during the process, then we return the error message
+
+			return (file, None, str(e), None, None)
+		else:
+			# If there are no errors encountered during the process, then we return the encrypted filename
+
+			return (file, encryptedfilename, None, details, record)
+
+	@staticmethod
+	def decryptfile(directory, file, key, details = None):
+		""" This method / function serves the functionality of decrypting a single file of the directory (the contents as well as the filename), with the key specified. If the manifest entry of the file is specified (the parameter details), then the original filename is taken from it and the original modification time of the file is restored too. Otherwise, the original filename is found by decoding the encrypted filename. The function is defined as a static method, so that it can also be executed in the worker processes when the directory is decrypted in parallel.
+
+		The function returns a tuple (file, decrypted filename, error). If the file is decrypted successfully then the error is None, otherwise the decrypted filename is None and the error contains the error message. """
+
+		# Creating the cipher kernel for the key
+		kernel = CipherKernel(key)
+
+		try:
+			# Decrypting the file names
+			if details == None:
+				# If the manifest entry of the file is not specified, then we decode the original filename from the encrypted filename (the URL safe decoding handles the standard base64 names as well)
+
+				folder, filename = path.split(file)
+				filename = urlsafe_b64decode(filename.encode()).decode()
+				decryptedfilename = path.join(folder, kernel.decrypttext(filename))
+			else:
+				# If the manifest entry of the file is specified, then we directly use the original filename from it
+
+				decryptedfilename = details[0]
+
+			# Renaming the currently iterated file with their decrypted version
+			rename(directory + file, directory + decryptedfilename)
+
+			# Reading the contents of the file (the format of the file is detected from its header)
+			with open(directory + decryptedfilename, 'rb') as descriptor:
+				header = CipherContainer().readheader(descriptor)
+				contents = descriptor.read()
+
+			if header == None:
+				# If the file is in the legacy format, then we decode the base64 format and convert the cipher text to plain text
+
+				contents = b64decode(contents).decode()
+				text = kernel.decrypttext(contents)
+				contents = decodebytes(text.encode())
+				del text
+			elif len(contents) == header[1]:
+				# If the file is in the binary format, then we decrypt the raw bytes after the header
+
+				contents = kernel.decrypt(contents)
+			else:
+				# If the length of the file does not match with the length in the header, then we raise an error with a custom message
+
+				raise ValueError(f'{file} is corrupted. Expected {header[1]} bytes after the header.')
+
+			# Saving the contents back to the file
+			open(directory + decryptedfilename, 'wb').write(contents)
+
+			# Restoring the original modification time of the file (if known from the manifest)
+			if details != None:
+				utime(directory + decryptedfilename, (details[2], details[2]))
+
+			# Deleting the variables declared under this scope
+			del contents, header
+		except Exception as e:
+			# If there are any errors encountered during the process, then we return the error message
+
+			return (file, None, str(e))
+		else:
+			# If there are no errors encountered during the process, then we return the decrypted filename
+
+			return (file, decryptedfilename, None)
+
+	def customconfigloader(self):
+		"""
+		This method / function serves the functionality of fetching the information of encryption config file for encryption / decryption of a directory. This function loads many information from the class variables like self.directory, etc. Some additional information is attached below. 
+
+		This class also accepts custom configuration from the user. Using the --use-config flag while launching the command for this, we command this tool to use a custom config file that too is specified by the user. Before encryption / decryption, we then ask the user for entering custom config in two different ways. The ways are listed below.
+		1. .encryption_config at the directory
+
+			In this mode, if there exists a file named '.encryption_config' already present in the user specified directory. Then, the tool loads the config file information from that file only. If the user wants to load information from any other way then there must not exists any file in that directory. This file is loaded in the same way the default config file is loaded in this tool (class object).
+
+		2. Custom config file location
+
+			In this mode, the user is asked to enter the file location which directs the tool to a file which contains the contents of the configuration of the encrypted directory. The file that the user will specify should have proper read permissions and the contents should be valid.
+
+		3. Custom config hash
+
+			In this mode, the user is asked to enter the hash code of the config file. Entering the complete string will be used to extract the configuration of the encrypted directory. The hash code looks something like this, as shown below.
+
+			eyJwYXNzd29yZCI6ICJiOGU5NDZlNmY2NWU3M2Q1MDlkMzlkNzBkOTYzZWNlMyIsICJpZ25vcmVmaWxlcyI6IFsidGVzdDEucG5nIiwgInRlc3QzLmJmIiwgInRlc3QyLnR4dCIsICJ0ZXN0NC5weSJdLCAiY3JlYXRlZF9vbiI6IDE2MjQzMzIxNDMuMDcyNTMzLCAibGFzdF9tb2RpZmllZCI6IDAuMH0=
+
+		This custom config feature might be a little different and odd, below are some points that will explain how it makes a difference.
+		1. Even if we specify a custom config file, we still have to specify the password for encryption and decryption.
+		2. The configuration for an encrypted directory stores other properties like ignorefiles, etc. The ignorefiles property is a list of files that are to be ignored during the encryption and decryption process.
+		"""
+
+		# Checking whether the '.encryption_config' file is present at the user specified directory
+		if '.encryption_config' in listdir(self.directory):
+			# If a config file is already present at the user specified directory, then we continue to fetch for it
+
+			try:
+				# Reading the .encryption_config file present at the user specified directory
+				print(f'[$] Config file found at {self.directory}')
+				contents = open(self.directory + '.encryption_config', 'rb').read()
+				contents = decodebytes(contents).decode()
+				contents = loads(contents)
+
+				# Filtering out the information from the contents
+				self.password_hash = contents["password"]
+				self.ignorefiles = contents["ignorefiles"]
+				del contents
+			except Exception as e:
+				# If there are any errors during the extraction of information from the config file, then we continue to skip it and do manuall information entry from the user
+
+				# Displaying the error message on the console screen
+				print(f'[!] Failed to parse the config file at {self.directory}')
+
+				# Checking if the ignore flag is marked true or not
+				if self.ignore:
+					# If the ignore flag is marked true, then we continue to ask the user for specifying the files to be ignored during the encryption / decryption
+
+					# Asking the user to enter the files that are to be ignored during the encryption / decryption process
+					files = input('\nEnter the files to be ignored during the encryption (seperate with ;)\n> ')
+					files = files.split(';')
+
+					# Inserting all the files into the ignorefiles list after validating each one of them
+					for file in files:
+						# Iterating through each file specified by the user
+
+						if path.isfile(self.directory + file):
+							# If the currently iterated file does exists, then we continue to append it to the ignorefiles list
+
+							self.ignorefiles.append(file)
+						else:
+							# If the currently iterated file does not exists, then we skip it after displaying the not found message on the console screen
+
+							print(f'[!] File skipped (not added to ignore list), not found : {file}')
+							continue
+					del files
+			else:
+				# If there are no errors encounted during the process, then we continue further with the fetched information from the config file
+
+				# Matching the user entered password from the original password hash
+				if hashlib.md5(self.password.encode()).hexdigest() == self.password_hash:
+					# If the user entered password matches with the original password hash, then we continue to validate the ignorefiles list
+
+					if type(self.ignorefiles) == list:
+						# If the data type of the ignorefiles class variable is list, then we continue
+
+						return 0
+					else:
+						# If the data type of the ignorefiles class variable is not a list, then we raise an error with a custom message
+
+						raise TypeError(f'The ignorefiles list is invalid in the config file at {self.directory}.')
+				else:
+					# If the user entered password does not matches with the original password hash, then we raise an error with a custom message
+
+					raise ValueError(f'Failed to match the entered password against the password hash in the config file at {self.directory}.')
+		else:
+			# If there are no config files found at the user specified directory, then we continue to ask the user for the config file manually
+
+			# Asking the user for the choice whether to enter the config file hash code or enter the file location for a config file that is to be used by this tool
+			choice = input(f'\n[!] Config file not found at {self.directory}\nChoose :\n1. Enter location for another config file\n2. Enter the config hash code manually\nEnter your choice : ')
+
+			# Checking the option choosed by the user
+			if choice == '1':
+				# If the user choosed the option for entering the location of another config file manually, then we continue to ask the user for the file location
+
+				choice = input('Enter the config file location : ')
+				if path.isfile(choice):
+					# If the file location specified by the user exists on the local machine, then we continue to fetch information out of it
+
+					try:
+						# Reading the .encryption_config file present at the user specified directory
+						contents = open(choice, 'rb').read()
+						contents = decodebytes(contents).decode()
+						contents = loads(contents)
+
+						# Filtering out the information from the contents
+						self.password_hash = contents["password"]
+						self.ignorefiles = contents["ignorefiles"]
+					except Exception as e:
+						# If there are any errors during the extraction of information from the config file, then we continue to skip it and do manuall information entry from the user
+
+						# Displaying the error message on the console screen
+						print(f'[!] Failed to parse the config file "{choice}"')
+
+						# Checking if the ignore flag is marked true or not
+						if self.ignore:
+							# If the ignore flag is marked true, then we continue to ask the user for specifying the files to be ignored during the encryption / decryption
+
+							# Asking the user to enter the files that are to be ignored during the encryption / decryption process
+							files = input('\nEnter the files to be ignored during the encryption (seperate with ;)\n> ')
+							files = files.split(';')
+
+							# Inserting all the files into the ignorefiles list after validating each one of them
+							for file in files:
+								# Iterating through each file specified by the user
+
+								if path.isfile(self.directory + file):
+									# If the currently iterated file does exists, then we continue to append it to the ignorefiles list
+
+									self.ignorefiles.append(file)
+								else:
+									# If the currently iterated file does not exists, then we skip it after displaying the not found message on the console screen
+
+									print(f'[!] File skipped (not added to ignore list), not found : {file}')
+									continue
+								del files
+					else:
+						# If there are no errors encounted during the process, then we continue further with the fetched information from the config file
+
+						# Matching the user entered password from the original password hash
+						if hashlib.md5(self.password.encode()).hexdigest() == self.password_hash:
+							# If the user entered password matches with the original password hash, then we continue to validate the ignorefiles list
+
+							if type(self.ignorefiles) == list:
+								# If the data type of the ignorefiles class variable is list, then we continue
+
+								return 0
+							else:
+								# If the data type of the ignorefiles class variable is not a list, then we raise an error with a custom message
+
+								raise TypeError(f'The ignorefiles list is invalid in the config file at {self.directory}.')
+						else:
+							# If the user entered password does not matches with the original password hash, then we raise an error with a custom message
+
+							raise ValueError(f'Failed to match the entered password against the password hash in the config file at {self.directory}.')
+			elif choice == '2':
+				# If the user choosed to enter the config file hash code, then we continue to ask the user to enter manually
+
+				# Asking the user to enter the hash code of the config file
+				choice = input('\nEnter the config file hash code : ')
+
+				try:
+					# Decoding the hash code to plain contents
+					contents = decodebytes(choice.encode()).decode()
+					contents = loads(contents)
+
+					# Filtering out the information from the contents
+					self.password_hash = contents["password"]
+					self.ignorefiles = contents["ignorefiles"]
+					del contents
+				except Exception as e:
+					# If there are any errors during the extraction of information from the config file, then we continue to skip it and do manuall information entry from the user
+
+					# Displaying the error message on the console screen
+					print(f'[!] Failed to parse the config file at {self.directory}')
+
+					# Checking if the ignore flag is marked true or not
+					if self.ignore:
+						# If the ignore flag is marked true, then we continue to ask the user for specifying the files to be ignored during the encryption / decryption
+
+						# Asking the user to enter the files that are to be ignored during the encryption / decryption process
+						files = input('\nEnter the files to be ignored during the encryption (seperate with ;)\n> ')
+						files = files.split(';')
+
+						# Inserting all the files into the ignorefiles list after validating each one of them
+						for file in files:
+							# Iterating through each file specified by the user
+
+							if path.isfile(self.directory + file):
+								# If the currently iterated file does exists, then we continue to append it to the ignorefiles list
+
+								self.ignorefiles.append(file)
+							else:
+								# If the currently iterated file does not exists, then we skip it after displaying the not found message on the console screen
+
+								print(f'[!] File skipped (not added to ignore list), not found : {file}')
+								continue
+						del files
+				else:
+					# If there are no errors encounted during the process, then we continue further with the fetched information from the config file
+
+					# Matching the user entered password from the original password hash
+					if hashlib.md5(self.password.encode()).hexdigest() == self.password_hash:
+						# If the user entered password matches with the original password hash, then we continue to validate the ignorefiles list
+
+						if type(self.ignorefiles) == list:
+							# If the data type of the ignorefiles class variable is list, then we continue
+
+							return 0
+						else:
+							# If the data type of the ignorefiles class variable is not a list, then we raise an error with a custom message
+
+							raise TypeError(f'The ignorefiles list is invalid in the config file at {self.directory}.')
+					else:
+						# If the user entered password does not matches with the original password hash, then we raise an error with a custom message
+
+						raise ValueError(f'Failed to match the entered password against the password hash in the config file at {self.directory}.')
+			else:
+				# If the user entered an unrecognized option, then we raise an error with custom message
+
+				raise ValueError('No such options recognized. Failed to fetch the custom config for the encryption directory.')
+
+class HashAlgorithms:
+	""" This class serves the registry of the hashing algorithms supported by the hashing tools of this module (Hash, HashCracker, DigestIndex, HashTable). Each algorithm name is resolved only once (when the module is loaded) to its hashlib constructor, thus the tools do not pick the algorithm through the if / elif chains on every call. The custom fuck algorithm is also served by the registry.
+
+	The methods of this class are static, thus they can be called directly (even in the hot loops of the crackers). Usage of this class is shown below.
+
+	HashAlgorithms.names()  # Returns the list of the supported algorithms
+	HashAlgorithms.constructor('sha256')  # Returns hashlib.sha256
+	HashAlgorithms.hexdigest('sha256', b'text')  # Returns the hex digest
+	prefix = HashAlgorithms.prefixed('sha256', b'salt')  # Returns a hashlib object already fed with the salt
+	HashAlgorithms.hexdigest('sha256', b'text', prefix)  # Returns the hex digest of b'salttext' (the prefix is copied, not re-hashed)
+	"""
+
+	# The hashing algorithms supported (the constructor of the custom fuck algorithm is None, as it is not a hashlib algorithm)
+	constructors = {name : getattr(hashlib, name) for name in ['md5', 'sha1', 'sha224', 'sha256', 'sha384', 'sha512', 'sha3_224', 'sha3_256', 'sha3_384', 'sha3_512', 'blake2b', 'blake2s']}
+	constructors['fuck'] = None
+
+	@staticmethod
+	def names():
+		""" This method / function returns the list of the names of the hashing algorithms supported. """
+
+		return list(HashAlgorithms.constructors)
+
+	@staticmethod
+	def constructor(name):
+		""" This method / function returns the prebuilt hashlib constructor of the algorithm (the parameter name). The function raises ValueError if the algorithm is not supported, or is the custom fuck algorithm (which does not have a hashlib constructor). """
+
+		if HashAlgorithms.constructors.get(name) == None:
+			# If the algorithm is not supported (or does not have a hashlib constructor), then we raise an error with a custom message
+
+			raise ValueError(f'Hashing algorithm "{name}" not supported.')
+		return HashAlgorithms.constructors[name]
+
+	@staticmethod
+	def prefixed(name, prefix):
+		""" This method / function returns a hashlib object of the algorithm (the parameter name) which is already fed with the prefix (the parameter prefix, for example a salt). The object is to be cloned using its copy() method for each plain string, thus the prefix is hashed only once. """
+
+		if type(prefix) == str:
+			# If the prefix is a string, then we encode it
+
+			prefix = prefix.encode()
+		return HashAlgorithms.constructor(name)(prefix)
+
+	@staticmethod
+	def digest(name, text, prefix = None):
+		""" This method / function serves the functionality of computing the raw digest of the plain string (the parameter text, either string or bytes) using the algorithm (the parameter name). If the parameter prefix is a hashlib object (see the prefixed() method), then it is copied and the plain string is added to it. For the custom fuck algorithm, the hash string is returned (in bytes) instead of a raw digest. """
+
+		if type(text) == str:
+			# If the plain string is a string, then we encode it
+
+			text = text.encode()
+		if name == 'fuck':
+			# If the algorithm is the custom fuck algorithm, then we return the hash string
+
+			return HashAlgorithms.fuckhash(text.decode()).encode()
+		if prefix != None:
+			# If the prefix object is specified, then we clone it and add the plain string to it
+
+			hash = prefix.copy()
+			hash.update(text)
+			return hash.digest()
+		return HashAlgorithms.constructor(name)(text).digest()
+
+	@staticmethod
+	def hexdigest(name, text, prefix = None):
+		""" This method / function serves the functionality of computing the hash of the plain string (the parameter text, either string or bytes) using the algorithm (the parameter name), in the same way as the digest() method. The function returns the hex digest (or the hash string for the custom fuck algorithm). """
+
+		if name == 'fuck':
+			# If the algorithm is the custom fuck algorithm, then we return the hash string
+
+			return HashAlgorithms.fuckhash(text if type(text) == str else text.decode())
+		if type(text) == str:
+			# If the plain string is a string, then we encode it
+
+			text = text.encode()
+		if prefix != None:
+			# If the prefix object is specified, then we clone it and add the plain string to it
+
+			hash = prefix.copy()
+			hash.update(text)
+			return hash.hexdigest()
+		return HashAlgorithms.constructor(name)(text).hexdigest()
+
+	@staticmethod
+	def fuckhash(text):
+		""" This method / function serves the functionality of creating the hash of the plain string (the parameter text) using the custom fuck algorithm. The key is generated from the characters of the text, the text is shifted using the key, encoded into base64 format and each character of it is then written as 'fuck<char code>' seperated by '-'. The function returns the hash string back. """
+
+		# Generating the key (the sum of the char codes plus the length of the text) and shifting the characters of the text
+		key = sum([ord(character) for character in text]) + len(text)
+		text = b64encode(CipherKernel(key).encrypttext(text).encode()).decode()
+
+		# Making the 'fuck' string out of the semi encrypted text
+		return '-'.join([f'fuck{ord(character)}' for character in text])
+
+class DigestIndex:
+	""" This class serves the functionality of matching the hashes of the plain strings against one or more target hashes (the original hashes to be cracked), used by the dictionary attacks of the Hash and HashCracker classes.
+
+	Instead of computing every hashing algorithm for every plain string and comparing each hex digest one after another, the targets are parsed only once. The candidate algorithms of each target are inferred from the length and format of the hash (for example, a 40 character hex string can only be a sha1 hash, a 64 character hex string can be a sha256, sha3_256 or blake2s hash, and the hashes starting with 'fuck' are of the custom fuck algorithm). The targets are then stored as raw digest bytes in a lookup table per algorithm. Thus for each plain string, only the candidate algorithms are computed (once each, irrespective of the number of targets) and each digest is checked against all of the targets of that algorithm in a single lookup.
+
+	Usage of this class is shown below.
+
+	index = DigestIndex(targets = ['<hash 1>', '<hash 2>'], algorithm = None)
+	for algorithm, target in index.match(b'someplainstring123'):
+		index.remove(target)
+	"""
+
+	def __init__(self, targets, algorithm = None):
+		# Setting some class properties
+		# ----
+		# The hashing algorithms which produces the hex digests of each length
+		self.lengths = {
+			32 : ['md5'],
+			40 : ['sha1'],
+			56 : ['sha224', 'sha3_224'],
+			64 : ['sha256', 'sha3_256', 'blake2s'],
+			96 : ['sha384', 'sha3_384'],
+			128 : ['sha512', 'sha3_512', 'blake2b'],
+		}
+
+		# The lookup table of the targets for each algorithm (algorithm -> {raw digest : target}), the constructors of the algorithms, the targets which are yet to be matched and the targets which are not recognized
+		self.index = {}
+		self.constructors = {}
+		self.targets = set()
+		self.unknown = []
+		# ----
+
+		# Adding the targets to the index
+		if type(targets) == str:
+			# If a single target is specified, then we convert it to a list
+
+			targets = [targets]
+		for target in targets:
+			self.add(target, algorithm)
+
+	def add(self, target, algorithm = None):
+		""" This method / function serves the functionality of adding a target hash to the index. The candidate algorithms of the target are inferred from its length and format, and if an algorithm is specified (the parameter algorithm), then only that algorithm is used (if it is a candidate).
+
+		The function returns True if the target is added, and returns False if the target is not recognized (the target is then listed in the class variable self.unknown). """
+
+		target = target.strip()
+		algorithms, digest = self.parse(target, algorithm)
+		if len(algorithms) == 0:
+			# If there are no candidate algorithms for the target, then it is not recognized
+
+			self.unknown.append(target)
+			return False
+
+		# Adding the target to the lookup table of each candidate algorithm
+		for item in algorithms:
+			if item not in self.index:
+				# If the algorithm is not yet in the index, then we create its lookup table and load its constructor
+
+				self.index[item] = {}
+				if item != 'fuck':
+					self.constructors[item] = HashAlgorithms.constructor(item)
+			self.index[item][digest] = target
+		self.targets.add(target)
+		return True
+
+	def parse(self, target, algorithm = None):
+		""" This method / function serves the functionality of parsing a hash (the parameter target), i.e., inferring its candidate algorithms from its length and format, and converting it to the form in which it is compared (the raw digest bytes of a hex digest, or the string itself for the custom fuck algorithm). If an algorithm is specified (the parameter algorithm), then only that algorithm is kept (if it is a candidate).
+
+		The function returns a tuple (list of candidate algorithms, digest). The list is empty if the hash is not recognized. """
+
+		if target.startswith('fuck'):
+			# If the target starts with 'fuck', then the target is of the custom fuck algorithm (compared as the string itself)
+
+			algorithms = ['fuck']
+			digest = target
+		else:
+			# If the target does not start with 'fuck', then we continue to parse it as a hex digest
+
+			try:
+				digest = bytes.fromhex(target)
+			except ValueError:
+				# If the target is not a valid hex string, then it is not recognized
+
+				return ([], None)
+			algorithms = self.lengths.get(len(target), [])
+
+		# Filtering the candidate algorithms as per the algorithm specified
+		if algorithm != None:
+			algorithms = [item for item in algorithms if item == algorithm]
+		return (algorithms, digest)
+
+	def remove(self, target):
+		""" This method / function serves the functionality of removing a target hash from the index (once it is matched). The algorithms which do not have any targets left are removed as well, thus they are no longer computed. """
+
+		for algorithm in list(self.index):
+			# Iterating over the lookup table of each algorithm
+
+			for digest in [digest for digest, item in self.index[algorithm].items() if item == target]:
+				del self.index[algorithm][digest]
+			if len(self.index[algorithm]) == 0:
+				# If there are no targets left for the algorithm, then we remove the algorithm
+
+				del self.index[algorithm]
+				self.constructors.pop(algorithm, None)
+		self.targets.discard(target)
+
+	def match(self, word):
+		""" This method / function serves the functionality of checking a plain string (the parameter word, in bytes) against all of the targets in the index. Each of the candidate algorithms is computed once, and the raw digest is looked up in the table of that algorithm.
+
+		The function returns a list of tuples (algorithm, target) of the targets matched (an empty list if none are matched). """
+
+		matches = []
+		for algorithm, digests in self.index.items():
+			# Iterating over the lookup table of each algorithm
+
+			if algorithm == 'fuck':
+				# If the algorithm is the custom fuck algorithm, then we compute it on the decoded plain string
+
+				try:
+					digest = HashAlgorithms.fuckhash(word.decode())
+				except UnicodeDecodeError:
+					continue
+			else:
+				# If the algorithm is one of the hashlib algorithms, then we compute the raw digest
+
+				digest = self.constructors[algorithm](word).digest()
+			if digest in digests:
+				matches.append((algorithm, digests[digest]))
+		return matches
+
+class Hash:
+	"""
+	This class serves the functionality of hash command / tool. The features served by this class are listed below.
+	1. Creation of a hash using different algorithms
+	2. Verification of a plain string with a hash
+	3. Cracking a hash using the dictionary attack method
+
+	Hashing is a thing mostly done to the passwords (the user credentials), when storing in the web server's database.
+
+	This class serves the tasks as per the user specified inputs to the class object. There are two ways in which this class object takes in the user inputs. They are listed below.
+
+	1. Via argument tokens
+
+		In this mode,
+		The argument tokens entered by the user at the shell (command line) are passed to this class object at the 'arguments' parameters. The syntax is shown below.
+
+		Hash(arguments = [<argument-list>])
+
+		The arguments that are recognized by this class / tool are listed below.
+		--text                Used to specify the plain string for hashing
+		--algorithm           Used to specify the algorithm to be used for hashing
+		--original            Used to specify the original hash (if used for verification)
+		--task                Used to specify the task to be executed
+		--help                Used to launch the documentation mode (the help section is displayed on the console screen)
+
+		If there are any whitespaces in the inputs, then use the backslash (\). Below are some examples for the usage of this tool.
+
+		# For creating a md5 hash
+		hash --text someplainstring123 --algorithm md5 --task make
+
+		# For verifying a md5 hash
+		hash --text someplainstring123 --algorithm md5 --original <original-hash> --task verify
+
+		# For verifying a hash (algorithm not specified)
+		hash --text someplainstring123 --original <original-hash> --task verify
+
+	2. Directly passing parameters
+
+		In this mode,
+		The parameters are passed directly into the class object. The syntax for the usage is listed below.
+
+		Hash(
+			text = '<plain string>',
+			algorithm = '<hashing algorithm>',
+			original = '<original hash>',
+		)
+
+		Further processes are listed below in the form of examples.
+
+		# For creating a md5 hash
+		Hash(text = '<plain string>', algorithm = 'md5').make()
+
+		# For verifying a md5 hash
+		Hash(text = '<plain string>', algorithm = 'md5', original = '<original hash>').verify()
+
+		# For verifying a hash (algorithm not specified)
+		Hash(text = '<plain string>', original = '<original hash>').verify()
+	"""
+
+	def __init__(self, text = None, algorithm = None, original = None, arguments = None):
+		# Setting some class properties
+		# ----
+		# The hashing algorithm supported by this class
+		self._algorithms_supported = [
+			'md5',
+			'sha1',
+			'sha224',
+			'sha256',
+			'sha384',
+			'sha512',
+			'sha3_224',
+			'sha3_256',
+			'sha3_384',
+			'sha3_512',
+			'blake2b',
+			'blake2s',
+			'fuck',
+		]
+		# ----
+
+		# Checking if arguments provided or just the parameters directly
+		if arguments == None:
+			# If the arguments are not passed to this function by the user, then we continue to use the default provided values
+
+			self.text = text
+			self.algorithm = algorithm
+			self.original = original
+		else:
+			# If the arguments are passed to this function by the user, then we continue to parse the arguments
+
+			# Parsing the arguments entered to this function
+			# ----
+			# Setting the default value of the variables to None
+			self.text = None
+			self.algorithm = None
+			self.original = None
+			self.task = None
+			self.documentation = False
+
+			# Iterating through each argument to filter out the values
+			for index, argument in enumerate(arguments):
+				# Iterating through each argument item
+
+				if argument == '--text':
+					# If the argument is for specifying the text, then we continue to parse the next argument as the entered value
+
+					try:
+						self.text = arguments[index + 1]
+					except IndexError:
+						# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
+
+						continue
+
+				if argument == '--algorithm':
+					# If the argument is for specifying the algorithm, then we continue to parse the next argument as the entered value
+
+					try:
+						self.algorithm = arguments[index + 1]
+					except IndexError:
+						# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
+
+						continue
+
+				if argument == '--original':
+					# If the argument is for specifying the original, then we continue to parse the next argument as the entered value
+
+					try:
+						self.original = arguments[index + 1]
+					except IndexError:
+						# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
+
+						continue
+
+				if argument == '--task':
+					# If the argument is for specifying the task (making hash / verifying hash), then we continue to parse the next argument as the entered value
+
+					try:
+						self.task = arguments[index + 1]
+					except IndexError:
+						# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
+
+						continue
+
+				if argument == '--help':
+					# If the argument is for specifying the help, then we continue to mark the documentation mode to be true
+
+					self.documentation = True
+			# ----
+
+			# Checking whether the task is to be in documentation mode or execution mode
+			if self.documentation:
+				# If the user specified the documentation mode, then we continue to display the help text on the console screen
+
+				print('hash\nUsage : hash <arguments>\n\n"hash" is a tool which serves the functionality of converting a plain text into a hash (encrypted format). Hashing is used for information security, search over internet for more information. There are several hashing algorithms available like - md5, sha1, sha224, etc. There are some custom algorithms too in the tool, like - fuck, etc. You can create as well as verify hashes using this tool.\n\nArguments are :\n--text                Used to specify the plain text for hashing\n--original            Used to specify the original hash in case of hash verify\n--algorithm  Used to specify the algorithm required for hashing\n--task  Used to specify whether to make / verify\n--help(\t\t\t  Used to display this help text\n\nPoints to be noted :\n1. For more advanced usage of the tool, along with examples, check out the documentation.\n2. Plain text input should not include any whitespace, or else any sort of errors might be encountered.\n\nCheck out the docs for more info.')
+			else:
+				# If the user specified the execution mode, then we continue to execute the task
+
+				# Validating the user entered inputs
+				# ----
+				# Validating the user entered plain string
+				if type(self.text) == str:
+					# If the user entered plain string is of a string data type, then we continue to encode it in the byte format
+
+					self.text = self.text.encode()
+				elif type(self.text) == bytes:
+					# If the user entered plain string is of a bytes data type, then we continue
+
+					pass
+				else:
+					# If the user entered plain string is neither of string data type nor bytes data type, then we raise an error with a custom message
+
+					raise TypeError('Plain string invalid.')
+				# ----
+
+				# Checking the task specified and executing as per user specified
+				# ----
+				if self.task == None:
+					# If the task is not specified by the user, then we raise an error with custom message
+
+					raise SyntaxError('Task not specified.')
+				elif self.task == 'make':
+					# If the task specified by the user is for making hash / generating the hash, then we continue to do so
+
+					self.make()
+				elif self.task == 'verify':
+					# If the task specified by the user is for verifying hash, then we continue to do so
+
+					if self.verify():
+						# If the plain string matches with the original hash, then we display the success message on the console screen
+
+						print(f'[$] Hash verified : The plain string matches with the original hash')
+					else:
+						# If the plain string does not match with the original hash, then we display the error message on the console screen
+
+						print(f'[!] Hash not verified : The plain string does not match with the original hash')
+				else:
+					# If the task specified by the user is not recognized, then we raise an error with a custom message
+
+					raise SyntaxError('Task not recognized.')
+				del self.task
+				# ----
+
+	def make(self):
+		""" This method / function serves the functionality of conversion of a plain string into hashed format using the specified algorithm. The values of the text, and algorithm are fetched from the class variables self.text, self.algorithm. """
+
+		# Checking the algorithm specified by the user
+		# ----
+		if self.algorithm == None:
+			# If the algorithm parameter is not specified by the user, then we display the error message on the console screen
+
+			print(f'[ Error : Hashing algorithm not specified. ]')
+			return 0
+		else:
+			# If the algorithm parameter is specified by the user, then we continue for further validation
+
+			# Checking the data type of the algorithm parameter input
+			if type(self.algorithm) == str:
+				# If the data type of the algorithm parameter input is string type, then we continue
+
+				pass
+			else:
+				# If the data type of the algorithm parameter input is not a string type, then we display the error message on the console screen
+
+				print(f'[ Error : Hashing algorithm is invalid. ]')
+				return 0
+		# ----
+
+		# Making the hash of the plain string using the algorithm registry
+		try:
+			hash = HashAlgorithms.hexdigest(self.algorithm, self.text)
+		except ValueError:
+			# If the algorithm specified by the user is not supported, then we display the error message on the console screen
+
+			print(f'[ Error : Hashing algorithm "{self.algorithm}" not supported. ]')
+			return 0
+
+		# Finally after completing the process, we return the already formed hash back to the user
+		print(f'[$] Hash : {hash}')  # Displaying the generated hash on the console screen
+		return hash
+
+	def verify(self):
+		""" This method / function serves the functionality of verifying a plain with a hash. The plain string, the hashing algorithm and the original string is fetched from the class variables self.text, self.algorithm, self.original.
+
+		If the hashing algorithm is specified by the user, then we just check for the specific hashing algorithm.
+		Otherwise, this function checks for all the functions one by one and verifies the plain text with the original hash.
+
+		This function can be used when we are verifying the user entered plain password against the hash of the password stored in the database. This is one of the implementation of this password in a Login System.
+		"""
+
+		# Checking the self.original class variable before executing any process further
+		# ----
+		if self.original == None:
+			# If the self.original variable is not defined / specified by the user, then we display the error message on the console screen
+
+			print(f'[ Error : The original hash is not specified. ]')
+			return 0
+		else:
+			# If the self.original class variable is defined, then we proceed for further validation
+
+			if type(self.original) == str:
+				# If the type of the variable self.original is string, then we continue for further validation
+
+				if len(self.original) == 0:
+					# If the length of the string stored in self.original variable is 0, then we display the error message on the console screen
+
+					print(f'[ Error : The original hash specified is invalid. ]')
+					return 0
 				else:
-					# If the user entered password does not matches with the original password hash, then we display the warning to the user about the password discontinuity
+					# If the length of the string stored in self.original variable is not 0, then we continue
 
-					print(f'[!] Password match failed with the original password hash')
-					return 1
+					pass
 			else:
-				# If the user choosed the option for skipping the loading process, then we continue to delete the config file present at the directory
-
-				remove(self.directory + '.encryption_config')
-			del choice
+				# If the type of the variable self.original is not string, then we display the error message on the console screen
 
-		# Encrypting the contents of each file
+				print(f'[ Error : The original hash specified is invalid. ]')
+				return 0
 		# ----
-		for file in files:
-			# Iterating over the list of the files
 
-			try:
-				# Ignoring the file if marked in the ignorefiles list
-				if file in self.ignorefiles:
-					# If the file is marked at the ignore file list, then we skip the encryption part for the currently iterated file
+		# Checking the plain string against the original hash (if the hashing algorithm is specified by the user, then only that algorithm is checked, else all of the candidate algorithms inferred from the original hash are checked)
+		if len(DigestIndex(self.original, self.algorithm).match(self.text)) != 0:
+			# If the hash generated from the plain text matches with the original hash, then we return True
 
-					print(f'[#] Ignored : {file}')
-					continue
+			return True
+		else:
+			# If the hash generated from the plain text does not matches with the original hash, then we return False
 
-				# Reading the contents of the file
-				contents = open(self.directory + file, 'rb').read()
-				contents = b64encode(contents).decode()
+			return False
 
-				# Encrypting the contents of the file
-				text = ''
-				for character in contents:
-					# Iterating through each character in the plain text
+	@staticmethod
+	def dictionarycracker(original = None, wordlist = None, hashes = None, algorithm = None, arguments = None):
+		""" This method / function serves the functionality of cracking the hash with finding the original plain text via the dictionary method. All the values are custom passed into this function, instead of passing first into the main class object. The dictionary method is explained below. 
 
-					text += chr((ord(character) + key) % 256)
+		Dictionary attack :
+		In this attack, the user provides a file with each line of it written with plain string. The tool then checks the hashes of each plain string with the original hash. If the hash matches, then we display the original plain string.
 
-				# Changing the encoding of the cipher text
-				contents = b64encode(text.encode())
+		In this function, the original hashes are indexed only once (see DigestIndex), i.e., the candidate algorithms of each original hash are inferred from its length and format. Per iteration of a plain string, each candidate algorithm is computed only once and the digest is checked against all of the original hashes at once. Thus multiple original hashes can be cracked in a single pass over the wordlist, and the hashes which are found are removed from the index as we go.
+		The function displays the output directly on the console screen.
 
-				# Saving the contents back to the file
-				open(self.directory + file, 'wb').write(contents)
+		The function works seperately than the class, it takes input from the user in two ways.They are listed below.
 
-				# Renaming the file with a new encrypted name
-				encryptedfilename = ''
-				for character in file:
-					# Iterating through each character in the file's original name
+		1. Via argument tokens
 
-					encryptedfilename += chr((ord(character) + key) % 256)
-				encryptedfilename = b64encode(encryptedfilename.encode()).decode()
-				rename(self.directory + file, self.directory + encryptedfilename)
+			In this mode,
+			The argument tokens entered by the user at the shell (command line) are passed to this class object at the 'arguments' parameters. The syntax is shown below.
 
-				# Deleting some of variables defined under this scope
-				del contents, encryptedfilename
-			except Exception as e:
-				# If there are any errors encountered during the process, then we skip the current image file from being encrypted
+			Hash.dictionarycracker(arguments = [<argument-list>])
 
-				self.ignorefiles.append(file)
-				print(f'[!] Skipping : {file}')
-				continue
-			else:
-				# if there are no errors encountered during the process, then we display the 'encrypted' message on the console screen
+			The arguments that are recognized by this class / tool are listed below.
+			--original            Used to specify the original hash (can be specified multiple times)
+			--hashes              Used to specify a file containing the original hashes (one hash per line)
+			--algorithm           Used to specify the hashing algorithm of the original hashes (optional, inferred from the hashes if not specified)
+			--wordlist            Used to specify the wordlist file location
+			--help                Used to launch the documentation mode (the help section is displayed on the console screen)
 
-				print(f'[$] Encrypted : {file}')
-		# ----
+			If there are any whitespaces in the inputs, then use the backslash (\). Below are some examples for the usage of this tool.
 
-		# Creating the config file in the directory
-		try:
-			open(self.directory + '.encryption_config', 'wb').write(b64encode(dumps({
-				"password" : hashlib.md5(self.password.encode()).hexdigest(),
-				"ignorefiles" : self.ignorefiles,
-				"created_on" : self.created_on,
-				"last_modified" : self.last_modified,
-				}).encode()))
-		except Exception as e:
-			# If there are any errors encountered during the generation of the encryption config file, then we display the error message on the console screen
+			# For cracking a hash string
+			hash dictionary-cracker --original <original-hash> --wordlist /location/to/wordlist/file
 
-			print(f'[ Error : Failed to generate the config file at {self.directory}. {e} ]')
-			return 0
-		else:
-			# If there are no errors encountered during the generation of the encryption config file, then we display the success message on the console screen
+			# For cracking multiple hash strings in a single pass
+			hash dictionary-cracker --hashes /location/to/hashes/file --wordlist /location/to/wordlist/file
 
-			print(f'[ Encryption config file created at {self.directory} ]')
-			return 0
+		2. Directly passing parameters
 
-	def decrypt(self):
-		""" This method / function serves the funcionality of decrypting the files in the user specified directory. This function reads the directory location input from the class variable self.directory. The process of the decryption / the steps of decryption are listed below :
-		1. Check the password specified by the user against the original password hash.
-		2. Generate the decryption key.
-		3. Decrypt all the files except the ones which are listed in the ignorefiles list.
-		4. Delete the .encryption_config file present in the user specified directory.
-		"""
+			In this mode,
+			The parameters are passed directly into the class object. The syntax for the usage is listed below.
 
-		# Printing the decryption message on the console screen
-		print(f'\n[ Decrypting {self.directory} ]\n')
+			Hash.dictionarycracker(
+				original = '<original hash>',  # Or a list of original hashes
+				wordlist = '/location/to/wordlist/file',
+				hashes = None,  # Optional, a file containing the original hashes
+				algorithm = None,  # Optional
+			)
 
-		# Launching the check() method in order to read the config file as well as check the password as well
-		if self.check(overall = True):
-			# If the check() methods returns True, then we continue
+		Some points to be noted :
+		1. The wordlist file should be of proper format. i.e., Each plain string on separate lines.
+		2. The original hash should be one of the hash creating under this tool only, or just with the same algorithms that are supported by this tool.
+		"""
+
+		# Checking if arguments provided or just the parameters directly
+		help = False
+		if arguments == None:
+			# If the arguments are not passed to this function by the user, then we continue to use the default provided values
 
 			pass
 		else:
-			# If the check() method returns False, then we assume password error or config file error, we display the error message on the console screen
+			# If the arguments are passed to this function by the user, then we continue to parse the arguments
 
-			print(f'[ Error : Either incorrect password or errors in the config file. ]')
-			return 1
+			# Parsing the arguments entered to this function
+			# ----
+			# Setting the default value of the variables to None
+			original = []
+			wordlist = None
+			hashes = None
+			algorithm = None
 
-		# Generating the key for the encryption
-		key = self.generatekey()
+			# Iterating through each argument to filter out the values
+			for index, argument in enumerate(arguments):
+				# Iterating through each argument item
 
-		# Getting the list of the files in the user specified directory
-		files = listdir(self.directory)
+				if argument == '--original':
+					# If the argument is for specifying the original hash, then we continue to parse the next argument as the entered value
 
-		# Removing the config file from the list (ignoring it by default)
-		files.remove('.encryption_config')
+					try:
+						original.append(arguments[index + 1])
+					except IndexError:
+						# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
 
-		# Decrypting the contents of each file
-		# ----
-		for file in files:
-			# Iterating over the list of files
+						continue
 
-			try:
-				# Checking whether the file is mentioned in the ignorefiles list or not
-				if file in self.ignorefiles:
-					# If the currently iterated file is mentioned in the ignorefiles list, then we skip the current iteration
+				if argument == '--hashes':
+					# If the argument is for specifying the file containing the original hashes, then we continue to parse the next argument as the entered value
 
-					print(f'[#] Ignored : {file}')
+					try:
+						hashes = arguments[index + 1]
+					except IndexError:
+						# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
+
+						continue
 
-				# Decrypting the file names
-				filename = b64decode(file.encode()).decode()
-				decryptedfilename = ''
-				for character in filename:
-					# Iterating over each characters in the filename
+				if argument == '--algorithm':
+					# If the argument is for specifying the hashing algorithm, then we continue to parse the next argument as the entered value
 
-					decryptedfilename += chr((ord(character) - key) % 256)
+					try:
+						algorithm = arguments[index + 1]
+					except IndexError:
+						# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
 
-				# Renaming the currently iterated file with their decrypted version
-				rename(self.directory + file, self.directory + decryptedfilename)
-				file = decryptedfilename
+						continue
 
-				# Reading the contents of the file
-				contents = open(self.directory + file, 'rb').read()
-				contents = b64decode(contents).decode()
+				if argument == '--wordlist':
+					# If the argument is for specifying the wordlist file location, then we continue to parse the next argument as the entered value
 
-				# Converting the contents of the file from cipher code to plain text
-				text = ''
-				for character in contents:
-					# Iterating over each character in the file contents
+					try:
+						wordlist = arguments[index + 1]
+					except IndexError:
+						# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
 
-					text += chr((ord(character) - key) % 256)
+						continue
 
-				# Saving the contents back to the file
-				contents = decodebytes(text.encode())
-				open(self.directory + file, 'wb').write(contents)
+				if argument == '--help':
+					# If the argument is for specifying the help, then we continue to mark the documentation mode to be true
 
-				# Deleting the variables declared under this scope
-				del filename, decryptedfilename, contents, text
-			except Exception as e:
-				# If there are any errors encountered during the process, then we skip the current image file from being decrypted
+					help = True
+			# ----
 
-				print(f'[!] Skipping : {file}')
-				continue
+		# Checking the mode whether documentation mode, or exeuction mode
+		if help:
+			# If the user asked for the execution in documentation mode, then we display the help text on the console screen
+
+			print('<-- Help for Hash dictionary cracker -->')
+		else:
+			# If the user asked for the execution in regular mode, then we continue to execute the task
+
+			# Validating the user entered information
+			# ----
+			# Checking for the user specified wordlist file
+			if type(wordlist) == str:
+				# If the wordlist file input specified by the user is a string data type, then we continue for further validation
+
+				# Checking if the user specified wordlist file exists or not
+				if path.isfile(wordlist):
+					# If the user specified wordlist file does exist on the local machine, then we continue
+
+					pass
+				else:
+					# If the user specified wordlist file does not exists, then we display the error message on the console screen
+
+					print(f'[ Error : Specified file "{wordlist}" not found ]')
+					return 0
 			else:
-				# if there are no errors encountered during the process, then we display the 'decrypted' message on the console screen
+				# If the wordlist file input specified by the user is not a string data type, then we continue for further validation
 
-				print(f'[$] Decrypted : {file}')
-		# ----
+				print(f'[ Error : Wordlist file invalid. ]')
+				return 0
 
-		# Removing the config file from the directory after confirming from the user
-		choice = input('\nRemove the config file? (y/n) : ')
-		if choice.lower() == 'yes' or choice.lower() == 'y':
-			# If the user entered the choice to delete the config file at the directory, then we continue to do so
+			# Collecting the original hashes (the targets) specified by the user
+			targets = []
+			if type(original) == str:
+				# If a single original hash is specified by the user, then we add it to the targets
 
-			remove(self.directory + '.encryption_config')
-			print(f'[$] Removed config file')
-			del choice
-			return 0
-		else:
-			# If the user entered the choice to not delete the config file at the directory, then we skip the process
+				targets.append(original)
+			elif type(original) == list or type(original) == tuple:
+				# If multiple original hashes are specified by the user, then we add each of them to the targets
 
-			del choice
+				targets += [item for item in original if type(item) == str]
+			if hashes != None:
+				# If a file containing the original hashes is specified by the user, then we continue to load the hashes from it (one hash per line)
+
+				if path.isfile(hashes):
+					# If the user specified hashes file does exist on the local machine, then we continue
+
+					with open(hashes, 'r') as file:
+						targets += [line.strip() for line in file]
+				else:
+					# If the user specified hashes file does not exists, then we display the error message on the console screen
+
+					print(f'[ Error : Specified file "{hashes}" not found ]')
+					return 0
+
+			# Checking for the original hashes input from the user
+			targets = [item.strip() for item in targets if len(item.strip()) != 0]
+			if len(targets) == 0:
+				# If there are no original hashes specified by the user, then we display the error message on the console screen
+
+				print(f'[ Error : Original hash invalid. ]')
+				return 0
+			else:
+				# If there are original hashes specified by the user, then we continue
+
+				pass
+			# ----
+
+			# Indexing the original hashes (each hash is parsed only once, the candidate algorithms are inferred from its length and format)
+			index = DigestIndex(targets, algorithm)
+			for target in index.unknown:
+				# Iterating through each of the hashes which are not recognized
+
+				print(f'[!] Unrecognized hash : {target}')
+			if len(index.targets) == 0:
+				# If none of the original hashes are recognized, then we display the error message on the console screen
+
+				print(f'[ Error : Original hash invalid. ]')
+				return 0
+
+			# Checking if the wordlist file is empty or not
+			if path.getsize(wordlist) == 0:
+				# If the wordlist file is empty, then we display the error message on the console screen
+
+				print(f'[ Error : 0 plain strings loaded from the specified wordlist file. ]')
+				return 0
+			else:
+				# If the wordlist file is not empty, then we continue
+
+				pass
+
+			# Checking the hash of each plain string (streamed from the wordlist file) against all of the original hashes (each candidate algorithm is computed only once per plain string)
+			for offset, string in HashCracker.readwordlist(wordlist):
+				# Iterating through each plain string in the wordlist file
+
+				for algorithm, target in index.match(string):
+					# Iterating through each of the original hashes matched by the plain string
+
+					print(f'[$] Original hash found : {string.decode(errors = "replace")}')
+					if len(targets) > 1:
+						# If there are multiple original hashes specified by the user, then we display the hash which is matched as well
+
+						print(f'[#] Hash ({algorithm}) : {target}')
+					index.remove(target)
+
+				if len(index.targets) == 0:
+					# If all of the original hashes are found, then we stop checking the remaining plain strings
+
+					return 0
+
+			# If the execution reaches upto this point, then we can say that the plain string for the hash(es) is not found. Then, we display the error message on the console screen
+			if len(targets) > 1:
+				# If there are multiple original hashes specified by the user, then we display the hashes which are not found
+
+				for target in index.targets:
+					print(f'[!] Original string not found : {target}')
+			else:
+				# If there is a single original hash specified by the user, then we display the error message
+
+				print(f'[!] Original string not found')
 			return 0
 
-	def customconfigloader(self):
-		"""
-		This method / function serves the functionality of fetching the information of encryption config file for encryption / decryption of a directory. This function loads many information from the class variables like self.directory, etc. Some additional information is attached below. 
+	@staticmethod
+	def bulkverify(filename = None, output = 'mismatches.csv', algorithm = None, jobs = 1, header = False, arguments = None):
+		""" This method / function serves the functionality of verifying a large number of (plain string, hash) pairs at once, read from a CSV file (the first column being the plain string, and the second column being the hash). The pairs which do not match (or whose hash is not recognized) are written to the output CSV file along with their line number and the reason. All the values are custom passed into this function, instead of passing first into the main class object.
 
-		This class also accepts custom configuration from the user. Using the --use-config flag while launching the command for this, we command this tool to use a custom config file that too is specified by the user. Before encryption / decryption, we then ask the user for entering custom config in two different ways. The ways are listed below.
-		1. .encryption_config at the directory
+		The CSV file is streamed, i.e., read in batches of 10000 rows, thus the memory used stays bounded no matter how large the file is. Within a batch, the rows are grouped by the candidate algorithms inferred from their hashes (see DigestIndex), thus each group is checked using the prebuilt constructors of its algorithms. If the number of jobs is more than 1, then the batches are verified in parallel by a pool of that many processes (with at most 4 batches per process queued at a time).
 
-			In this mode, if there exists a file named '.encryption_config' already present in the user specified directory. Then, the tool loads the config file information from that file only. If the user wants to load information from any other way then there must not exists any file in that directory. This file is loaded in the same way the default config file is loaded in this tool (class object).
+		The function takes input from the user in two ways. They are listed below.
 
-		2. Custom config file location
+		1. Via argument tokens
 
-			In this mode, the user is asked to enter the file location which directs the tool to a file which contains the contents of the configuration of the encrypted directory. The file that the user will specify should have proper read permissions and the contents should be valid.
+			In this mode,
+			The argument tokens entered by the user at the shell (command line) are passed to this function at the 'arguments' parameters. The syntax is shown below.
 
-		3. Custom config hash
+			Hash.bulkverify(arguments = [<argument-list>])
 
-			In this mode, the user is asked to enter the hash code of the config file. Entering the complete string will be used to extract the configuration of the encrypted directory. The hash code looks something like this, as shown below.
+			The arguments that are recognized by this function are listed below.
+			--input               Used to specify the CSV file containing the (plain string, hash) pairs
+			--output              Used to specify the CSV file to which the mismatches are written (default is mismatches.csv)
+			--algorithm           Used to specify the hashing algorithm of the hashes (optional, inferred from each hash if not specified)
+			--jobs                Used to specify the number of processes (default is 1)
+			--header              Used to specify that the first row of the CSV file is a header (it is skipped)
+			--help                Used to launch the documentation mode (the help section is displayed on the console screen)
 
-			eyJwYXNzd29yZCI6ICJiOGU5NDZlNmY2NWU3M2Q1MDlkMzlkNzBkOTYzZWNlMyIsICJpZ25vcmVmaWxlcyI6IFsidGVzdDEucG5nIiwgInRlc3QzLmJmIiwgInRlc3QyLnR4dCIsICJ0ZXN0NC5weSJdLCAiY3JlYXRlZF9vbiI6IDE2MjQzMzIxNDMuMDcyNTMzLCAibGFzdF9tb2RpZmllZCI6IDAuMH0=
+			Below is an example for the usage of this tool.
+
+			hash bulk-verify --input /location/to/pairs.csv --output mismatches.csv --jobs 4 --header
+
+		2. Directly passing parameters
+
+			In this mode,
+			The parameters are passed directly into the function. The syntax for the usage is listed below.
+
+			Hash.bulkverify(
+				filename = '/location/to/pairs.csv',
+				output = 'mismatches.csv',
+				algorithm = None,  # Optional
+				jobs = 1,  # Optional
+				header = False,  # Optional
+			)
+
+		The function returns 0 if all of the pairs match, or else returns 1.
+		"""
+
+		# Checking if arguments provided or just the parameters directly
+		help = False
+		if arguments == None:
+			# If the arguments are not passed to this function by the user, then we continue to use the default provided values
+
+			pass
+		else:
+			# If the arguments are passed to this function by the user, then we continue to parse the arguments
+
+			# Parsing the arguments entered to this function
+			# ----
+			# Setting the default value of the variables
+			filename = None
+			output = 'mismatches.csv'
+			algorithm = None
+			jobs = 1
+			header = False
+
+			# Iterating through each argument to filter out the values
+			for index, argument in enumerate(arguments):
+				# Iterating through each argument item
+
+				if argument == '--input':
+					# If the argument is for specifying the input CSV file, then we continue to parse the next argument as the entered value
+
+					try:
+						filename = arguments[index + 1]
+					except IndexError:
+						# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
 
-		This custom config feature might be a little different and odd, below are some points that will explain how it makes a difference.
-		1. Even if we specify a custom config file, we still have to specify the password for encryption and decryption.
-		2. The configuration for an encrypted directory stores other properties like ignorefiles, etc. The ignorefiles property is a list of files that are to be ignored during the encryption and decryption process.
-		"""
+						continue
 
-		# Checking whether the '.encryption_config' file is present at the user specified directory
-		if '.encryption_config' in listdir(self.directory):
-			# If a config file is already present at the user specified directory, then we continue to fetch for it
+				if argument == '--output':
+					# If the argument is for specifying the output CSV file, then we continue to parse the next argument as the entered value
 
-			try:
-				# Reading the .encryption_config file present at the user specified directory
-				print(f'[$] Config file found at {self.directory}')
-				contents = open(self.directory + '.encryption_config', 'rb').read()
-				contents = decodebytes(contents).decode()
-				contents = loads(contents)
+					try:
+						output = arguments[index + 1]
+					except IndexError:
+						# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
 
-				# Filtering out the information from the contents
-				self.password_hash = contents["password"]
-				self.ignorefiles = contents["ignorefiles"]
-				del contents
-			except Exception as e:
-				# If there are any errors during the extraction of information from the config file, then we continue to skip it and do manuall information entry from the user
+						continue
 
-				# Displaying the error message on the console screen
-				print(f'[!] Failed to parse the config file at {self.directory}')
+				if argument == '--algorithm':
+					# If the argument is for specifying the hashing algorithm, then we continue to parse the next argument as the entered value
 
-				# Checking if the ignore flag is marked true or not
-				if self.ignore:
-					# If the ignore flag is marked true, then we continue to ask the user for specifying the files to be ignored during the encryption / decryption
+					try:
+						algorithm = arguments[index + 1]
+					except IndexError:
+						# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
 
-					# Asking the user to enter the files that are to be ignored during the encryption / decryption process
-					files = input('\nEnter the files to be ignored during the encryption (seperate with ;)\n> ')
-					files = files.split(';')
+						continue
 
-					# Inserting all the files into the ignorefiles list after validating each one of them
-					for file in files:
-						# Iterating through each file specified by the user
+				if argument == '--jobs':
+					# If the argument is for specifying the number of jobs (processes), then we continue to parse the next argument as the entered value
 
-						if path.isfile(self.directory + file):
-							# If the currently iterated file does exists, then we continue to append it to the ignorefiles list
+					try:
+						jobs = int(arguments[index + 1])
+					except IndexError:
+						# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
 
-							self.ignorefiles.append(file)
-						else:
-							# If the currently iterated file does not exists, then we skip it after displaying the not found message on the console screen
+						continue
+					except ValueError:
+						# If the next argument is not a numeric value, then we raise an error with a custom message
 
-							print(f'[!] File skipped (not added to ignore list), not found : {file}')
-							continue
-					del files
-			else:
-				# If there are no errors encounted during the process, then we continue further with the fetched information from the config file
+						raise ValueError('Invalid number of jobs specified. Requires to be a numeric value (atleast 1).')
 
-				# Matching the user entered password from the original password hash
-				if hashlib.md5(self.password.encode()).hexdigest() == self.password_hash:
-					# If the user entered password matches with the original password hash, then we continue to validate the ignorefiles list
+				if argument == '--header':
+					# If the argument is for specifying that the first row is a header, then we continue to mark it
 
-					if type(self.ignorefiles) == list:
-						# If the data type of the ignorefiles class variable is list, then we continue
+					header = True
 
-						return 0
-					else:
-						# If the data type of the ignorefiles class variable is not a list, then we raise an error with a custom message
+				if argument == '--help':
+					# If the argument is for specifying the help, then we continue to mark the documentation mode to be true
 
-						raise TypeError(f'The ignorefiles list is invalid in the config file at {self.directory}.')
-				else:
-					# If the user entered password does not matches with the original password hash, then we raise an error with a custom message
+					help = True
+			# ----
 
-					raise ValueError(f'Failed to match the entered password against the password hash in the config file at {self.directory}.')
-		else:
-			# If there are no config files found at the user specified directory, then we continue to ask the user for the config file manually
+		# Checking the mode whether documentation mode, or exeuction mode
+		if help:
+			# If the user asked for the execution in documentation mode, then we display the help text on the console screen
 
-			# Asking the user for the choice whether to enter the config file hash code or enter the file location for a config file that is to be used by this tool
-			choice = input(f'\n[!] Config file not found at {self.directory}\nChoose :\n1. Enter location for another config file\n2. Enter the config hash code manually\nEnter your choice : ')
+			print('hash bulk-verify\nUsage : hash bulk-verify <arguments>\n\n"hash bulk-verify" is a tool which serves the functionality of verifying a large number of (plain string, hash) pairs read from a CSV file (first column is the plain string, second column is the hash). The pairs which do not match are written to the output CSV file.\n\nArguments are :\n--input               Used to specify the CSV file containing the pairs\n--output              Used to specify the CSV file for the mismatches (default is mismatches.csv)\n--algorithm           Used to specify the hashing algorithm of the hashes\n--jobs                Used to specify the number of processes to use (default is 1)\n--header              Used to skip the first row of the CSV file\n--help                Used to display this help text\n\nCheck out the docs for more info.')
+			return 0
 
-			# Checking the option choosed by the user
-			if choice == '1':
-				# If the user choosed the option for entering the location of another config file manually, then we continue to ask the user for the file location
+		# Validating the user entered information
+		# ----
+		if type(filename) != str or not path.isfile(filename):
+			# If the input CSV file specified by the user does not exists, then we display the error message on the console screen
 
-				choice = input('Enter the config file location : ')
-				if path.isfile(choice):
-					# If the file location specified by the user exists on the local machine, then we continue to fetch information out of it
+			print(f'[ Error : Specified file "{filename}" not found ]')
+			return 0
+		if type(jobs) != int or jobs < 1:
+			# If the number of jobs specified by the user is not a positive integer, then we raise an error with custom message
 
-					try:
-						# Reading the .encryption_config file present at the user specified directory
-						contents = open(choice, 'rb').read()
-						contents = decodebytes(contents).decode()
-						contents = loads(contents)
+			raise ValueError('Invalid number of jobs specified. Requires to be a numeric value (atleast 1).')
+		if algorithm != None and algorithm not in HashAlgorithms.names():
+			# If the algorithm specified by the user is not supported, then we display the error message on the console screen
 
-						# Filtering out the information from the contents
-						self.password_hash = contents["password"]
-						self.ignorefiles = contents["ignorefiles"]
-					except Exception as e:
-						# If there are any errors during the extraction of information from the config file, then we continue to skip it and do manuall information entry from the user
+			print(f'[ Error : Hashing algorithm "{algorithm}" not supported. ]')
+			return 0
+		# ----
 
-						# Displaying the error message on the console screen
-						print(f'[!] Failed to parse the config file "{choice}"')
+		started = monotonic()
+		total = 0
+		mismatched = 0
+		with open(filename, 'r', newline = '') as source, open(output, 'w', newline = '') as destination:
+			rows = csv.reader(source)
+			mismatches = csv.writer(destination)
+			mismatches.writerow(['line', 'plaintext', 'hash', 'reason'])
+			if header:
+				# If the first row is a header, then we skip it
 
-						# Checking if the ignore flag is marked true or not
-						if self.ignore:
-							# If the ignore flag is marked true, then we continue to ask the user for specifying the files to be ignored during the encryption / decryption
+				next(rows, None)
 
-							# Asking the user to enter the files that are to be ignored during the encryption / decryption process
-							files = input('\nEnter the files to be ignored during the encryption (seperate with ;)\n> ')
-							files = files.split(';')
+			# Reading the rows in batches of 10000 rows (along with their line numbers)
+			batches = Hash.readbatches(rows, 10000)
+			if jobs > 1:
+				# If more than 1 jobs are specified, then we continue to verify the batches in parallel by a pool of processes
 
-							# Inserting all the files into the ignorefiles list after validating each one of them
-							for file in files:
-								# Iterating through each file specified by the user
+				results = Hash.verifyparallel(batches, algorithm, jobs)
+			else:
+				# If only 1 job is specified, then we continue to verify the batches one by one in the current process
 
-								if path.isfile(self.directory + file):
-									# If the currently iterated file does exists, then we continue to append it to the ignorefiles list
+				results = (Hash.verifyrows(batch, algorithm) for batch in batches)
+			for count, failed in results:
+				# Iterating through the result of each batch
 
-									self.ignorefiles.append(file)
-								else:
-									# If the currently iterated file does not exists, then we skip it after displaying the not found message on the console screen
+				total += count
+				mismatched += len(failed)
+				mismatches.writerows(failed)
 
-									print(f'[!] File skipped (not added to ignore list), not found : {file}')
-									continue
-								del files
-					else:
-						# If there are no errors encounted during the process, then we continue further with the fetched information from the config file
+		elapsed = monotonic() - started
+		print(f'[$] Verified : {total} pairs ({total - mismatched} matched, {mismatched} mismatched) in {elapsed:.2f} seconds ({total / max(elapsed, 0.001):,.0f} pairs/s)')
+		if mismatched != 0:
+			# If there are any mismatches, then we display the location of the output file
 
-						# Matching the user entered password from the original password hash
-						if hashlib.md5(self.password.encode()).hexdigest() == self.password_hash:
-							# If the user entered password matches with the original password hash, then we continue to validate the ignorefiles list
+			print(f'[#] Mismatches written to : {output}')
+			return 1
+		return 0
 
-							if type(self.ignorefiles) == list:
-								# If the data type of the ignorefiles class variable is list, then we continue
+	@staticmethod
+	def readbatches(rows, size):
+		""" This method / function serves the functionality of reading the rows of a CSV reader (the parameter rows) in batches of the specified size. Each row is taken as a tuple (line number, plain string, hash), where the line number is the line of the file on which the row starts (taken from the line_num of the reader, thus the quoted fields spanning multiple lines are counted correctly). The function is a generator, it yields each batch as a list. """
 
-								return 0
-							else:
-								# If the data type of the ignorefiles class variable is not a list, then we raise an error with a custom message
+		batch = []
+		number = rows.line_num + 1
+		for row in rows:
+			# Iterating through each row
 
-								raise TypeError(f'The ignorefiles list is invalid in the config file at {self.directory}.')
-						else:
-							# If the user entered password does not matches with the original password hash, then we raise an error with a custom message
+			batch.append((number, row[0] if len(row) > 0 else '', row[1].strip() if len(row) > 1 else ''))
+			number = rows.line_num + 1
+			if len(batch) >= size:
+				# If the batch is full, then we yield it
 
-							raise ValueError(f'Failed to match the entered password against the password hash in the config file at {self.directory}.')
-			elif choice == '2':
-				# If the user choosed to enter the config file hash code, then we continue to ask the user to enter manually
+				yield batch
+				batch = []
+		if len(batch) != 0:
+			# Yielding the remaining rows
 
-				# Asking the user to enter the hash code of the config file
-				choice = input('\nEnter the config file hash code : ')
+			yield batch
 
-				try:
-					# Decoding the hash code to plain contents
-					contents = decodebytes(choice.encode()).decode()
-					contents = loads(contents)
+	@staticmethod
+	def verifyparallel(batches, algorithm, jobs):
+		""" This method / function serves the functionality of verifying the batches of rows in parallel by a pool of processes (the parameter jobs), with at most 4 batches per process queued at a time, so that the input file is never read all at once. The function is a generator, it yields the result of each batch (see the verifyrows() method) in the order in which they are completed. """
 
-					# Filtering out the information from the contents
-					self.password_hash = contents["password"]
-					self.ignorefiles = contents["ignorefiles"]
-					del contents
-				except Exception as e:
-					# If there are any errors during the extraction of information from the config file, then we continue to skip it and do manuall information entry from the user
+		with ProcessPoolExecutor(max_workers = jobs) as executor:
+			pending = set()
+			for batch in batches:
+				# Queueing the batch to the pool
+				pending.add(executor.submit(Hash.verifyrows, batch, algorithm))
 
-					# Displaying the error message on the console screen
-					print(f'[!] Failed to parse the config file at {self.directory}')
+				if len(pending) >= jobs * 4:
+					# If enough batches are queued, then we wait for atleast one of them to complete before queueing more
 
-					# Checking if the ignore flag is marked true or not
-					if self.ignore:
-						# If the ignore flag is marked true, then we continue to ask the user for specifying the files to be ignored during the encryption / decryption
+					done, pending = wait(pending, return_when = FIRST_COMPLETED)
+					for future in done:
+						yield future.result()
 
-						# Asking the user to enter the files that are to be ignored during the encryption / decryption process
-						files = input('\nEnter the files to be ignored during the encryption (seperate with ;)\n> ')
-						files = files.split(';')
+			# Waiting for the remaining batches to complete
+			while len(pending) > 0:
+				done, pending = wait(pending, return_when = FIRST_COMPLETED)
+				for future in done:
+					yield future.result()
 
-						# Inserting all the files into the ignorefiles list after validating each one of them
-						for file in files:
-							# Iterating through each file specified by the user
+	@staticmethod
+	def verifyrows(rows, algorithm = None):
+		""" This method / function serves the functionality of verifying a batch of rows, i.e., tuples (line number, plain string, hash). The rows are grouped by the candidate algorithms inferred from their hashes, and each group is then verified using the prebuilt constructors of its algorithms. A row matches if the hash of its plain string under any of the candidate algorithms matches the hash. The function is defined as a static method, so that it can also be executed in the worker processes.
 
-							if path.isfile(self.directory + file):
-								# If the currently iterated file does exists, then we continue to append it to the ignorefiles list
+		The function returns a tuple (number of rows, list of mismatched rows). Each mismatched row is a list [line number, plain string, hash, reason], the reason being either 'mismatch' or 'unrecognized'. """
 
-								self.ignorefiles.append(file)
-							else:
-								# If the currently iterated file does not exists, then we skip it after displaying the not found message on the console screen
+		parser = DigestIndex([])
+		groups = {}
+		failed = []
+		for number, text, target in rows:
+			# Grouping the rows by the candidate algorithms of their hashes
 
-								print(f'[!] File skipped (not added to ignore list), not found : {file}')
-								continue
-						del files
-				else:
-					# If there are no errors encounted during the process, then we continue further with the fetched information from the config file
+			algorithms, digest = parser.parse(target, algorithm)
+			if len(algorithms) == 0:
+				# If the hash is not recognized, then the row is a mismatch
 
-					# Matching the user entered password from the original password hash
-					if hashlib.md5(self.password.encode()).hexdigest() == self.password_hash:
-						# If the user entered password matches with the original password hash, then we continue to validate the ignorefiles list
+				failed.append([number, text, target, 'unrecognized'])
+			else:
+				# If the hash is recognized, then we add the row to the group of its candidate algorithms
 
-						if type(self.ignorefiles) == list:
-							# If the data type of the ignorefiles class variable is list, then we continue
+				groups.setdefault(tuple(algorithms), []).append((number, text, target, digest))
 
-							return 0
-						else:
-							# If the data type of the ignorefiles class variable is not a list, then we raise an error with a custom message
+		for algorithms, members in groups.items():
+			# Verifying each group using the constructors of its algorithms
 
-							raise TypeError(f'The ignorefiles list is invalid in the config file at {self.directory}.')
-					else:
-						# If the user entered password does not matches with the original password hash, then we raise an error with a custom message
+			functions = [(HashAlgorithms.constructor(item) if item != 'fuck' else None) for item in algorithms]
+			for number, text, target, digest in members:
+				# Iterating through each row of the group
 
-						raise ValueError(f'Failed to match the entered password against the password hash in the config file at {self.directory}.')
-			else:
-				# If the user entered an unrecognized option, then we raise an error with custom message
+				data = text.encode()
+				for function in functions:
+					if function == None:
+						# If the algorithm is the custom fuck algorithm, then we compare the hash strings
 
-				raise ValueError('No such options recognized. Failed to fetch the custom config for the encryption directory.')
+						if HashAlgorithms.fuckhash(text) == digest:
+							break
+					elif function(data).digest() == digest:
+						# If the digest matches, then the row matches
 
-class Hash:
-	"""
-	This class serves the functionality of hash command / tool. The features served by this class are listed below.
-	1. Creation of a hash using different algorithms
-	2. Verification of a plain string with a hash
-	3. Cracking a hash using the dictionary attack method
+						break
+				else:
+					# If none of the candidate algorithms matched, then the row is a mismatch
 
-	Hashing is a thing mostly done to the passwords (the user credentials), when storing in the web server's database.
+					failed.append([number, text, target, 'mismatch'])
+		return (len(rows), failed)
 
-	This class serves the tasks as per the user specified inputs to the class object. There are two ways in which this class object takes in the user inputs. They are listed below.
+class HashCracker:
+	""" This class serves the functionality of cracking a hash (finding the original plain string of the hash) via the dictionary attack or the bruteforce attack. In the bruteforce attack, every plain string of the specified character set and length range (the keyspace) is checked. Each plain string of the keyspace has an integer index (the shorter plain strings first, and then in the order of the character set, like counting in the base of the length of the character set), thus the keyspace can be split into blocks among the worker processes and resumed from any index. The class takes input from the user in two ways, they are listed below.
 
 	1. Via argument tokens
 
 		In this mode,
 		The argument tokens entered by the user at the shell (command line) are passed to this class object at the 'arguments' parameters. The syntax is shown below.
 
-		Hash(arguments = [<argument-list>])
+		HashCracker(arguments = [<argument-list>])
 
 		The arguments that are recognized by this class / tool are listed below.
-		--text                Used to specify the plain string for hashing
-		--algorithm           Used to specify the algorithm to be used for hashing
-		--original            Used to specify the original hash (if used for verification)
-		--task                Used to specify the task to be executed
+		--original            Used to specify the original hash
+		--wordlist            Used to specify the wordlist file location (for the dictionary attack)
+		--algorithm           Used to specify the hashing algorithm of the original hash (optional, inferred from the hash if not specified)
+		--length              Used to specify the maximum length of the plain string (for the bruteforce attack)
+		--min-length          Used to specify the minimum length of the plain string (for the bruteforce attack, default is 1)
+		--charset             Used to specify the character set of the plain string (for the bruteforce attack, default is alnum). Either the characters themselves, or the names lower, upper, digits, alpha, alnum, symbols, all (can be joined using +, like lower+digits)
+		--jobs                Used to specify the number of processes for the attack (default is 1)
+		--session             Used to specify the name of the session (the progress is saved to the '<session>.session' file)
+		--resume              Used to resume an interrupted session (the rest of the arguments are then loaded from the session)
 		--help                Used to launch the documentation mode (the help section is displayed on the console screen)
 
-		If there are any whitespaces in the inputs, then use the backslash (\). Below are some examples for the usage of this tool.
+		Below are some examples for the usage of this tool.
 
-		# For creating a md5 hash
-		hash --text someplainstring123 --algorithm md5 --task make
+		# For cracking a hash string using 4 processes
+		hash crack --original <original-hash> --wordlist /location/to/wordlist/file --jobs 4
 
-		# For verifying a md5 hash
-		hash --text someplainstring123 --algorithm md5 --original <original-hash> --task verify
+		# For cracking a hash string of upto 6 lowercase letters and digits
+		hash crack --original <original-hash> --length 6 --charset lower+digits --jobs 4
 
-		# For verifying a hash (algorithm not specified)
-		hash --text someplainstring123 --original <original-hash> --task verify
+		# For resuming an interrupted session
+		hash crack --resume <session-name>
 
 	2. Directly passing parameters
 
 		In this mode,
-		The parameters are passed directly into the class object. The syntax for the usage is listed below.
+		The parameters are passed directly into the class object, and then the methods are called. The syntax for the usage is listed below.
 
-		Hash(
-			text = '<plain string>',
-			algorithm = '<hashing algorithm>',
+		cracker = HashCracker(
 			original = '<original hash>',
+			wordlist = '/location/to/wordlist/file',
+			algorithm = None,  # Optional
+			jobs = 1,  # Optional
+			session = None,  # Optional
+			resume = None,  # Optional
 		)
+		cracker.dictionaryattack()
 
-		Further processes are listed below in the form of examples.
-
-		# For creating a md5 hash
-		Hash(text = '<plain string>', algorithm = 'md5').make()
-
-		# For verifying a md5 hash
-		Hash(text = '<plain string>', algorithm = 'md5', original = '<original hash>').verify()
+		cracker = HashCracker(
+			original = '<original hash>',
+			plainstringlength = 6,
+			minlength = 1,  # Optional
+			charset = 'lower+digits',  # Optional
+		)
+		cracker.bruteforceattack()
 
-		# For verifying a hash (algorithm not specified)
-		Hash(text = '<plain string>', original = '<original hash>').verify()
+	The progress of the attack is saved to the session file every 5 seconds (and when interrupted by Ctrl+C), i.e., the byte offset upto which each shard of the wordlist is checked (or the index upto which the keyspace is checked), the original hash and the algorithms tried. If the session name is not specified, then it is generated from the original hash and the wordlist. Once the attack completes, the session file is removed.
 	"""
 
-	def __init__(self, text = None, algorithm = None, original = None, arguments = None):
+	def __init__(self, original = None, wordlist = None, algorithm = None, jobs = 1, session = None, resume = None, plainstringlength = None, minlength = 1, charset = 'alnum', arguments = None):
 		# Setting some class properties
 		# ----
-		# The hashing algorithm supported by this class
-		self._algorithms_supported = [
-			'md5',
-			'sha1',
-			'sha224',
-			'sha256',
-			'sha384',
-			'sha512',
-			'sha3_224',
-			'sha3_256',
-			'sha3_384',
-			'sha3_512',
-			'blake2b',
-			'blake2s',
-			'fuck',
-		]
+		# The interval (in seconds) at which the session is saved, and the session loaded when resumed
+		self.saveinterval = 5
+		self.checkpoint = None
+
+		# The named character sets for the bruteforce attack, and the number of plain strings checked by a worker at a time
+		self.charsets = {
+			'lower' : ascii_lowercase,
+			'upper' : ascii_uppercase,
+			'digits' : digits,
+			'alpha' : ascii_lowercase + ascii_uppercase,
+			'alnum' : ascii_lowercase + ascii_uppercase + digits,
+			'symbols' : punctuation,
+			'all' : ascii_lowercase + ascii_uppercase + digits + punctuation,
+		}
+		self.blocksize = 65536
 		# ----
 
 		# Checking if arguments provided or just the parameters directly
+		self.documentation = False
 		if arguments == None:
-			# If the arguments are not passed to this function by the user, then we continue to use the default provided values
+			# If the arguments are not passed to this class object by the user, then we continue to use the default provided values
 
-			self.text = text
-			self.algorithm = algorithm
 			self.original = original
+			self.wordlist = wordlist
+			self.algorithm = algorithm
+			self.jobs = jobs
+			self.session = session
+			self.resume = resume
+			self.plainstringlength = plainstringlength
+			self.minlength = minlength
+			self.charset = charset
 		else:
-			# If the arguments are passed to this function by the user, then we continue to parse the arguments
+			# If the arguments are passed to this class object by the user, then we continue to parse the arguments
 
-			# Parsing the arguments entered to this function
+			# Parsing the arguments entered to this class object
 			# ----
-			# Setting the default value of the variables to None
-			self.text = None
-			self.algorithm = None
+			# Setting the default value of the variables
 			self.original = None
-			self.task = None
-			self.documentation = False
+			self.wordlist = None
+			self.algorithm = None
+			self.jobs = 1
+			self.session = None
+			self.resume = None
+			self.plainstringlength = None
+			self.minlength = 1
+			self.charset = 'alnum'
 
 			# Iterating through each argument to filter out the values
 			for index, argument in enumerate(arguments):
 				# Iterating through each argument item
 
-				if argument == '--text':
-					# If the argument is for specifying the text, then we continue to parse the next argument as the entered value
+				if argument == '--original':
+					# If the argument is for specifying the original hash, then we continue to parse the next argument as the entered value
 
 					try:
-						self.text = arguments[index + 1]
+						self.original = arguments[index + 1]
+					except IndexError:
+						# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
+
+						continue
+
+				if argument == '--wordlist':
+					# If the argument is for specifying the wordlist file location, then we continue to parse the next argument as the entered value
+
+					try:
+						self.wordlist = arguments[index + 1]
 					except IndexError:
 						# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
 
 						continue
 
 				if argument == '--algorithm':
-					# If the argument is for specifying the algorithm, then we continue to parse the next argument as the entered value
+					# If the argument is for specifying the hashing algorithm, then we continue to parse the next argument as the entered value
 
 					try:
 						self.algorithm = arguments[index + 1]
@@ -2026,21 +4484,73 @@ class Hash:
 
 						continue
 
-				if argument == '--original':
-					# If the argument is for specifying the original, then we continue to parse the next argument as the entered value
+				if argument == '--jobs':
+					# If the argument is for specifying the number of jobs (processes) for the attack, then we continue to parse the next argument as the entered value
 
 					try:
-						self.original = arguments[index + 1]
+						self.jobs = int(arguments[index + 1])
 					except IndexError:
 						# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
 
 						continue
+					except ValueError:
+						# If the next argument is not a numeric value, then we raise an error with a custom message
 
-				if argument == '--task':
-					# If the argument is for specifying the task (making hash / verifying hash), then we continue to parse the next argument as the entered value
+						raise ValueError('Invalid number of jobs specified. Requires to be a numeric value (atleast 1).')
+
+				if argument == '--length':
+					# If the argument is for specifying the maximum length of the plain string, then we continue to parse the next argument as the entered value
 
 					try:
-						self.task = arguments[index + 1]
+						self.plainstringlength = int(arguments[index + 1])
+					except IndexError:
+						# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
+
+						continue
+					except ValueError:
+						# If the next argument is not a numeric value, then we raise an error with a custom message
+
+						raise ValueError('Invalid plain string length specified. Requires to be a numeric value (atleast 1).')
+
+				if argument == '--min-length':
+					# If the argument is for specifying the minimum length of the plain string, then we continue to parse the next argument as the entered value
+
+					try:
+						self.minlength = int(arguments[index + 1])
+					except IndexError:
+						# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
+
+						continue
+					except ValueError:
+						# If the next argument is not a numeric value, then we raise an error with a custom message
+
+						raise ValueError('Invalid plain string length specified. Requires to be a numeric value (atleast 1).')
+
+				if argument == '--charset':
+					# If the argument is for specifying the character set of the plain string, then we continue to parse the next argument as the entered value
+
+					try:
+						self.charset = arguments[index + 1]
+					except IndexError:
+						# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
+
+						continue
+
+				if argument == '--session':
+					# If the argument is for specifying the name of the session, then we continue to parse the next argument as the entered value
+
+					try:
+						self.session = arguments[index + 1]
+					except IndexError:
+						# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
+
+						continue
+
+				if argument == '--resume':
+					# If the argument is for specifying the session to be resumed, then we continue to parse the next argument as the entered value
+
+					try:
+						self.resume = arguments[index + 1]
 					except IndexError:
 						# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
 
@@ -2052,562 +4562,712 @@ class Hash:
 					self.documentation = True
 			# ----
 
-			# Checking whether the task is to be in documentation mode or execution mode
-			if self.documentation:
-				# If the user specified the documentation mode, then we continue to display the help text on the console screen
+		# Checking whether the task is to be in documentation mode or execution mode
+		if self.documentation:
+			# If the user specified the documentation mode, then we continue to display the help text on the console screen
 
-				print('hash\nUsage : hash <arguments>\n\n"hash" is a tool which serves the functionality of converting a plain text into a hash (encrypted format). Hashing is used for information security, search over internet for more information. There are several hashing algorithms available like - md5, sha1, sha224, etc. There are some custom algorithms too in the tool, like - fuck, etc. You can create as well as verify hashes using this tool.\n\nArguments are :\n--text                Used to specify the plain text for hashing\n--original            Used to specify the original hash in case of hash verify\n--algorithm  Used to specify the algorithm required for hashing\n--task  Used to specify whether to make / verify\n--help(\t\t\t  Used to display this help text\n\nPoints to be noted :\n1. For more advanced usage of the tool, along with examples, check out the documentation.\n2. Plain text input should not include any whitespace, or else any sort of errors might be encountered.\n\nCheck out the docs for more info.')
-			else:
-				# If the user specified the execution mode, then we continue to execute the task
+			print('hash crack\nUsage : hash crack <arguments>\n\n"hash crack" is a tool which serves the functionality of cracking a hash, i.e., finding the original plain string of the hash by checking the plain strings of a wordlist file (dictionary attack), or every plain string of a character set and length range (bruteforce attack). The hashing algorithm of the hash is inferred from its length and format, if not specified.\n\nArguments are :\n--original            Used to specify the original hash\n--wordlist            Used to specify the wordlist file location\n--length              Used to specify the maximum length of the plain string (bruteforce attack)\n--min-length          Used to specify the minimum length of the plain string (bruteforce attack)\n--charset             Used to specify the character set of the plain string (bruteforce attack)\n--algorithm           Used to specify the hashing algorithm of the original hash\n--jobs                Used to specify the number of processes to use (default is 1)\n--session             Used to specify the name of the session (for resuming later)\n--resume              Used to resume an interrupted session\n--help                Used to display this help text\n\nCheck out the docs for more info.')
+		else:
+			# If the user specified the execution mode, then we continue to execute the task
 
-				# Validating the user entered inputs
-				# ----
-				# Validating the user entered plain string
-				if type(self.text) == str:
-					# If the user entered plain string is of a string data type, then we continue to encode it in the byte format
+			# Loading the session to be resumed
+			if self.resume != None:
+				# If the user specified a session to be resumed, then we continue to load the details of the attack from the session file
 
-					self.text = self.text.encode()
-				elif type(self.text) == bytes:
-					# If the user entered plain string is of a bytes data type, then we continue
+				if self.loadsession() != 0:
+					# If the session could not be loaded, then we stop
 
-					pass
+					return
+
+			# Validating the user entered inputs
+			# ----
+			# Validating the original hash entered by the user
+			if type(self.original) == str:
+				# If the data type of the user specified original hash is string type, then we continue for further validation
+
+				if len(self.original) == 0:
+					# If the length of the user specified original hash is 0, then we raise an error with custom message
+
+					raise ValueError('Original hash invalid.')
 				else:
-					# If the user entered plain string is neither of string data type nor bytes data type, then we raise an error with a custom message
+					# If the length of the user specified orignal hash is not 0, then we continue
 
-					raise TypeError('Plain string invalid.')
-				# ----
+					pass
+			else:
+				# If the data type of the user specified original hash is not string type, then we raise an error with custom message
 
-				# Checking the task specified and executing as per user specified
-				# ----
-				if self.task == None:
-					# If the task is not specified by the user, then we raise an error with custom message
+				raise ValueError('Original hash invalid.')
 
-					raise SyntaxError('Task not specified.')
-				elif self.task == 'make':
-					# If the task specified by the user is for making hash / generating the hash, then we continue to do so
+			# Validating the number of jobs entered by the user
+			if type(self.jobs) != int or self.jobs < 1:
+				# If the number of jobs specified by the user is not a positive integer, then we raise an error with custom message
 
-					self.make()
-				elif self.task == 'verify':
-					# If the task specified by the user is for verifying hash, then we continue to do so
+				raise ValueError('Invalid number of jobs specified. Requires to be a numeric value (atleast 1).')
+			# ----
 
-					self.verify()
-				else:
-					# If the task specified by the user is not recognized, then we raise an error with a custom message
+			# Launching the attack if the arguments are passed
+			if arguments != None and self.wordlist != None:
+				# If the arguments are passed and the wordlist file is specified, then we continue to launch the dictionary attack
 
-					raise SyntaxError('Task not recognized.')
-				del self.task
-				# ----
+				self.dictionaryattack()
+			elif arguments != None and self.plainstringlength != None:
+				# If the arguments are passed and the plain string length is specified, then we continue to launch the bruteforce attack
 
-	def make(self):
-		""" This method / function serves the functionality of conversion of a plain string into hashed format using the specified algorithm. The values of the text, and algorithm are fetched from the class variables self.text, self.algorithm. """
+				self.bruteforceattack()
 
-		# Checking the algorithm specified by the user
-		# ----
-		if self.algorithm == None:
-			# If the algorithm parameter is not specified by the user, then we display the error message on the console screen
+	def dictionaryattack(self):
+		""" This method / function serves the functionality of the cracking the original plain string of the hashed string using the dictionary attack method.
 
-			print(f'[ Error : Hashing algorithm not specified. ]')
-			return 0
-		else:
-			# If the algorithm parameter is specified by the user, then we continue for further validation
+		The wordlist file is split into byte range shards (one per job, see the class variable self.jobs). Each shard is checked by a seperate worker process (see the crackshard() method), and as soon as any of the workers finds the original string, all of the other workers are stopped. The progress is displayed on the console screen, atmost 4 times per second. The session is saved every self.saveinterval seconds and on interrupt (Ctrl+C), thus the attack can be resumed later (see the loadsession() method). """
 
-			# Checking the data type of the algorithm parameter input
-			if type(self.algorithm) == str:
-				# If the data type of the algorithm parameter input is string type, then we continue
+		# Validating the wordlist file specified by the user
+		# ----
+		if type(self.wordlist) == str:
+			# If the data type of the wordlist input by the user is of string type, then we continue for further validation
+
+			if path.isfile(self.wordlist):
+				# If the wordlist file specified by the user exists on the local machine, then we continue
 
 				pass
 			else:
-				# If the data type of the algorithm parameter input is not a string type, then we display the error message on the console screen
+				# If the wordlist file specified by the user does not exists on the local machine, then we display the error message on the console screen
 
-				print(f'[ Error : Hashing algorithm is invalid. ]')
+				print(f'[ Error : No such file found "{self.wordlist}". ]')
 				return 0
+		else:
+			# If the data type of the wordlist input by the user is not of string type, then we display the error message on the console screen
+
+			print(f'[ Error : Wordlist file is invalid. ]')
+			return 0
 		# ----
 
-		# Checking the algorithm as per specified by the user and then executing the proper algorithm
-		if self.algorithm == 'md5':
-			# If the user specified algorithm is md5, then we continue
+		# Checking the original hash (if a specific algorithm is specified by the user, then only that algorithm is checked, else all of the candidate algorithms inferred from the hash are checked)
+		if len(DigestIndex(self.original, self.algorithm).targets) == 0:
+			# If the original hash is not recognized (for the user specified algorithm), then we display the error message on the console screen
 
-			hash = hashlib.md5(self.text).hexdigest()
-		elif self.algorithm == 'sha1':
-			# If the user specified algorithm is sha1, then we continue
+			print(f'[ Error : Original hash invalid. ]')
+			return 0
 
-			hash = hashlib.sha1(self.text).hexdigest()
-		elif self.algorithm == 'sha224':
-			# If the user specified algorithm is sha224, then we continue
+		# Checking the session of the attack
+		if self.session == None:
+			# If the session name is not specified by the user, then we generate it from the original hash and the wordlist file
 
-			hash = hashlib.sha224(self.text).hexdigest()
-		elif self.algorithm == 'sha256':
-			# If the user specified algorithm is sha256, then we continue
+			self.session = 'crack-' + hashlib.md5(f'{self.original}:{path.abspath(self.wordlist)}'.encode()).hexdigest()[:8]
+		size = path.getsize(self.wordlist)
+		if self.checkpoint != None:
+			# If the attack is resumed from a session, then we continue from the offsets upto which each shard was already checked
 
-			hash = hashlib.sha256(self.text).hexdigest()
-		elif self.algorithm == 'sha384':
-			# If the user specified algorithm is sha384, then we continue
+			information = stat(self.wordlist)
+			if information.st_size != self.checkpoint["size"] or information.st_mtime != self.checkpoint["mtime"]:
+				# If the wordlist file is modified since the session was saved, then the offsets are no longer valid, thus we display the error message on the console screen
 
-			hash = hashlib.sha384(self.text).hexdigest()
-		elif self.algorithm == 'sha512':
-			# If the user specified algorithm is sha512, then we continue
+				print(f'[ Error : The wordlist file "{self.wordlist}" has been modified since the session "{self.session}" was saved. ]')
+				return 0
+			shards = [tuple(shard) for shard in self.checkpoint["shards"]]
+			print(f'[#] Resuming the session "{self.session}"')
+		else:
+			# If the attack is not resumed, then we split the wordlist file into byte range shards (one per job)
 
-			hash = hashlib.sha512(self.text).hexdigest()
-		elif self.algorithm == 'sha3_224':
-			# If the user specified algorithm is sha3_224, we continue
+			shards = [(size * index // self.jobs, size * (index + 1) // self.jobs) for index in range(self.jobs)]
+		print(f'[#] Session : {self.session} (use "hash crack --resume {self.session}" to resume if interrupted)')
 
-			hash = hashlib.sha3_224(self.text).hexdigest()
-		elif self.algorithm == 'sha3_256':
-			# If the user specified algorithm is sha3_256, we continue
+		# The event for stopping all of the workers (once the original string is found, or on interrupt), and the byte offset upto which each shard is checked
+		stop = Event()
+		offsets = Array('q', [start for start, end in shards])
+		initial = size - sum([end - start for start, end in shards])
+		started = monotonic()
+		saved = started
+		result = None
 
-			hash = hashlib.sha3_256(self.text).hexdigest()
-		elif self.algorithm == 'sha3_384':
-			# If the user specified algorithm is sha3_384, we continue
+		if len(shards) > 1:
+			# If more than 1 jobs are specified, then we continue to check the shards in parallel by a pool of processes
 
-			hash = hashlib.sha3_384(self.text).hexdigest()
-		elif self.algorithm == 'sha3_512':
-			# If the user specified algorithm is sha3_512, we continue
+			executor = ProcessPoolExecutor(max_workers = len(shards), initializer = HashCracker.initworker, initargs = (stop, offsets, True))
+		else:
+			# If only 1 job is specified, then we continue to check the entire wordlist in a thread (the current thread keeps displaying the progress and saving the session)
 
-			hash = hashlib.sha3_512(self.text).hexdigest()
-		elif self.algorithm == 'blake2b':
-			# If the user specified algorithm is blake2b, we continue
+			executor = ThreadPoolExecutor(max_workers = 1, initializer = HashCracker.initworker, initargs = (stop, offsets, False))
 
-			hash = hashlib.blake2b(self.text).hexdigest()
-		elif self.algorithm == 'blake2s':
-			# If the user specified algorithm is blake2s, we continue
+		interrupted = False
+		with executor:
+			pending = set([executor.submit(HashCracker.crackshard, self.wordlist, index, start, end, self.original, self.algorithm) for index, (start, end) in enumerate(shards)])
+			try:
+				while len(pending) > 0:
+					# Waiting for the workers (checking back every 0.25 seconds for displaying the progress)
+					done, pending = wait(pending, timeout = 0.25, return_when = FIRST_COMPLETED)
+					for future in done:
+						if future.result() != None:
+							# If the worker found the original string, then we store it (the other workers are already signaled to stop)
 
-			hash = hashlib.blake2s(self.text).hexdigest()
-		elif self.algorithm == 'fuck':
-			# If the user specified algorithm is fuck, we continue
+							result = future.result()
+					HashCracker.showprogress(size - sum([end - offsets[index] for index, (start, end) in enumerate(shards)]), size, started, initial)
 
-			# CUSTOM ALGORITHM
-			# NAME : fuck
-			# ----
-			# Generating an hash encryption key
-			key = 0
-			isEven = True
-			self.text = self.text.decode()
-			for i in self.text:
-				# Iterating over each character in the encrypted key entered by the user
-					
-				if isEven:
-					# If the current iteration is even number, then we add the char code value
-
-					key += ord(i)
-				else:
-					# If the current iteration is odd number (not even), then we subtract the char code value
+					if monotonic() - saved >= self.saveinterval and result == None:
+						# If the session was saved more than the save interval ago, then we save it again
 
-					key -= ord(i)
-			del isEven
+						self.savesession(self.wordlistdetails(shards, offsets))
+						saved = monotonic()
+			except KeyboardInterrupt:
+				# If the user interrupts the attack, then we signal the workers to stop (they are waited for while leaving the executor)
 
-			# Making the key possitive
-			if key < 0:
-				# If the key value is less than 0, then we change the negative sign to possitive by simply multiplying it with -1
+				stop.set()
+				interrupted = True
 
-				key *= (-1)
+		if interrupted:
+			# If the attack was interrupted, then we save the session (all of the workers are stopped by now, thus the offsets are final)
 
-			# Adding the length of the text to itself
-			key += len(self.text)
+			self.savesession(self.wordlistdetails(shards, offsets))
+			print(f'\n[!] Interrupted, the session "{self.session}" is saved. Use "hash crack --resume {self.session}" to resume.')
+			return 0
 
-			# Creating the cipher text from the plain text
-			text = ''
-			for character in self.text:
-				# Iterating through each character in the plain text
+		# Removing the session file, as the attack is completed
+		if path.isfile(self.sessionfile()):
+			# If the session file exists, then we remove it
 
-				text += chr((ord(character) + key) % 256)
+			remove(self.sessionfile())
 
-			# Encoding into the base64 format
-			text = b64encode(text.encode()).decode()
+		if result != None:
+			# If the original string is found, then we display the success message on the console screen
 
-			# Making the 'fuck' string out of the semi encrypted text
-			hash = ''
-			for index, character in enumerate(text):
-				# Iterating through each character in the text
+			print(f'\n[ Original string found ]\n[#] String : {result[0]}')
+		else:
+			# If we reached out of the loop, then we can assume that the wordlist file did not contained the actual password, then we display the error message on the console screen
 
-				hash += f'fuck{ord(character)}'
-				if index != len(text) - 1:
-					hash += '-' 
-			del text
-			# ----
+			print(f'\n[ Original string not found in the wordlist ]')
+		del stop, offsets, shards
+		return 0
 
-		# Finally after completing the process, we return the already formed hash back to the user
-		print(f'[$] Hash : {hash}')  # Displaying the generated hash on the console screen
-		return hash
+	def sessionfile(self):
+		""" This method / function returns the location of the session file, i.e., '<session>.session' in the current working directory. """
 
-	def verify(self):
-		""" This method / function serves the functionality of verifying a plain with a hash. The plain string, the hashing algorithm and the original string is fetched from the class variables self.text, self.algorithm, self.original.
+		if self.session.endswith('.session'):
+			# If the session name already contains the extension, then we use it as it is
 
-		If the hashing algorithm is specified by the user, then we just check for the specific hashing algorithm.
-		Otherwise, this function checks for all the functions one by one and verifies the plain text with the original hash.
+			return self.session
+		else:
+			# If the session name does not contain the extension, then we add it
 
-		This function can be used when we are verifying the user entered plain password against the hash of the password stored in the database. This is one of the implementation of this password in a Login System.
-		"""
+			return self.session + '.session'
 
-		# Checking the self.original class variable before executing any process further
-		# ----
-		if self.original == None:
-			# If the self.original variable is not defined / specified by the user, then we display the error message on the console screen
+	def wordlistdetails(self, shards, offsets):
+		""" This method / function returns the details of the dictionary attack to be saved in the session, i.e., the byte offset upto which each shard of the wordlist is checked (the parameter offsets), and the details of the wordlist file to validate the session on resume. """
 
-			print(f'[ Error : The original hash is not specified. ]')
-			return 0
-		else:
-			# If the self.original class variable is defined, then we proceed for further validation
+		information = stat(self.wordlist)
+		return {
+			"task" : "dictionary",
+			"wordlist" : path.abspath(self.wordlist),
+			"size" : information.st_size,
+			"mtime" : information.st_mtime,
+			"shards" : [[offsets[index], end] for index, (start, end) in enumerate(shards)],
+			}
 
-			if type(self.original) == str:
-				# If the type of the variable self.original is string, then we continue for further validation
+	def savesession(self, details):
+		""" This method / function serves the functionality of saving the session of the attack, i.e., the details of the attack (the parameter details, see the wordlistdetails() method and the bruteforceattack() method) along with the original hash and the algorithms tried. The session is first written to a temporary file and then moved in place, thus an interruption while saving never leaves a broken session file. """
 
-				if len(self.original) == 0:
-					# If the length of the string stored in self.original variable is 0, then we display the error message on the console screen
+		details["original"] = self.original
+		details["algorithm"] = self.algorithm
+		details["algorithms"] = list(DigestIndex(self.original, self.algorithm).index)
+		open(self.sessionfile() + '.tmp', 'w').write(dumps(details))
+		replace(self.sessionfile() + '.tmp', self.sessionfile())
 
-					print(f'[ Error : The original hash specified is invalid. ]')
-					return 0
-				else:
-					# If the length of the string stored in self.original variable is not 0, then we continue
+	def loadsession(self):
+		""" This method / function serves the functionality of loading the session to be resumed (the class variable self.resume), i.e., the original hash, the algorithm, and either the wordlist file and the offsets upto which each shard of the wordlist was checked (dictionary attack), or the character set, the length range and the index upto which the keyspace was checked (bruteforce attack). The function returns 0 if the session is loaded, or else displays the error message on the console screen and returns 1. """
 
-					pass
-			else:
-				# If the type of the variable self.original is not string, then we display the error message on the console screen
+		self.session = self.resume
+		try:
+			session = loads(open(self.sessionfile(), 'r').read())
+		except FileNotFoundError:
+			# If the session file does not exists, then we display the error message on the console screen
 
-				print(f'[ Error : The original hash specified is invalid. ]')
-				return 0
-		# ----
+			print(f'[ Error : No such session found "{self.resume}". ]')
+			return 1
+		except ValueError:
+			# If the session file is not a valid JSON, then we display the error message on the console screen
 
-		# Checking if the hashing algorithm is specified by the user or not
-		if self.algorithm == None:
-			# If the hashing algorithm is not specified by the user, then we continue to check with all available hashing algorithms
+			print(f'[ Error : The session file "{self.sessionfile()}" is corrupted. ]')
+			return 1
 
-			# Checking for all the algorithms supported by his tool / class one by one
-			# ----
-			# Checking for the md5 hashing algorithm
-			hash = hashlib.md5(self.text).hexdigest()
-			if hash == self.original:
-				# If the md5 hash of the plain text matches with the original hash, then we continue
+		self.original = session["original"]
+		self.algorithm = session["algorithm"]
+		if session.get("task") == 'dictionary':
+			# If the session is of a dictionary attack, then we load the wordlist file (the number of jobs is same as the number of shards)
+
+			self.wordlist = session["wordlist"]
+			self.jobs = len(session["shards"])
+		elif session.get("task") == 'bruteforce':
+			# If the session is of a bruteforce attack, then we load the character set and the length range
 
-				return True
-			
-			# Checking for the sha1 hashing algorithm
-			hash = hashlib.sha1(self.text).hexdigest()
-			if hash == self.original:
-				# If the sha1 hash of the plain text matches with the original hash, then we continue
+			self.charset = session["charset"]
+			self.minlength = session["minlength"]
+			self.plainstringlength = session["maxlength"]
+		else:
+			# If the task of the session is not recognized, then we display the error message on the console screen
 
-				return True
+			print(f'[ Error : The session file "{self.sessionfile()}" is corrupted. ]')
+			return 1
+		self.checkpoint = session
+		return 0
 
-			# Checking for the sha224 hashing algorithm
-			hash = hashlib.sha224(self.text).hexdigest()
-			if hash == self.original:
-				# If the sha224 hash of the plain text matches with the original hash, then we continue
+	@staticmethod
+	def initworker(stop, offsets, ignoreinterrupt = False):
+		""" This method / function serves the functionality of initializing a worker of the dictionary attack, i.e., storing the shared event (set once the original string is found, or on interrupt) and the shared array of the offsets upto which each shard is checked. If the parameter ignoreinterrupt is True (for the worker processes), then the Ctrl+C is ignored by the worker, as the interrupt is handled by the main process only. """
 
-				return True
+		HashCracker.stop = stop
+		HashCracker.offsets = offsets
+		if ignoreinterrupt:
+			# If the worker is to ignore the interrupt, then we ignore the SIGINT signal
 
-			# Checking for the sha256 hashing algorithm
-			hash = hashlib.sha256(self.text).hexdigest()
-			if hash == self.original:
-				# If the sha256 hash of the plain text matches with the original hash, then we continue
+			signal(SIGINT, SIG_IGN)
 
-				return True
+	@staticmethod
+	def crackshard(wordlist, shard, start, end, original, algorithm = None):
+		""" This method / function serves the functionality of checking the plain strings of a shard of the wordlist file (the parameter shard is the index of the shard), i.e., the lines starting in the byte range start to end, against the original hash. The line which is cut at the start of the shard is skipped, as it is checked by the previous shard. The function is defined as a static method, so that it can be executed in the worker processes.
 
-			# Checking for the sha384 hashing algorithm
-			hash = hashlib.sha384(self.text).hexdigest()
-			if hash == self.original:
-				# If the sha384 hash of the plain text matches with the original hash, then we continue
+		The offset of the next plain string to be checked is reported after every 4096 plain strings (used for the progress and the session). The function stops early if the original string is found by any other worker, or the attack is interrupted. The function returns a tuple (plain string, byte offset) if the original string is found, or else returns None. """
 
-				return True
+		digests = DigestIndex(original, algorithm)
+		count = 0
+		for offset, word in HashCracker.readwordlist(wordlist, start, end):
+			# Iterating through each plain string starting in the shard
 
-			# Checking for the sha512 hashing algorithm
-			hash = hashlib.sha512(self.text).hexdigest()
-			if hash == self.original:
-				# If the sha512 hash of the plain text matches with the original hash, then we continue
+			if count % 4096 == 0:
+				# Reporting the offset and checking whether the attack is to be stopped, after every 4096 plain strings
 
-				return True
+				HashCracker.offsets[shard] = offset
+				if HashCracker.stop.is_set():
+					# If the attack is to be stopped, then we stop
 
-			# Checking for the sha3_224 hashing algorithm
-			hash = hashlib.sha3_224(self.text).hexdigest()
-			if hash == self.original:
-				# If the sha3_224 hash of the plain text matches with the original hash, then we continue
+					return None
+			count += 1
 
-				return True
+			if len(digests.match(word)) != 0:
+				# If the hash of the plain string matches with the original hash, then we signal the other workers to stop and return the plain string
 
-			# Checking for the sha3_256 hashing algorithm
-			hash = hashlib.sha3_256(self.text).hexdigest()
-			if hash == self.original:
-				# If the sha3_256 hash of the plain text matches with the original hash, then we continue
+				HashCracker.stop.set()
+				HashCracker.offsets[shard] = offset
+				return (word.decode(errors = 'replace'), offset)
 
-				return True
+		# Reporting the end of the shard
+		HashCracker.offsets[shard] = end
+		return None
 
-			# Checking for the sha3_384 hashing algorithm
-			hash = hashlib.sha3_384(self.text).hexdigest()
-			if hash == self.original:
-				# If the sha3_384 hash of the plain text matches with the original hash, then we continue
+	@staticmethod
+	def readwordlist(wordlist, start = 0, end = None):
+		""" This method / function serves the functionality of reading the plain strings of a wordlist file as a stream, i.e., line by line using the buffered reads of the file object, thus the memory used stays constant no matter how large the wordlist file is. Only the lines starting in the byte range start to end (default is the entire file) are read. If the range does not start at the beginning of a line, then the line which is cut at the start is skipped (it belongs to the previous range).
 
-				return True
+		The function is a generator, it yields a tuple (byte offset, plain string) for each line. The plain string is in bytes, without the trailing line break. The byte offset is the position of the line in the file, thus the reading can be resumed later from it. """
 
-			# Checking for the sha3_512 hashing algorithm
-			hash = hashlib.sha3_512(self.text).hexdigest()
-			if hash == self.original:
-				# If the sha3_512 hash of the plain text matches with the original hash, then we continue
+		with open(wordlist, 'rb') as file:
+			if start != 0:
+				# If the range does not start at the beginning of the file, then we skip the line which is cut at the start
 
-				return True
+				file.seek(start - 1)
+				file.readline()
+			offset = file.tell()
+			for line in file:
+				# Iterating through each line of the file
 
-			# Checking for the blake2b hashing algorithm
-			hash = hashlib.blake2b(self.text).hexdigest()
-			if hash == self.original:
-				# If the blake2b hash of the plain text matches with the original hash, then we continue
+				if end != None and offset >= end:
+					# If the line starts after the end of the range, then we stop
 
-				return True
+					break
+				yield (offset, line.rstrip(b'\r\n'))
+				offset += len(line)
 
-			# Checking for the blake2s hashing algorithm
-			hash = hashlib.blake2s(self.text).hexdigest()
-			if hash == self.original:
-				# If the blake2s hash of the plain text matches with the original hash, then we continue
+	@staticmethod
+	def showprogress(processed, total, started, initial = 0):
+		""" This method / function serves the functionality of displaying the progress of the dictionary attack on the console screen, i.e., the percentage of the wordlist checked and the speed (in MB/s, of the bytes checked after the parameter initial, i.e., in the current run). The progress line is updated atmost 4 times per second, the calls made in between are ignored. """
 
-				return True
+		now = monotonic()
+		if now - getattr(HashCracker, 'lastprogress', 0) < 0.25 and processed < total:
+			# If the progress line was updated less than 0.25 seconds ago, then we skip this update
 
-			# Checking for the fuck hashing algorithm
-			# CUSTOM ALGORITHM
-			# NAME : fuck
-			# ----
-			# Generating an hash encryption key
-			key = 0
-			isEven = True
-			self.text = self.text.decode()
-			for i in self.text:
-				# Iterating over each character in the encrypted key entered by the user
-						
-				if isEven:
-					# If the current iteration is even number, then we add the char code value
-
-					key += ord(i)
-				else:
-					# If the current iteration is odd number (not even), then we subtract the char code value
+			return
+		HashCracker.lastprogress = now
+		percentage = (processed / total * 100) if total > 0 else 100
+		speed = (processed - initial) / 1048576 / max(now - started, 0.001)
+		stdout.write('\r')
+		stdout.write(f'[ Checked {percentage:.1f} % of the wordlist ({speed:.2f} MB/s) ]')
+		stdout.flush()
 
-					key -= ord(i)
-			del isEven
+	def bruteforceattack(self):
+		""" This method / function serves the functionality of the cracking the original plain string of the hashed string using the bruteforce attack method.
 
-			# Making the key possitive
-			if key < 0:
-				# If the key value is less than 0, then we change the negative sign to possitive by simply multiplying it with -1
+		Every plain string of the character set (the class variable self.charset) with the length in the range self.minlength to self.plainstringlength is checked, in the order of the index of the plain strings in the keyspace (see the keyspace() method). The keyspace is split into blocks of self.blocksize plain strings, which are checked by a pool of self.jobs worker processes (see the crackblock() method). As soon as any of the workers finds the original string, all of the other workers are stopped. The progress (along with the number of plain strings checked per second and the estimated time left) is displayed on the console screen, atmost 4 times per second. The index upto which all of the blocks are checked is saved to the session every self.saveinterval seconds and on interrupt (Ctrl+C), thus the attack can be resumed later. """
 
-				key *= (-1)
+		# Checking the plain string length specifed by the user
+		# ----
+		if type(self.plainstringlength) == int:
+			# If the data type of the plain string length input specified by the user is integer type, then we continue for further validation
 
-			# Adding the length of the text to itself
-			key += len(self.text)
+			if self.plainstringlength < 1:
+				# If the plain string length specified by the user is less than 1, then we display the error message on the console screen
 
-			# Creating the cipher text from the plain text
-			text = ''
-			for character in self.text:
-				# Iterating through each character in the plain text
+				print(f'[ Error : Invalid plain string length speicified for the bruteforce attack. ]')
+				return 0
+			else:
+				# If the plain string length specified by the user is atleast 1, then we continue
 
-				text += chr((ord(character) + key) % 256)
+				pass
+		else:
+			# If the data type of the plain string length input specified by the user is not integer type, then we display the error message on the console screen
 
-			# Encoding into the base64 format
-			text = b64encode(text.encode()).decode()
+			print(f'[ Error : Invalid plain string input speicified for the bruteforce attack. ]')
+			return 0
 
-			# Making the 'fuck' string out of the semi encrypted text
-			hash = ''
-			for index, character in enumerate(text):
-				# Iterating through each character in the text
+		# Checking the minimum plain string length specified by the user
+		if type(self.minlength) != int or self.minlength < 1 or self.minlength > self.plainstringlength:
+			# If the minimum plain string length is not in the range 1 to the plain string length, then we display the error message on the console screen
 
-				hash += f'fuck{ord(character)}'
-				if index != len(text) - 1:
-					hash += '-' 
-			del text
-			# ----
-			if hash == self.original:
-				# If the fuck hash of the plain text matches with the original hash, then we continue
+			print(f'[ Error : Invalid minimum plain string length speicified for the bruteforce attack. ]')
+			return 0
 
-				return True
+		# Checking the character set specified by the user
+		charset = self.makecharset(self.charset)
+		if len(charset) == 0:
+			# If the character set is empty, then we display the error message on the console screen
 
-			# If none of the hashing algorithms are matched till now, then we return False
-			return False
-		else:
-			# If the hashing algorithm is specified by the user, then we continue to generate the hash out of the plain text and verify it against the orignal hash
+			print(f'[ Error : Invalid character set speicified for the bruteforce attack. ]')
+			return 0
+		# ----
 
-			# Checking the algorithm as per specified by the user and then executing the proper algorithm
-			if self.algorithm == 'md5':
-				# If the user specified algorithm is md5, then we continue
+		# Checking the original hash (if a specific algorithm is specified by the user, then only that algorithm is checked, else all of the candidate algorithms inferred from the hash are checked)
+		if len(DigestIndex(self.original, self.algorithm).targets) == 0:
+			# If the original hash is not recognized (for the user specified algorithm), then we display the error message on the console screen
 
-				hash = hashlib.md5(self.text).hexdigest()
-			elif self.algorithm == 'sha1':
-				# If the user specified algorithm is sha1, then we continue
+			print(f'[ Error : Original hash invalid. ]')
+			return 0
 
-				hash = hashlib.sha1(self.text).hexdigest()
-			elif self.algorithm == 'sha224':
-				# If the user specified algorithm is sha224, then we continue
+		# Checking the session of the attack
+		if self.session == None:
+			# If the session name is not specified by the user, then we generate it from the original hash and the keyspace
+
+			self.session = 'brute-' + hashlib.md5(f'{self.original}:{charset}:{self.minlength}:{self.plainstringlength}'.encode()).hexdigest()[:8]
+		total = sum([len(charset) ** length for length in range(self.minlength, self.plainstringlength + 1)])
+		counter = 0
+		if self.checkpoint != None:
+			# If the attack is resumed from a session, then we continue from the index upto which the keyspace was already checked
+
+			counter = self.checkpoint["counter"]
+			print(f'[#] Resuming the session "{self.session}"')
+		print(f'[#] Keyspace : {total} plain strings ({len(charset)} characters, length {self.minlength} to {self.plainstringlength})')
+		print(f'[#] Session : {self.session} (use "hash crack --resume {self.session}" to resume if interrupted)')
+
+		# The event for stopping all of the workers (once the original string is found, or on interrupt), the blocks being checked (future -> range of the block) and the index of the next block
+		stop = Event()
+		pending = {}
+		following = counter
+		checked = counter
+		initial = counter
+		started = monotonic()
+		saved = started
+		result = None
+		interrupted = False
+
+		if self.jobs > 1:
+			# If more than 1 jobs are specified, then we continue to check the blocks in parallel by a pool of processes
+
+			executor = ProcessPoolExecutor(max_workers = self.jobs, initializer = HashCracker.initworker, initargs = (stop, None, True))
+		else:
+			# If only 1 job is specified, then we continue to check the blocks in a thread (the current thread keeps displaying the progress and saving the session)
 
-				hash = hashlib.sha224(self.text).hexdigest()
-			elif self.algorithm == 'sha256':
-				# If the user specified algorithm is sha256, then we continue
+			executor = ThreadPoolExecutor(max_workers = 1, initializer = HashCracker.initworker, initargs = (stop, None, False))
 
-				hash = hashlib.sha256(self.text).hexdigest()
-			elif self.algorithm == 'sha384':
-				# If the user specified algorithm is sha384, then we continue
+		with executor:
+			try:
+				while result == None and (following < total or len(pending) > 0):
+					# Queueing the blocks to the pool (atmost 4 blocks per worker at a time)
+					while following < total and len(pending) < self.jobs * 4:
+						end = min(following + self.blocksize, total)
+						pending[executor.submit(HashCracker.crackblock, charset, self.minlength, following, end, self.original, self.algorithm)] = (following, end)
+						following = end
+
+					# Waiting for the workers (checking back every 0.25 seconds for displaying the progress)
+					done, _ = wait(pending, timeout = 0.25, return_when = FIRST_COMPLETED)
+					for future in done:
+						start, end = pending.pop(future)
+						checked += end - start
+						if future.result() != None:
+							# If the worker found the original string, then we store it (the other workers are already signaled to stop)
+
+							result = future.result()
+
+					# The index upto which all of the blocks are checked (the start of the earliest block still being checked)
+					counter = min([start for start, end in pending.values()]) if len(pending) > 0 else following
+					HashCracker.showrate(checked, total, started, initial)
+
+					if monotonic() - saved >= self.saveinterval and result == None:
+						# If the session was saved more than the save interval ago, then we save it again
+
+						self.savesession({"task" : "bruteforce", "charset" : self.charset, "minlength" : self.minlength, "maxlength" : self.plainstringlength, "counter" : counter})
+						saved = monotonic()
+			except KeyboardInterrupt:
+				# If the user interrupts the attack, then we signal the workers to stop (they are waited for while leaving the executor)
+
+				stop.set()
+				interrupted = True
+
+			# Cancelling the blocks which are not yet started
+			for future in pending:
+				future.cancel()
+
+		if interrupted:
+			# If the attack was interrupted, then we save the session (the blocks not completed are checked again on resume)
+
+			self.savesession({"task" : "bruteforce", "charset" : self.charset, "minlength" : self.minlength, "maxlength" : self.plainstringlength, "counter" : counter})
+			print(f'\n[!] Interrupted, the session "{self.session}" is saved. Use "hash crack --resume {self.session}" to resume.')
+			return 0
 
-				hash = hashlib.sha256(self.text).hexdigest()
-			elif self.algorithm == 'sha512':
-				# If the user specified algorithm is sha512, then we continue
+		# Removing the session file, as the attack is completed
+		if path.isfile(self.sessionfile()):
+			# If the session file exists, then we remove it
 
-				hash = hashlib.sha256(self.text).hexdigest()
-			elif self.algorithm == 'sha3_224':
-				# If the user specified algorithm is sha3_224, we continue
+			remove(self.sessionfile())
 
-				hash = hashlib.sha3_224(self.text).hexdigest()
-			elif self.algorithm == 'sha3_256':
-				# If the user specified algorithm is sha3_256, we continue
+		if result != None:
+			# If the original string is found, then we display the success message on the console screen
 
-				hash = hashlib.sha3_256(self.text).hexdigest()
-			elif self.algorithm == 'sha3_384':
-				# If the user specified algorithm is sha3_384, we continue
+			print(f'\n[ Original string found ]\n[#] String : {result[0]}')
+		else:
+			# If the entire keyspace is checked, then we can assume that the original string is not of the specified character set and length, then we display the error message on the console screen
 
-				hash = hashlib.sha3_384(self.text).hexdigest()
-			elif self.algorithm == 'sha3_512':
-				# If the user specified algorithm is sha3_512, we continue
+			print(f'\n[ Original string not found in the keyspace ]')
+		del stop, pending, charset
+		return 0
 
-				hash = hashlib.sha3_512(self.text).hexdigest()
-			elif self.algorithm == 'blake2b':
-				# If the user specified algorithm is blake2b, we continue
+	def makecharset(self, charset):
+		""" This method / function serves the functionality of making the character set for the bruteforce attack from the user specified value (the parameter charset). The value can contain the names of the character sets in the class variable self.charsets, and / or the characters themselves, joined using '+' (for example, 'lower+digits' or 'abc+digits'). The repeated characters are removed, keeping the order. The function returns the character set string back. """
 
-				hash = hashlib.blake2b(self.text).hexdigest()
-			elif self.algorithm == 'blake2s':
-				# If the user specified algorithm is blake2s, we continue
+		characters = ''
+		for part in charset.split('+'):
+			# Iterating through each part of the character set
 
-				hash = hashlib.blake2s(self.text).hexdigest()
-			elif self.algorithm == 'fuck':
-				# If the user specified algorithm is fuck, we continue
+			characters += self.charsets.get(part, part)
+		return ''.join(dict.fromkeys(characters))
 
-				# CUSTOM ALGORITHM
-				# NAME : fuck
-				# ----
-				# Generating an hash encryption key
-				key = 0
-				isEven = True
-				self.text = self.text.decode()
-				for i in self.text:
-					# Iterating over each character in the encrypted key entered by the user
-						
-					if isEven:
-						# If the current iteration is even number, then we add the char code value
-
-						key += ord(i)
-					else:
-						# If the current iteration is odd number (not even), then we subtract the char code value
+	@staticmethod
+	def candidate(index, charset, minlength):
+		""" This method / function serves the functionality of converting the index of a plain string in the keyspace (the parameter index) to the plain string itself. The plain strings of the length minlength comes first, then of the length minlength + 1, and so on. Within a length, the index is written in the base of the length of the character set, each digit being the position of the character in the character set. The function returns the plain string back. """
 
-						key -= ord(i)
-				del isEven
+		length = minlength
+		while index >= len(charset) ** length:
+			# Skipping the plain strings of the shorter lengths
 
-				# Making the key possitive
-				if key < 0:
-					# If the key value is less than 0, then we change the negative sign to possitive by simply multiplying it with -1
+			index -= len(charset) ** length
+			length += 1
+		characters = []
+		for _ in range(length):
+			index, position = divmod(index, len(charset))
+			characters.append(charset[position])
+		return ''.join(reversed(characters))
 
-					key *= (-1)
+	@staticmethod
+	def keyspace(charset, minlength, start, end):
+		""" This method / function serves the functionality of generating the plain strings of the keyspace in the index range start to end. The plain string at the start is found using the candidate() method, and then the following plain strings are generated by incrementing the positions of the characters (like an odometer), thus the plain strings are not converted from the index one by one.
+
+		The function is a generator, it yields a tuple (index, plain string) for each plain string. The plain string is in bytes. """
+
+		symbols = [character.encode() for character in charset]
+		positions = [charset.index(character) for character in HashCracker.candidate(start, charset, minlength)]
+		index = start
+		while index < end:
+			# Iterating through the plain strings having the same characters except the last one
+
+			prefix = b''.join([symbols[position] for position in positions[:-1]])
+			for position in range(positions[-1], len(symbols)):
+				if index >= end:
+					# If the end of the range is reached, then we stop
+
+					return
+				yield (index, prefix + symbols[position])
+				index += 1
+
+			# Incrementing the positions (carrying over to the previous characters, or to a longer plain string)
+			positions[-1] = len(symbols) - 1
+			position = len(positions) - 1
+			while position >= 0 and positions[position] == len(symbols) - 1:
+				positions[position] = 0
+				position -= 1
+			if position < 0:
+				# If all of the positions are carried over, then we continue with the plain strings of the next length
+
+				positions = [0] * (len(positions) + 1)
+			else:
+				# If the carry stops at a position, then we increment it
 
-				# Adding the length of the text to itself
-				key += len(self.text)
+				positions[position] += 1
 
-				# Creating the cipher text from the plain text
-				text = ''
-				for character in self.text:
-					# Iterating through each character in the plain text
+	@staticmethod
+	def crackblock(charset, minlength, start, end, original, algorithm = None):
+		""" This method / function serves the functionality of checking the plain strings of a block of the keyspace, i.e., the index range start to end, against the original hash. The function is defined as a static method, so that it can be executed in the worker processes.
 
-					text += chr((ord(character) + key) % 256)
+		The function stops early if the original string is found by any other worker, or the attack is interrupted (checked after every 4096 plain strings). The function returns a tuple (plain string, index) if the original string is found, or else returns None. """
 
-				# Encoding into the base64 format
-				text = b64encode(text.encode()).decode()
+		digests = DigestIndex(original, algorithm)
+		for index, word in HashCracker.keyspace(charset, minlength, start, end):
+			# Iterating through each plain string of the block
 
-				# Making the 'fuck' string out of the semi encrypted text
-				hash = ''
-				for index, character in enumerate(text):
-					# Iterating through each character in the text
+			if (index - start) % 4096 == 0 and HashCracker.stop.is_set():
+				# If the attack is to be stopped, then we stop
 
-					hash += f'fuck{ord(character)}'
-					if index != len(text) - 1:
-						hash += '-' 
-				del text
-				# ----
+				return None
 
-			# Checking the hash generated from the plain text with the original hash
-			print(hash, self.original)
-			if hash == self.original:
-				# If the hash generated from the plain text matches with the original hash, then we return True
+			if len(digests.match(word)) != 0:
+				# If the hash of the plain string matches with the original hash, then we signal the other workers to stop and return the plain string
 
-				return True
-			else:
-				# If the hash generated from the plain text does not matches with the original hash, then we return False
+				HashCracker.stop.set()
+				return (word.decode(), index)
+		return None
 
-				return False
+	@staticmethod
+	def showrate(checked, total, started, initial = 0):
+		""" This method / function serves the functionality of displaying the progress of the bruteforce attack on the console screen, i.e., the percentage of the keyspace checked, the number of plain strings checked per second (in the current run, i.e., after the parameter initial) and the estimated time left. The progress line is updated atmost 4 times per second, the calls made in between are ignored. """
+
+		now = monotonic()
+		if now - getattr(HashCracker, 'lastprogress', 0) < 0.25 and checked < total:
+			# If the progress line was updated less than 0.25 seconds ago, then we skip this update
+
+			return
+		HashCracker.lastprogress = now
+		percentage = (checked / total * 100) if total > 0 else 100
+		rate = (checked - initial) / max(now - started, 0.001)
+		left = int((total - checked) / rate) if rate > 0 else 0
+		stdout.write('\r')
+		stdout.write(f'[ Checked {percentage:.1f} % of the keyspace ({rate:,.0f} plain strings/s, {left // 3600:02d}:{left % 3600 // 60:02d}:{left % 60:02d} left) ]')
+		stdout.flush()
 
 	@staticmethod
-	def dictionarycracker(original = None, wordlist = None, arguments = None):
-		""" This method / function serves the functionality of cracking the hash with finding the original plain text via the dictionary method. All the values are custom passed into this function, instead of passing first into the main class object. The dictionary method is explained below. 
+	def makehash(text, algorithm):
+		"""
+		This method / function serves the functionality of creating / generating the hash out of the plain string that is passed to this function. In this function, the plain string is converted to hash code using the algorithm specified. The values of the text, and the hashing algorithm is taken from the user inputs via parameters : text, algorithm.
 
-		Dictionary attack :
-		In this attack, the user provides a file with each line of it written with plain string. The tool then checks the hashes of each plain string with the original hash. If the hash matches, then we display the original plain string.
+		The function returns the hashed string back to the user if it is formed successfully, and also if there are some errors in the process, then we return 0. """
+
+		# Making the hash of the plain string using the algorithm registry
+		try:
+			return HashAlgorithms.hexdigest(algorithm, text)
+		except (ValueError, UnicodeDecodeError):
+			# If the algorithm is not supported, or the plain string is not a valid text (for the fuck algorithm), then we return 0
+
+			return 0
+
+class HashTable:
+	""" This class serves the functionality of a precomputed lookup table of hashes, i.e., the hashes of the plain strings of a wordlist file are computed once (for each of the specified algorithms) and stored in a table file, thus the original plain string of a hash can later be found by simply looking it up in the table, instead of running the dictionary attack again and again.
+
+	The layout of the table file is shown below.
+	b'PSHTB'       -> magic bytes (5 bytes)
+	version        -> version of the table format (1 byte)
+	length         -> length of the algorithms list (2 bytes, big endian)
+	algorithms     -> the names of the algorithms of the table format seperated by commas, i.e., the class variable self.algorithms (the table files having any other list are refused)
+	count          -> number of records (8 bytes, big endian)
+	records        -> the records sorted by the key (17 bytes each)
+		key            -> the first 8 bytes of the raw digest (of the MD5 hash of the hash string for the fuck algorithm)
+		algorithm      -> the position of the algorithm in the algorithms list (1 byte)
+		offset         -> the offset of the plain string in the strings section (8 bytes, big endian)
+	strings        -> the plain strings, each followed by a line break
+
+	As the records are of the fixed size and sorted, the table file is memory mapped and looked up using the binary search, thus only a few records are ever read from the disk. The plain string of each record having the same key is hashed again and compared with the entire hash, thus the key being only a part of the digest never leads to a wrong result. The table is built in runs of sorted records (the runs are merged at the end), thus the memory used stays bounded no matter how large the wordlist file is.
+
+	The class takes input from the user in two ways, they are listed below.
+
+	1. Via argument tokens
+
+		In this mode,
+		The argument tokens entered by the user at the shell (command line) are passed to this class object at the 'arguments' parameters. The first argument is the task (build-table or lookup). The syntax is shown below.
 
-		In this function, per iteration of a plain string, we check it with the original hash with all the possible and available hashing algorithms which are supported by our class / tool.
-		The function displays the output directly on the console screen.
+		HashTable(arguments = [<argument-list>])
 
-		The function works seperately than the class, it takes input from the user in two ways.They are listed below.
+		The arguments that are recognized by this class / tool are listed below.
+		--wordlist            Used to specify the wordlist file location (for building the table)
+		--algorithms          Used to specify the hashing algorithms seperated by commas (for building the table, default is all)
+		--table               Used to specify the table file location (default is hashes.table)
+		--help                Used to launch the documentation mode (the help section is displayed on the console screen)
 
-		1. Via argument tokens
+		Below are some examples for the usage of this tool.
 
-			In this mode,
-			The argument tokens entered by the user at the shell (command line) are passed to this class object at the 'arguments' parameters. The syntax is shown below.
+		# For building the table
+		hash build-table --wordlist /location/to/wordlist/file --algorithms md5,sha1,sha256
 
-			Hash.dictionarycracker(arguments = [<argument-list>])
+		# For looking up a hash
+		hash lookup <hash>
 
-			The arguments that are recognized by this class / tool are listed below.
-			--original            Used to specify the original hash
-			--wordlist            Used to specify the wordlist file location
-			--help                Used to launch the documentation mode (the help section is displayed on the console screen)
+	2. Directly passing parameters
 
-			If there are any whitespaces in the inputs, then use the backslash (\). Below are some examples for the usage of this tool.
+		In this mode,
+		The parameters are passed directly into the class object, and then the methods are called. The syntax for the usage is listed below.
 
-			# For cracking a hash string
-			hash dictionary-cracker --original <original-hash> --wordlist /location/to/wordlist/file
+		table = HashTable(table = 'hashes.table')
+		table.build(wordlist = '/location/to/wordlist/file', algorithms = ['md5', 'sha1'])
+		table.lookup('<hash>')  # Returns a list of tuples (algorithm, plain string)
+	"""
 
-		2. Directly passing parameters
+	def __init__(self, table = 'hashes.table', arguments = None):
+		# Setting some class properties
+		# ----
+		# The magic bytes and the version of the table format
+		self.magic = b'PSHTB'
+		self.version = 2
 
-			In this mode,
-			The parameters are passed directly into the class object. The syntax for the usage is listed below.
+		# The hashing algorithms supported by the table format (the position of the algorithm is stored in the records, thus this list is fixed for the version of the table format, and is not taken from the HashAlgorithms registry whose order may change)
+		self.algorithms = ['md5', 'sha1', 'sha224', 'sha256', 'sha384', 'sha512', 'sha3_224', 'sha3_256', 'sha3_384', 'sha3_512', 'blake2b', 'blake2s', 'fuck']
 
-			Hash.dictionarycracker(
-				original = '<original hash>',
-				wordlist = '/location/to/wordlist/file'
-			)
+		# The header of the table file (without the count of the records), the size of the entire header and of each record
+		names = ','.join(self.algorithms).encode()
+		self.header = self.magic + bytes([self.version]) + len(names).to_bytes(2, 'big') + names
+		self.headersize = len(self.header) + 8
+		self.recordsize = 17
 
-		Some points to be noted :
-		1. The wordlist file should be of proper format. i.e., Each plain string on separate lines.
-		2. The original hash should be one of the hash creating under this tool only, or just with the same algorithms that are supported by this tool.
-		"""
+		# The number of records sorted in memory at a time while building the table
+		self.runsize = 1048576
+		# ----
 
 		# Checking if arguments provided or just the parameters directly
 		if arguments == None:
-			# If the arguments are not passed to this function by the user, then we continue to use the default provided values
+			# If the arguments are not passed to this class object by the user, then we continue to use the default provided values
 
-			pass
+			self.table = table
 		else:
-			# If the arguments are passed to this function by the user, then we continue to parse the arguments
+			# If the arguments are passed to this class object by the user, then we continue to parse the arguments
 
-			# Parsing the arguments entered to this function
+			# Parsing the arguments entered to this class object
 			# ----
-			# Setting the default value of the variables to None
-			original = None
+			# Setting the default value of the variables
+			self.table = 'hashes.table'
 			wordlist = None
-			help = False
+			algorithms = None
+			task = arguments[0] if len(arguments) > 0 else None
+			original = arguments[1] if len(arguments) > 1 and arguments[1][0:2] != '--' else None
+			documentation = False
 
 			# Iterating through each argument to filter out the values
 			for index, argument in enumerate(arguments):
 				# Iterating through each argument item
 
-				if argument == '--original':
-					# If the argument is for specifying the original hash, then we continue to parse the next argument as the entered value
+				if argument == '--wordlist':
+					# If the argument is for specifying the wordlist file location, then we continue to parse the next argument as the entered value
 
 					try:
-						original = arguments[index + 1]
+						wordlist = arguments[index + 1]
 					except IndexError:
 						# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
 
 						continue
 
-				if argument == '--wordlist':
-					# If the argument is for specifying the wordlist file location, then we continue to parse the next argument as the entered value
+				if argument == '--algorithms':
+					# If the argument is for specifying the hashing algorithms, then we continue to parse the next argument as the entered value
 
 					try:
-						wordlist = arguments[index + 1]
+						algorithms = [item.strip() for item in arguments[index + 1].split(',') if len(item.strip()) != 0]
+					except IndexError:
+						# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
+
+						continue
+
+				if argument == '--table':
+					# If the argument is for specifying the table file location, then we continue to parse the next argument as the entered value
+
+					try:
+						self.table = arguments[index + 1]
 					except IndexError:
 						# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
 
@@ -2616,609 +5276,679 @@ class Hash:
 				if argument == '--help':
 					# If the argument is for specifying the help, then we continue to mark the documentation mode to be true
 
-					help = True
+					documentation = True
 			# ----
 
-		# Checking the mode whether documentation mode, or exeuction mode
-		if help:
-			# If the user asked for the execution in documentation mode, then we display the help text on the console screen
+			# Checking whether the task is to be in documentation mode or execution mode
+			if documentation:
+				# If the user specified the documentation mode, then we continue to display the help text on the console screen
 
-			print('<-- Help for Hash dictionary cracker -->')
-		else:
-			# If the user asked for the execution in regular mode, then we continue to execute the task
+				print('hash build-table / hash lookup\nUsage : hash build-table <arguments>\n        hash lookup <hash> <arguments>\n\n"hash build-table" is a tool which serves the functionality of computing the hashes of the plain strings of a wordlist file once, and storing them in a sorted table file. "hash lookup" then finds the original plain string of a hash from the table file within an instant, instead of running the dictionary attack again.\n\nArguments are :\n--wordlist            Used to specify the wordlist file location (build-table)\n--algorithms          Used to specify the hashing algorithms seperated by commas (build-table, default is all)\n--table               Used to specify the table file location (default is hashes.table)\n--help                Used to display this help text\n\nCheck out the docs for more info.')
+			elif task == 'build-table':
+				# If the task specified by the user is for building the table, then we continue to do so
 
-			# Validating the user entered information
-			# ----
-			# Checking for the user specified wordlist file
-			if type(wordlist) == str:
-				# If the wordlist file input specified by the user is a string data type, then we continue for further validation
+				self.build(wordlist, algorithms)
+			elif task == 'lookup':
+				# If the task specified by the user is for looking up a hash, then we continue to do so
 
-				# Checking if the user specified wordlist file exists or not
-				if path.isfile(wordlist):
-					# If the user specified wordlist file does exist on the local machine, then we continue
+				if original == None:
+					# If the hash is not specified by the user, then we display the error message on the console screen
 
-					pass
+					print(f'[ Error : Hash not specified. Use hash lookup <hash>. ]')
 				else:
-					# If the user specified wordlist file does not exists, then we display the error message on the console screen
+					# If the hash is specified by the user, then we continue to look it up in the table
 
-					print(f'[ Error : Specified file "{wordlist}" not found ]')
-					return 0
-			else:
-				# If the wordlist file input specified by the user is not a string data type, then we continue for further validation
+					results = self.lookup(original)
+					for algorithm, string in results:
+						# Iterating through each of the plain strings found
 
-				print(f'[ Error : Wordlist file invalid. ]')
-				return 0
+						print(f'[$] Original hash found ({algorithm}) : {string}')
+					if results == []:
+						# If the hash is not found in the table, then we display the error message on the console screen
 
-			# Checking for the original hash input from the user
-			if type(original) == str:
-				# If the original hash input from the user is of string data type, then we continue to validate further
+						print(f'[!] Original string not found in the table')
+			else:
+				# If the task specified by the user is not recognized, then we raise an error with a custom message
 
-				# Checking the length of the original hash string
-				if len(original) == 0:
-					# If the length of the original hash string is equal to 0, then we display the error message on the console screen
+				raise SyntaxError('Task not recognized.')
 
-					print(f'[ Error : Original hash invalid. ]')
-					return 0
-				else:
-					# If the length of the original hash string is not equal to 0, then we continue
+	def makekey(self, algorithm, text):
+		""" This method / function serves the functionality of computing the hash of the plain string (the parameter text, in bytes) using the algorithm specified. The function returns a tuple (key, hash) where key is the 8 bytes key of the record (see the class docstring) and hash is the raw digest (or the hash string for the fuck algorithm). """
 
-					pass
-			else:
-				# If the original hash input from the user is not of string data type, then we display the error message on the console screen
+		if algorithm == 'fuck':
+			# If the algorithm is the custom fuck algorithm, then the key is taken from the MD5 hash of the hash string
 
-				print(f'[ Error : Original hash invalid. ]')
-				return 0
-			# ----
+			hash = HashAlgorithms.hexdigest(algorithm, text)
+			return (hashlib.md5(hash.encode()).digest()[:8], hash)
+		else:
+			# If the algorithm is one of the hashlib algorithms, then the key is taken from the raw digest
 
-			# Loading the plain texts from the wordlist
-			plainStrings = []
-			contents = open(wordlist, 'r').read()
-			contents = contents.split('\n')
-			plainStrings = contents
-			del contents
+			hash = HashAlgorithms.digest(algorithm, text)
+			return (hash[:8], hash)
 
-			# Checking if the plain string list is empty or not
-			if len(plainStrings) == 0:
-				# If the plain string list is empty, then we display the error message on the console screen
+	def build(self, wordlist, algorithms = None):
+		""" This method / function serves the functionality of building the table file from the plain strings of the wordlist file (the parameter wordlist), for each of the hashing algorithms specified (the parameter algorithms, default is all of the supported algorithms). The plain strings are streamed from the wordlist file, the records are sorted in runs of self.runsize records (each run is written to a temporary file), and then the runs are merged into the table file. The function returns 0 on success. """
 
-				print(f'[ Error : 0 plain strings loaded from the specified wordlist file. ]')
-				return 0
-			else:
-				# If the plain string list is not empty, then we continue
+		# Validating the user entered inputs
+		# ----
+		if type(wordlist) != str or not path.isfile(wordlist):
+			# If the wordlist file specified by the user does not exists, then we display the error message on the console screen
 
-				pass
+			print(f'[ Error : No such file found "{wordlist}". ]')
+			return 0
+		if algorithms == None:
+			# If the algorithms are not specified by the user, then we use all of the supported algorithms
 
-			# Checking the hash of each plain string against the original hash
-			for string in plainStrings:
-				# Iterating through each item in the plain strings list
+			algorithms = self.algorithms
+		for algorithm in algorithms:
+			if algorithm not in self.algorithms:
+				# If the algorithm specified by the user is not supported, then we display the error message on the console screen
 
+				print(f'[ Error : Hashing algorithm "{algorithm}" not supported. ]')
+				return 0
+		# ----
 
-				# Checking for all the algorithms supported by his tool / class one by one
-				# ----
-				# Checking for the md5 hahshing algorithm
-				hash = hashlib.md5(string.encode()).hexdigest()
-				if hash == original:
-					# If the md5 hash of the plain text matches with the original hash, then we continue
+		started = monotonic()
+		directory = path.dirname(path.abspath(self.table))
+		descriptor, strings = mkstemp(dir = directory)
+		runs = []
+		records = []
+		count = 0
+		try:
+			# Hashing the plain strings and writing the sorted runs of the records
+			with fdopen(descriptor, 'wb') as file:
+				offset = 0
+				for _, word in HashCracker.readwordlist(wordlist):
+					# Iterating through each plain string of the wordlist file
 
-					print(f'[$] Original hash found : {string}')
-					return 0
-				
-				# Checking for the sha1 hashing algorithm
-				hash = hashlib.sha1(string.encode()).hexdigest()
-				if hash == original:
-					# If the sha1 hash of the plain text matches with the original hash, then we continue
+					if len(word) == 0:
+						# If the plain string is empty, then we skip it
 
-					print(f'[$] Original hash found : {string}')
-					return 0
+						continue
+					for algorithm in algorithms:
+						# Iterating through each algorithm
 
-				# Checking for the sha224 hashing algorithm
-				hash = hashlib.sha224(string.encode()).hexdigest()
-				if hash == original:
-					# If the sha224 hash of the plain text matches with the original hash, then we continue
+						try:
+							key, _ = self.makekey(algorithm, word)
+						except UnicodeDecodeError:
+							# If the plain string is not a valid text (for the fuck algorithm), then we skip it
 
-					print(f'[$] Original hash found : {string}')
-					return 0
+							continue
+						records.append(key + bytes([self.algorithms.index(algorithm)]) + offset.to_bytes(8, 'big'))
+					file.write(word + b'\n')
+					offset += len(word) + 1
+
+					if len(records) >= self.runsize:
+						# If enough records are collected, then we write them as a sorted run
+
+						runs.append(self.writerun(records, directory))
+						count += len(records)
+						records = []
+			if len(records) != 0:
+				# Writing the remaining records as a sorted run
+
+				runs.append(self.writerun(records, directory))
+				count += len(records)
+			del records
+
+			# Merging the sorted runs into the table file (the table is written to a temporary file first, and then moved in place)
+			descriptor, temporary = mkstemp(dir = directory)
+			with fdopen(descriptor, 'wb') as output:
+				output.write(self.header + count.to_bytes(8, 'big'))
+				readers = [open(run, 'rb') for run in runs]
+				try:
+					for record in merge(*[self.readrun(reader) for reader in readers]):
+						output.write(record)
+				finally:
+					for reader in readers:
+						reader.close()
+				with open(strings, 'rb') as source:
+					while True:
+						chunk = source.read(1048576)
+						if len(chunk) == 0:
+							break
+						output.write(chunk)
+			replace(temporary, self.table)
+		finally:
+			# Removing the temporary files
+			for file in runs + [strings]:
+				if path.isfile(file):
+					remove(file)
+
+		print(f'[$] Table built : {self.table} ({count} hashes of {len(algorithms)} algorithms in {monotonic() - started:.2f} seconds)')
+		return 0
 
-				# Checking for the sha256 hashing algorithm
-				hash = hashlib.sha256(string.encode()).hexdigest()
-				if hash == original:
-					# If the sha256 hash of the plain text matches with the original hash, then we continue
+	def writerun(self, records, directory):
+		""" This method / function serves the functionality of sorting the records (the parameter records) and writing them to a temporary file, used as a run while building the table. The function returns the location of the temporary file. """
 
-					print(f'[$] Original hash found : {string}')
-					return 0
+		records.sort()
+		descriptor, run = mkstemp(dir = directory)
+		with fdopen(descriptor, 'wb') as file:
+			file.write(b''.join(records))
+		return run
 
-				# Checking for the sha384 hashing algorithm
-				hash = hashlib.sha384(string.encode()).hexdigest()
-				if hash == original:
-					# If the sha384 hash of the plain text matches with the original hash, then we continue
+	def readrun(self, file):
+		""" This method / function serves the functionality of reading the records of a run (the parameter file, opened in binary mode) one by one, used while merging the runs. The function is a generator, it yields each record in bytes. """
 
-					print(f'[$] Original hash found : {string}')
-					return 0
+		while True:
+			record = file.read(self.recordsize)
+			if len(record) < self.recordsize:
+				# If the end of the run is reached, then we stop
 
-				# Checking for the sha512 hashing algorithm
-				hash = hashlib.sha512(string.encode()).hexdigest()
-				if hash == original:
-					# If the sha512 hash of the plain text matches with the original hash, then we continue
+				return
+			yield record
 
-					print(f'[$] Original hash found : {string}')
-					return 0
+	def lookup(self, original):
+		""" This method / function serves the functionality of looking up a hash (the parameter original) in the table file. The candidate algorithms of the hash are inferred from its length and format (see DigestIndex), and the records having the key of the hash are found using the binary search on the memory mapped table file. The plain string of each of those records is then hashed again and compared with the entire hash.
 
-				# Checking for the sha3_224 hashing algorithm
-				hash = hashlib.sha3_224(string.encode()).hexdigest()
-				if hash == original:
-					# If the sha3_224 hash of the plain text matches with the original hash, then we continue
+		The function returns a list of tuples (algorithm, plain string) of the plain strings found (an empty list if none are found). """
 
-					print(f'[$] Original hash found : {string}')
-					return 0
+		# Checking the table file
+		if not path.isfile(self.table):
+			# If the table file does not exists, then we display the error message on the console screen
 
-				# Checking for the sha3_256 hashing algorithm
-				hash = hashlib.sha3_256(string.encode()).hexdigest()
-				if hash == original:
-					# If the sha3_256 hash of the plain text matches with the original hash, then we continue
+			print(f'[ Error : No such table found "{self.table}". Use hash build-table to build one. ]')
+			return []
 
-					print(f'[$] Original hash found : {string}')
-					return 0
+		# Inferring the candidate algorithms and the key of the hash
+		index = DigestIndex(original.strip())
+		if len(index.targets) == 0:
+			# If the hash is not recognized, then we display the error message on the console screen
 
-				# Checking for the sha3_384 hashing algorithm
-				hash = hashlib.sha3_384(string.encode()).hexdigest()
-				if hash == original:
-					# If the sha3_384 hash of the plain text matches with the original hash, then we continue
+			print(f'[ Error : Original hash invalid. ]')
+			return []
+		original = original.strip()
+		if 'fuck' in index.index:
+			# If the hash is of the fuck algorithm, then the key is taken from the MD5 hash of the hash string
 
-					print(f'[$] Original hash found : {string}')
-					return 0
+			key = hashlib.md5(original.encode()).digest()[:8]
+		else:
+			# If the hash is a hex digest, then the key is taken from the raw digest
 
-				# Checking for the sha3_512 hashing algorithm
-				hash = hashlib.sha3_512(string.encode()).hexdigest()
-				if hash == original:
-					# If the sha3_512 hash of the plain text matches with the original hash, then we continue
+			key = bytes.fromhex(original)[:8]
 
-					print(f'[$] Original hash found : {string}')
-					return 0
+		results = []
+		with open(self.table, 'rb') as file:
+			table = mmap(file.fileno(), 0, access = ACCESS_READ)
+			try:
+				if table[:len(self.magic)] != self.magic or len(table) < self.headersize:
+					# If the table file is not of the supported format, then we display the error message on the console screen
+
+					print(f'[ Error : The table file "{self.table}" is invalid. ]')
+					return []
+				elif table[:len(self.header)] != self.header:
+					# If the table file is of another version or has another list of algorithms (the algorithm positions of its records would be wrong), then we display the error message on the console screen
+
+					print(f'[ Error : The table file "{self.table}" is of an unsupported version or list of algorithms. Rebuild it using hash build-table. ]')
+					return []
+				count = int.from_bytes(table[len(self.header):self.headersize], 'big')
+				strings = self.headersize + count * self.recordsize
+
+				# Finding the first record having the key (binary search)
+				low, high = 0, count
+				while low < high:
+					middle = (low + high) // 2
+					position = self.headersize + middle * self.recordsize
+					if table[position:position + 8] < key:
+						low = middle + 1
+					else:
+						high = middle
 
-				# Checking for the blake2b hashing algorithm
-				hash = hashlib.blake2b(string.encode()).hexdigest()
-				if hash == original:
-					# If the blake2b hash of the plain text matches with the original hash, then we continue
+				# Checking each of the records having the key
+				while low < count:
+					position = self.headersize + low * self.recordsize
+					if table[position:position + 8] != key:
+						# If the key of the record does not match, then there are no more records having the key
 
-					print(f'[$] Original hash found : {string}')
-					return 0
+						break
+					algorithm = self.algorithms[table[position + 8]]
+					if algorithm in index.index:
+						# If the algorithm of the record is one of the candidate algorithms, then we hash the plain string again and compare it with the entire hash
 
-				# Checking for the blake2s hashing algorithm
-				hash = hashlib.blake2s(string.encode()).hexdigest()
-				if hash == original:
-					# If the blake2s hash of the plain text matches with the original hash, then we continue
+						start = strings + int.from_bytes(table[position + 9:position + 17], 'big')
+						word = table[start:table.find(b'\n', start)]
+						if self.makekey(algorithm, word)[1] in index.index[algorithm]:
+							# If the hash matches, then we store the plain string
 
-					print(f'[$] Original hash found : {string}')
-					return 0
+							results.append((algorithm, word.decode(errors = 'replace')))
+					low += 1
+			finally:
+				table.close()
+		return results
 
-				# Checking for the fuck hashing algorithm
-				# CUSTOM ALGORITHM
-				# NAME : fuck
-				# ----
-				# Generating an hash encryption key
-				key = 0
-				isEven = True
-				for i in string:
-					# Iterating over each character in the encrypted key entered by the user
-							
-					if isEven:
-						# If the current iteration is even number, then we add the char code value
-
-						key += ord(i)
-					else:
-						# If the current iteration is odd number (not even), then we subtract the char code value
+class FileHasher:
+	""" This class serves the functionality of computing the hashes of files, or of all of the files in a directory tree. Unlike the Hash class (which hashes the plain string in memory), the files are fed to the hashing algorithms in fixed size chunks, thus the memory used stays constant no matter how large the files are. Multiple algorithms can be computed in a single pass over the file (each chunk is fed to all of the algorithms). In the directory mode, the files are hashed on a pool of threads (hashlib releases the GIL while hashing the large chunks, thus the threads run in parallel).
 
-						key -= ord(i)
-				del isEven
+	The class takes input from the user in two ways, they are listed below.
 
-				# Making the key possitive
-				if key < 0:
-					# If the key value is less than 0, then we change the negative sign to possitive by simply multiplying it with -1
+	1. Via argument tokens
 
-					key *= (-1)
+		In this mode,
+		The argument tokens entered by the user at the shell (command line) are passed to this class object at the 'arguments' parameters. The first argument after 'file' is the location of the file or directory. The syntax is shown below.
 
-				# Adding the length of the text to itself
-				key += len(string)
+		FileHasher(arguments = [<argument-list>])
 
-				# Creating the cipher text from the plain text
-				text = ''
-				for character in string:
-					# Iterating through each character in the plain text
+		The arguments that are recognized by this class / tool are listed below.
+		--algorithm           Used to specify the hashing algorithm, or multiple algorithms seperated by commas (default is sha256)
+		--jobs                Used to specify the number of threads for the directory mode (default is 4)
+		--cache               Used to look up / store the digests in the persistent digest cache (see DigestCache)
+		--help                Used to launch the documentation mode (the help section is displayed on the console screen)
 
-					text += chr((ord(character) + key) % 256)
+		Below are some examples for the usage of this tool.
 
-				# Encoding into the base64 format
-				text = b64encode(text.encode()).decode()
+		# For hashing a file
+		hash file /location/to/file --algorithm sha256
 
-				# Making the 'fuck' string out of the semi encrypted text
-				hash = ''
-				for index, character in enumerate(text):
-					# Iterating through each character in the text
+		# For hashing a directory, skipping the files which are not modified since they were last hashed
+		hash file /location/to/directory --cache
 
-					hash += f'fuck{ord(character)}'
-					if index != len(text) - 1:
-						hash += '-' 
-				del text
-				# ----
-				if hash == original:
-					# If the fuck hash of the plain text matches with the original hash, then we continue
+		# For hashing all of the files in a directory with two algorithms at once
+		hash file /location/to/directory --algorithm md5,sha256 --jobs 8
 
-					print(f'[$] Original hash found : {string}')
-					return 0
+	2. Directly passing parameters
 
-			# If the execution reaches upto this point, then we can say that the plain string for the hash is not found. Then, we display the error message on the console screen
-			print(f'[!] Original string not found')
-			return 0
+		In this mode,
+		The parameters are passed directly into the class object, and then the methods are called. The syntax for the usage is listed below.
 
-class HashCracker:
-	""" """
+		hasher = FileHasher(algorithms = ['sha256'], jobs = 4, cache = None)  # cache is optional, a DigestCache object
+		hasher.hashfile('/location/to/file')  # Returns a dictionary {algorithm : hex digest}
+		hasher.hashdirectory('/location/to/directory')  # Displays the hashes of all of the files
+	"""
 
-	def __init__(self, original = None, arguments = None):
-		self.original = original
-		self.algorithm = None
-		self.wordlist = None
-		self.documentation = False
+	def __init__(self, location = None, algorithms = None, jobs = 4, cache = None, arguments = None):
+		# Setting some class properties
+		# ----
+		# The size of the chunks (in bytes) in which the files are fed to the hashing algorithms
+		self.chunksize = 1048576
+		# ----
 
-		# Checking whether the task is to be in documentation mode or execution mode
-		if self.documentation:
-			# If the user specified the documentation mode, then we continue to display the help text on the console screen
+		# Checking if arguments provided or just the parameters directly
+		documentation = False
+		if arguments == None:
+			# If the arguments are not passed to this class object by the user, then we continue to use the default provided values
 
-			print('<-- Help for Hash cracker -->')
+			self.location = location
+			self.algorithms = algorithms if algorithms != None else ['sha256']
+			self.jobs = jobs
+			self.cache = cache
 		else:
-			# If the user specified the execution mode, then we continue to execute the task
+			# If the arguments are passed to this class object by the user, then we continue to parse the arguments
 
-			# Validating the user entered inputs
+			# Parsing the arguments entered to this class object
 			# ----
-			# Validating the original hash entered by the user
-			if type(self.original) == str:
-				# If the data type of the user specified original hash is string type, then we continue for further validation
+			# Setting the default value of the variables
+			self.location = arguments[1] if len(arguments) > 1 and arguments[1][0:2] != '--' else None
+			self.algorithms = ['sha256']
+			self.jobs = 4
+			self.cache = None
 
-				if len(self.original) == 0:
-					# If the length of the user specified original hash is 0, then we raise an error with custom message
+			# Iterating through each argument to filter out the values
+			for index, argument in enumerate(arguments):
+				# Iterating through each argument item
 
-					raise ValueError('Original hash invalid.')
-				else:
-					# If the length of the user specified orignal hash is not 0, then we continue
+				if argument == '--algorithm':
+					# If the argument is for specifying the hashing algorithm(s), then we continue to parse the next argument as the entered value
 
-					pass
-			else:
-				# If the data type of the user specified original hash is not string type, then we raise an error with custom message
+					try:
+						self.algorithms = [item.strip() for item in arguments[index + 1].split(',') if len(item.strip()) != 0]
+					except IndexError:
+						# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
 
-				raise ValueError('Original hash invalid.')
-			# ----
+						continue
 
-	def dictionaryattack(self):
-		""" This method / function serves the functionality of the cracking the original plain string of the hashed string using the dictionary attack method. """
+				if argument == '--jobs':
+					# If the argument is for specifying the number of jobs (threads), then we continue to parse the next argument as the entered value
 
-		# Validating the wordlist file specified by the user
-		# ----
-		if type(self.wordlist) == str:
-			# If the data type of the wordlist input by the user is of string type, then we continue for further validation
+					try:
+						self.jobs = int(arguments[index + 1])
+					except IndexError:
+						# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
 
-			if path.isfile(self.wordlist):
-				# If the wordlist file specified by the user exists on the local machine, then we continue
+						continue
+					except ValueError:
+						# If the next argument is not a numeric value, then we raise an error with a custom message
 
-				pass
-			else:
-				# If the wordlist file specified by the user does not exists on the local machine, then we display the error message on the console screen
+						raise ValueError('Invalid number of jobs specified. Requires to be a numeric value (atleast 1).')
 
-				print(f'[ Error : No such file found "{self.wordlist}". ]')
-				return 0
-		else:
-			# If the data type of the wordlist input by the user is not of string type, then we display the error message on the console screen
+				if argument == '--cache':
+					# If the argument is for specifying the use of the digest cache, then we continue to open the cache
 
-			print(f'[ Error : Wordlist file is invalid. ]')
-		# ----
+					self.cache = True
 
-		# Loading the plain strings from the wordlist fil
-		# ----
-		# Declaring an empty list for storing all the plain strings
-		plainStrings = []
-
-		# Loading the contents of the wordlist file specified by the user
-		contents = open(self.wordlist, 'r').read()
-		contents = contents.split('\n')
-		plainStrings = contents
-		del contents
-		# ----
+				if argument == '--help':
+					# If the argument is for specifying the help, then we continue to mark the documentation mode to be true
 
-		# Checking if a specific algorithm is specified by the user in order to crack the hash
-		if self.algorithm == None:
-			# If a specific algorithm is not specified by the user, then we continue to check for all the algorithms one by one
+					documentation = True
+			# ----
 
-			for index, string in enumerate(plainStrings):
-				# Displaying the current number of the plain strings try
-				stdout.write('\r')
-				stdout.write(f'[ Trying plain string {index + 1} out of {len(plainStrings)} ]')
-				stdout.flush()
+		# Validating the user entered inputs
+		# ----
+		for algorithm in self.algorithms:
+			if HashAlgorithms.constructors.get(algorithm) == None:
+				# If the algorithm is not supported for the files (the custom fuck algorithm works on the text only), then we raise an error with a custom message
 
-				# Creating the hash from different algorithms
-				# Checking for md5 hashing algorithm
-				hash = self.makehash(string, 'md5')
-				if hash == self.original:
-					# If the md5 hash of the currently iterated plain string matches with the original hash, then we display the success message on the console screen and exit the loop
+				raise ValueError(f'Hashing algorithm "{algorithm}" not supported for files.')
+		if type(self.jobs) != int or self.jobs < 1:
+			# If the number of jobs specified by the user is not a positive integer, then we raise an error with custom message
 
-					print(f'\n[ Original string found ]\n[#] String : {string}')
-					return 0
-				
-				# Checking the sha1 hashing algorithm
-				hash = self.makehash(string, 'sha1')
-				if hash == self.original:
-					# If the sha1 hash of the currently iterated plain string matches with the original hash, then we display the success message on the console screen and exit the loop
+			raise ValueError('Invalid number of jobs specified. Requires to be a numeric value (atleast 1).')
+		# ----
 
-					print(f'\n[ Original string found ]\n[#] String : {string}')
-					return 0
+		if arguments != None:
+			# If the arguments are passed, then we continue to execute the task
 
-				# Checking the sha224 hashing algorithm
-				hash = self.makehash(string, 'sha224')
-				if hash == self.original:
-					# If the sha224 hash of the currently iterated plain string matches with the original hash, then we display the success message on the console screen and exit the loop
+			if documentation:
+				# If the user specified the documentation mode, then we continue to display the help text on the console screen
 
-					print(f'\n[ Original string found ]\n[#] String : {string}')
-					return 0
+				print('hash file\nUsage : hash file <file / directory> <arguments>\n\n"hash file" is a tool which serves the functionality of computing the hashes of a file, or of all of the files in a directory. The files are read in chunks, thus even the very large files can be hashed.\n\nArguments are :\n--algorithm           Used to specify the hashing algorithm(s) seperated by commas (default is sha256)\n--jobs                Used to specify the number of threads for the directory (default is 4)\n--cache               Used to skip the files which are not modified since they were last hashed (see hash cache)\n--help                Used to display this help text\n\nCheck out the docs for more info.')
+			elif self.location == None:
+				# If the location is not specified by the user, then we display the error message on the console screen
 
-				# Checking the sha256 hashing algorithm
-				hash = self.makehash(string, 'sha256')
-				if hash == self.original:
-					# If the sha256 hash of the currently iterated plain string matches with the original hash, then we display the success message on the console screen and exit the loop
+				print(f'[ Error : File location not specified. Use hash file <file / directory>. ]')
+			elif path.isdir(self.location) or path.isfile(self.location):
+				# If the location specified by the user is a directory or a file, then we continue to hash it
 
-					print(f'\n[ Original string found ]\n[#] String : {string}')
-					return 0
+				if self.cache == True:
+					# If the user specified the use of the digest cache, then we open it
 
-				# Checking the sha384 hashing algorithm
-				hash = self.makehash(string, 'sha384')
-				if hash == self.original:
-					# If the sha384 hash of the currently iterated plain string matches with the original hash, then we display the success message on the console screen and exit the loop
+					self.cache = DigestCache()
+				try:
+					if path.isdir(self.location):
+						# If the location is a directory, then we hash all of the files in it
 
-					print(f'\n[ Original string found ]\n[#] String : {string}')
-					return 0
+						self.hashdirectory(self.location)
+					else:
+						# If the location is a file, then we hash it
 
-				# Checking the sha512 hashing algorithm
-				hash = self.makehash(string, 'sha512')
-				if hash == self.original:
-					# If the sha512 hash of the currently iterated plain string matches with the original hash, then we display the success message on the console screen and exit the loop
+						self.display(self.location, self.hash(self.location))
+				finally:
+					if self.cache != None:
+						# If the digest cache is opened, then we close it (saving the changes), even if the hashing is interrupted
 
-					print(f'\n[ Original string found ]\n[#] String : {string}')
-					return 0
+						self.cache.close()
+			else:
+				# If the location specified by the user does not exists, then we display the error message on the console screen
+
+				print(f'[ Error : No such file or directory "{self.location}". ]')
+
+	def lookup(self, filename):
+		""" This method / function serves the functionality of looking up the digests of the file (the parameter filename) in the digest cache (if the cache is used). The cache key of the file is taken here, i.e., before the file is hashed, and it is to be passed on to the store() method. The function returns a tuple (cache key or None if the cache is not used, dictionary {algorithm : hex digest} of the cached digests, list of the algorithms which are not cached). """
+
+		if self.cache == None:
+			# If the digest cache is not used, then none of the algorithms are cached
+
+			return (None, {}, list(self.algorithms))
+		key = self.cache.key(filename)
+		cached = {}
+		for algorithm in self.algorithms:
+			digest = self.cache.get(key, algorithm)
+			if digest != None:
+				cached[algorithm] = digest
+		return (key, cached, [algorithm for algorithm in self.algorithms if algorithm not in cached])
+
+	def store(self, key, cached, computed):
+		""" This method / function serves the functionality of storing the computed digests of the file (the parameter computed) in the digest cache under the cache key taken before the file was hashed (the parameter key, see the lookup() method), if the cache is used, and merging them with the cached digests (the parameter cached). The function returns the dictionary {algorithm : hex digest} in the order of the class variable self.algorithms. """
+
+		if self.cache != None:
+			# If the digest cache is used, then we store the computed digests
+
+			for algorithm, digest in computed.items():
+				self.cache.put(key, algorithm, digest)
+		hashes = dict(cached, **computed)
+		return {algorithm : hashes[algorithm] for algorithm in self.algorithms}
+
+	def hash(self, filename):
+		""" This method / function serves the functionality of computing the hashes of a file (the parameter filename), returning the cached digests right away if the file is not modified since it was last hashed (only when the digest cache is used). The function returns a dictionary {algorithm : hex digest}. """
+
+		key, cached, missing = self.lookup(filename)
+		return self.store(key, cached, self.hashfile(filename, missing) if len(missing) != 0 else {})
+
+	def hashfile(self, filename, algorithms = None):
+		""" This method / function serves the functionality of computing the hashes of a file (the parameter filename) using each of the algorithms specified (the parameter algorithms, default is the class variable self.algorithms), in a single pass over the file. The file is read into a reusable buffer in chunks of self.chunksize bytes, and each chunk is fed to all of the algorithms. The function is thread safe, thus it is run on the pool of threads in the directory mode.
+
+		The function returns a dictionary {algorithm : hex digest}. """
+
+		if algorithms == None:
+			# If the algorithms are not specified, then we use all of the algorithms of the class
+
+			algorithms = self.algorithms
+		hashes = [HashAlgorithms.constructor(algorithm)() for algorithm in algorithms]
+		buffer = bytearray(self.chunksize)
+		view = memoryview(buffer)
+		with open(filename, 'rb', buffering = 0) as file:
+			while True:
+				# Reading the file chunk by chunk
+
+				length = file.readinto(buffer)
+				if not length:
+					# If the end of the file is reached, then we stop
+
+					break
+				for hash in hashes:
+					hash.update(view[:length])
+		view.release()
+		return {algorithm : hash.hexdigest() for algorithm, hash in zip(algorithms, hashes)}
+
+	def hashdirectory(self, directory):
+		""" This method / function serves the functionality of computing the hashes of all of the files in the directory tree (the parameter directory), on a pool of self.jobs threads. The files are queued lazily (at most 4 files per thread at a time), and the hashes are displayed in the order of the directory tree (sorted by name), along with a summary at the end. If the digest cache is used, then it is looked up (and updated) from the current thread only, and the files having all of their digests cached are not read at all. The function returns 0 if all of the files are hashed, or else returns 1. """
+
+		started = monotonic()
+		files = 0
+		size = 0
+		failures = 0
+		pending = deque()
+		with ThreadPoolExecutor(max_workers = self.jobs) as executor:
+			for filename in self.listfiles(directory):
+				# Queueing the file to the pool (only the algorithms which are not cached)
+				try:
+					key, cached, missing = self.lookup(filename)
+					pending.append((filename, key, cached, executor.submit(self.hashfile, filename, missing) if len(missing) != 0 else None))
+				except OSError as e:
+					# If the file is removed (or made unreadable) since it was listed, then we queue the failure in its place (thus it is counted and displayed in order, by the collect() method)
 
-				# Checking the sha3_256 hashing algorithm
-				hash = self.makehash(string, 'sha3_256')
-				if hash == self.original:
-					# If the sha3_256 hash of the currently iterated plain string matches with the original hash, then we display the success message on the console screen and exit the loop
+					future = Future()
+					future.set_exception(e)
+					pending.append((filename, None, {}, future))
 
-					print(f'\n[ Original string found ]\n[#] String : {string}')
-					return 0
+				if len(pending) >= self.jobs * 4:
+					# If enough files are queued, then we wait for the oldest one to complete before queueing more (thus the hashes are displayed in order)
 
-				# Checking the sha3_384 hashing algorithm
-				hash = self.makehash(string, 'sha3_384')
-				if hash == self.original:
-					# If the sha3_384 hash of the currently iterated plain string matches with the original hash, then we display the success message on the console screen and exit the loop
+					files, size, failures = self.collect(pending.popleft(), directory, files, size, failures)
 
-					print(f'\n[ Original string found ]\n[#] String : {string}')
-					return 0
+			# Waiting for the remaining files to complete
+			while len(pending) > 0:
+				files, size, failures = self.collect(pending.popleft(), directory, files, size, failures)
 
-				# Checking the sha3_512 hashing algorithm
-				hash = self.makehash(string, 'sha3_512')
-				if hash == self.original:
-					# If the sha3_512 hash of the currently iterated plain string matches with the original hash, then we display the success message on the console screen and exit the loop
+		elapsed = monotonic() - started
+		print(f'[$] Hashed : {files} files ({size / 1048576:.2f} MB) in {elapsed:.2f} seconds ({size / 1048576 / max(elapsed, 0.001):.2f} MB/s)')
+		if failures != 0:
+			# If there are any failures, then we display the number of failures
 
-					print(f'\n[ Original string found ]\n[#] String : {string}')
-					return 0
+			print(f'[!] Failed : {failures} files')
+			return 1
+		return 0
 
-				# Checking the shake_128 hashing algorithm
-				hash = self.makehash(string, 'shake_128')
-				if hash == self.original:
-					# If the shake_128 hash of the currently iterated plain string matches with the original hash, then we display the success message on the console screen and exit the loop
+	def collect(self, item, directory, files, size, failures):
+		""" This method / function serves the functionality of waiting for the hashes of a queued file (the parameter item, a tuple of the filename, the cache key, the cached digests and the future, None if all of the digests are cached) and displaying them. The function returns the updated counts (files, size, failures) back. """
 
-					print(f'\n[ Original string found ]\n[#] String : {string}')
-					return 0
+		filename, key, cached, future = item
+		try:
+			hashes = self.store(key, cached, future.result() if future != None else {})
+			length = path.getsize(filename)
+		except OSError as e:
+			# If the file could not be read, then we display the error message on the console screen
 
-				# Checking the shake_256 hashing algorithm
-				hash = self.makehash(string, 'shake_256')
-				if hash == self.original:
-					# If the shake_256 hash of the currently iterated plain string matches with the original hash, then we display the success message on the console screen and exit the loop
+			print(f'[!] Failed : {path.relpath(filename, directory)} ({e})')
+			return (files, size, failures + 1)
+		self.display(path.relpath(filename, directory), hashes)
+		return (files + 1, size + length, failures)
 
-					print(f'\n[ Original string found ]\n[#] String : {string}')
-					return 0
+	def display(self, filename, hashes):
+		""" This method / function serves the functionality of displaying the hashes of a file on the console screen. If there is only one algorithm, then the hash is displayed as '<hash>  <filename>' (the same format as the sha256sum like tools), or else each hash is displayed as '<ALGORITHM> (<filename>) = <hash>'. """
 
-				# Checking the blake2s hashing algorithm
-				hash = self.makehash(string, 'blake2s')
-				if hash == self.original:
-					# If the blake2s hash of the currently iterated plain string matches with the original hash, then we display the success message on the console screen and exit the loop
+		if len(hashes) == 1:
+			# If there is only one algorithm, then we display the hash along with the filename
 
-					print(f'\n[ Original string found ]\n[#] String : {string}')
-					return 0
+			print(f'{list(hashes.values())[0]}  {filename}')
+		else:
+			# If there are multiple algorithms, then we display each hash tagged with its algorithm
 
-				# Checking the blake2b hashing algorithm
-				hash = self.makehash(string, 'blake2b')
-				if hash == self.original:
-					# If the blake2b hash of the currently iterated plain string matches with the original hash, then we display the success message on the console screen and exit the loop
+			for algorithm, hash in hashes.items():
+				print(f'{algorithm.upper()} ({filename}) = {hash}')
 
-					print(f'\n[ Original string found ]\n[#] String : {string}')
-					return 0
+	@staticmethod
+	def listfiles(directory):
+		""" This method / function serves the functionality of listing the files of a directory tree (the parameter directory) in the order of the names. The function is a generator, it yields the location of each file. """
 
-			# If we reached out of the loop, then we can assume that the wordlist file did not contained the actual password, then we display the error message on the console screen
-			print(f'\n[ Original string not found in the wordlist ]')
-			return 0
-		else:
-			# If an specific algorithm is specified by the user, then we continue to crack for that particular algorithm
+		for root, folders, files in walk(directory):
+			folders.sort()
+			for file in sorted(files):
+				if path.isfile(path.join(root, file)):
+					yield path.join(root, file)
 
-			for index, string in enumerate(plainStrings):
-				# Iterating through each of the plain strings
+class DigestCache:
+	""" This class serves the persistent cache of the digests of the files hashed by the FileHasher class. The digests are stored in a small SQLite database under the data/ directory of the shell, keyed by the location, size, modification time (in nanoseconds), inode and algorithm of the file. Thus if a file is not modified since it was last hashed, then its digest is returned right away without reading the file again. The least recently used entries are evicted once the number of entries exceeds the capacity.
 
-				# Displaying the current number of the plain string try
-				stdout.write('\r')
-				stdout.write(f'[ Trying plain string {index + 1} out of {len(plainStrings)} ]')
-				stdout.flush()
+	The database is to be used from a single thread only (the FileHasher class looks up and stores the digests from the main thread, while the files are hashed on the pool of threads).
 
-				# Creating the hash of the plain strings using the user specified hashing algorithm
-				hash = self.makehash(string, self.algorithm)
-				if hash == self.original:
-					# If the hash of the currently iterated plain string matches with the original hash, then we display the success message on the console screen and exit the loop
+	The class takes input from the user in two ways, they are listed below.
 
-					print(f'\n[ Original string found ]\n[#] String : {string}')
-					return 0
-				else:
-					# If the hash of the currently iterated plain string matches with the original hash, then we continue for next iteration
+	1. Via argument tokens
 
-					continue
+		In this mode,
+		The argument tokens entered by the user at the shell (command line) are passed to this class object at the 'arguments' parameters. The task (stats or clear) is the argument after 'cache'. The syntax is shown below.
 
-			# If we reached out of the loop, then we can assume that the wordlist file did not contained the actual password, then we display the error message on the console screen
-			print(f'\n[ Original string not found in the wordlist ]')
-			return 0
+		DigestCache(arguments = [<argument-list>])
 
-	def bruteforceattack(self):
-		""" This method / function serves the functionality of the cracking the original plain string of the hashed string using the bruteforce attack method. """
+		Below are some examples for the usage of this tool.
 
-		# Checking the plain string length specifed by the user
-		# ----
-		if type(self.plainstringlength) == int:
-			# If the data type of the plain string length input specified by the user is integer type, then we continue for further validation
+		# For displaying the statistics of the cache
+		hash cache stats
 
-			if self.plainstringlength == 0:
-				# If the plain string length specified by the user is 0, then we display the error message on the console screen
+		# For removing all of the entries of the cache
+		hash cache clear
 
-				print(f'[ Error : Invalid plain string length speicified for the bruteforce attack. ]')
-				return 0
-			else:
-				# If the plain string length specified by the user is not 0, then we continue
+	2. Directly passing parameters
 
-				pass
-		else:
-			# If the data type of the plain string length input specified by the user is not integer type, then we display the error message on the console screen
+		In this mode,
+		The parameters are passed directly into the class object, and then the methods are called. The syntax for the usage is listed below.
 
-			print(f'[ Error : Invalid plain string input speicified for the bruteforce attack. ]')
-			return 0
+		cache = DigestCache(database = None, capacity = 100000)  # The default database is data/digests.sqlite
+		key = cache.key('/location/to/file')  # Taken before the file is hashed
+		cache.get(key, 'sha256')  # Returns the hex digest, or None if not cached
+		cache.put(key, 'sha256', '<hex digest>')
+		cache.close()
+	"""
+
+	def __init__(self, database = None, capacity = 100000, arguments = None):
+		# Setting some class properties
 		# ----
+		# The location of the database file (under the data/ directory of the shell, by default) and the maximum number of entries
+		self.database = database if database != None else path.join(path.dirname(path.dirname(path.abspath(__file__))), 'data', 'digests.sqlite')
+		self.capacity = capacity
 
+		# The number of hits and misses of the current run (added to the totals stored in the database on close)
+		self.hits = 0
+		self.misses = 0
+		# ----
 
-	@staticmethod
-	def makehash(text, algorithm):
-		"""
-		This method / function serves the functionality of creating / generating the hash out of the plain string that is passed to this function. In this function, the plain string is converted to hash code using the algorithm specified. The values of the text, and the hashing algorithm is taken from the user inputs via parameters : text, algorithm.
+		# Opening the database (creating the tables if they do not exist)
+		if not path.isdir(path.dirname(path.abspath(self.database))):
+			# If the directory of the database does not exists, then we create it
 
-		The function returns the hashed string back to the user if it is formed successfully, and also if there are some errors in the process, then we return 0. """
+			makedirs(path.dirname(path.abspath(self.database)))
+		self.connection = sqlite3.connect(self.database)
+		self.connection.execute('CREATE TABLE IF NOT EXISTS digests (location TEXT, size INTEGER, mtime INTEGER, inode INTEGER, algorithm TEXT, digest TEXT, used INTEGER, PRIMARY KEY (location, algorithm))')
+		self.connection.execute('CREATE INDEX IF NOT EXISTS digests_used ON digests (used)')
+		self.connection.execute('CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER)')
 
-		# Checking the hashing algorithm specified
-		if algorithm == 'md5':
-			# If the user specified hashing algorithm is md5, then we continue to form it
-
-			hash = hashlib.md5(text.encode()).hexdigest()
-			return hash
-		elif algorithm == 'sha1':
-			# If the user specified hashing algorithm is sha1, then we continue to form it
-
-			hash = hashlib.sha1(text.encode()).hexdigest()
-			return hash
-		elif algorithm == 'sha224':
-			# If the user specified hashing algorithm is sha224, then we continue to form it
-
-			hash = hashlib.sha224(text.encode()).hexdigest()
-			return hash
-		elif algorithm == 'sha256':
-			# If the user specified hashing algorithm is sha256, then we continue to form it
-
-			hash = hashlib.sha256(text.encode()).hexdigest()
-			return hash
-		elif algorithm == 'sha384':
-			# If the user specified hashing algorithm is sha384, then we continue to form it
-
-			hash = hashlib.sha384(text.encode()).hexdigest()
-			return hash
-		elif algorithm == 'sha512':
-			# If the user specified hashing algorithm is sha512, then we continue to form it
-
-			hash = hashlib.sha512(text.encode()).hexdigest()
-			return hash
-		elif algorithm == 'sha3_224':
-			# If the user specified hashing algorithm is sha3_224, we continue to form it
-
-			hash = hashlib.sha3_224(text.encode()).hexdigest()
-			return hash
-		elif algorithm == 'sha3_256':
-			# If the user specified hashing algorithm is sha3_256, we continue to form it
-
-			hash = hashlib.sha3_256(text.encode()).hexdigest()
-			return hash
-		elif algorithm == 'sha3_384':
-			# If the user specified hashing algorithm is sha3_384, we continue to form it
-
-			hash = hashlib.sha3_384(text.encode()).hexdigest()
-			return hash
-		elif algorithm == 'sha3_512':
-			# If the user specified hashing algorithm is sha3_512, we continue to form it
-
-			hash = hashlib.sha3_512(text.encode()).hexdigest()
-			return hash
-		elif algorithm == 'blake2b':
-			# If the user specified hashing algorithm is blake2b, we continue to form it
-
-			hash = hashlib.blake2b(text.encode()).hexdigest()
-			return hash
-		elif algorithm == 'blake2s':
-			# If the user specified hashing algorithm is blake2s, we continue to form it
-			
-			hash = hashlib.blake2s(text.encode()).hexdigest()
-			return hash
-		elif algorithm == 'fuck':
-			# If the user specified hashing algorithm is fuck, we continue to form it
-
-			# CUSTOM ALGORITHM
-			# NAME : fuck
-			# ----
-			# Generating an hash encryption key
-			key = 0
-			isEven = True
-			text = text.decode()
-			for i in self.text:
-				# Iterating over each character in the encrypted key entered by the user
-					
-				if isEven:
-					# If the current iteration is even number, then we add the char code value
-
-					key += ord(i)
-				else:
-					# If the current iteration is odd number (not even), then we subtract the char code value
+		if arguments != None:
+			# If the arguments are passed, then we continue to execute the task specified
 
-					key -= ord(i)
-			del isEven
+			task = arguments[1] if len(arguments) > 1 else None
+			if task == 'stats':
+				# If the task specified by the user is for displaying the statistics of the cache, then we continue to do so
 
-			# Making the key possitive
-			if key < 0:
-				# If the key value is less than 0, then we change the negative sign to possitive by simply multiplying it with -1
+				self.stats()
+			elif task == 'clear':
+				# If the task specified by the user is for removing all of the entries of the cache, then we continue to do so
 
-				key *= (-1)
+				self.clear()
+				print(f'[$] Digest cache cleared')
+			elif task == '--help' or task == None:
+				# If the user specified the documentation mode, then we continue to display the help text on the console screen
 
-			# Adding the length of the text to itself
-			key += len(self.text)
+				print('hash cache\nUsage : hash cache <stats / clear>\n\n"hash cache" is a tool which serves the functionality of managing the cache of the file digests (used by hash file --cache). The digest of a file is returned from the cache if the file is not modified since it was last hashed.\n\nTasks are :\nstats                 Used to display the number of entries, hits and misses of the cache\nclear                 Used to remove all of the entries of the cache\n\nCheck out the docs for more info.')
+			else:
+				# If the task specified by the user is not recognized, then we display the error message on the console screen
 
-			# Creating the cipher text from the plain text
-			text = ''
-			for character in self.text:
-				# Iterating through each character in the plain text
+				print(f'[ Error : Unrecognized task "{task}" for the command hash cache. Use hash cache --help for more information. ]')
+			self.close()
 
-				text += chr((ord(character) + key) % 256)
+	def key(self, filename):
+		""" This method / function returns the key of the file (the parameter filename) for the cache, i.e., a tuple (location, size, modification time in nanoseconds, inode). """
 
-			# Encoding into the base64 format
-			text = b64encode(text.encode()).decode()
+		information = stat(filename)
+		return (path.abspath(filename), information.st_size, information.st_mtime_ns, information.st_ino)
 
-			# Making the 'fuck' string out of the semi encrypted text
-			hash = ''
-			for index, character in enumerate(text):
-				# Iterating through each character in the text
+	def get(self, key, algorithm):
+		""" This method / function serves the functionality of looking up the digest of the file (the parameter key, as returned by the key() method) for the algorithm in the cache. The entry is used only if the size, modification time and inode of the file are still the same. The function returns the hex digest, or None if it is not cached (or the file is modified). """
 
-				hash += f'fuck{ord(character)}'
-				if index != len(text) - 1:
-					hash += '-' 
-			del text
-			# ----
+		location, size, mtime, inode = key
+		row = self.connection.execute('SELECT digest FROM digests WHERE location = ? AND algorithm = ? AND size = ? AND mtime = ? AND inode = ?', (location, algorithm, size, mtime, inode)).fetchone()
+		if row == None:
+			# If the digest is not cached, then we count a miss
 
-			# Returning the fuck algorithm hash formed
-			return hash
+			self.misses += 1
+			return None
 		else:
-			# If the user specified hashing algorithm is not recognized, then we return 0
-
-			return 0
+			# If the digest is cached, then we count a hit and mark the entry as recently used
+
+			self.hits += 1
+			self.connection.execute('UPDATE digests SET used = ? WHERE location = ? AND algorithm = ?', (time_ns(), location, algorithm))
+			return row[0]
+
+	def put(self, key, algorithm, digest):
+		""" This method / function serves the functionality of storing the digest of the file for the algorithm in the cache. The key (as returned by the key() method) should be taken before the file is hashed, thus if the file is modified while it is being hashed, then the digest is stored under the old key and is never returned for the modified file. If the number of entries exceeds the capacity, then the least recently used entries are evicted. """
+
+		location, size, mtime, inode = key
+		self.connection.execute('INSERT OR REPLACE INTO digests VALUES (?, ?, ?, ?, ?, ?, ?)', (location, size, mtime, inode, algorithm, digest, time_ns()))
+		excess = self.connection.execute('SELECT COUNT(*) FROM digests').fetchone()[0] - self.capacity
+		if excess > 0:
+			# If the number of entries exceeds the capacity, then we evict the least recently used entries
+
+			self.connection.execute('DELETE FROM digests WHERE rowid IN (SELECT rowid FROM digests ORDER BY used LIMIT ?)', (excess, ))
+
+	def stats(self):
+		""" This method / function serves the functionality of displaying the statistics of the cache on the console screen, i.e., the number of entries, the total number of hits and misses, and the size of the database. """
+
+		entries = self.connection.execute('SELECT COUNT(*) FROM digests').fetchone()[0]
+		counters = dict(self.connection.execute('SELECT name, value FROM counters').fetchall())
+		hits = counters.get('hits', 0) + self.hits
+		misses = counters.get('misses', 0) + self.misses
+		print(f'[#] Database : {self.database} ({path.getsize(self.database) / 1024:.1f} KB)')
+		print(f'[#] Entries : {entries} (capacity {self.capacity})')
+		print(f'[#] Hits : {hits}, Misses : {misses} ({(hits / (hits + misses) * 100) if hits + misses > 0 else 0:.1f} % hit rate)')
+
+	def clear(self):
+		""" This method / function serves the functionality of removing all of the entries (and the counters) of the cache. """
+
+		self.connection.execute('DELETE FROM digests')
+		self.connection.execute('DELETE FROM counters')
+		self.hits = 0
+		self.misses = 0
+		self.connection.commit()
+		self.connection.execute('VACUUM')
+
+	def close(self):
+		""" This method / function serves the functionality of saving the changes to the database (along with the hits and misses of the current run) and closing it. """
+
+		for name, value in [('hits', self.hits), ('misses', self.misses)]:
+			self.connection.execute('INSERT INTO counters VALUES (?, ?) ON CONFLICT (name) DO UPDATE SET value = value + ?', (name, value, value))
+		self.hits = 0
+		self.misses = 0
+		self.connection.commit()
+		self.connection.close()
 
 class FileEncryptionCracker:
 	""" """
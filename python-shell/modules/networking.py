@@ -20,6 +20,7 @@ Authors contributed to this script (Add your name below if you have contributed)
 try:
 	# Importing the networks and connections related functions and modules
 	import socket
+	import asyncio
 	from socketserver import TCPServer
 	from http.server import SimpleHTTPRequestHandler
 	from urllib import request, parse
@@ -32,27 +33,421 @@ try:
 
 	# Importing the other functions and modules that are required
 	from os import chdir, path
-	from json import loads
+	from json import loads, dumps
+	import csv
 	from sys import stdout
 	from base64 import b64encode, b64decode
+	from time import monotonic
+	try:
+		from resource import getrlimit, RLIMIT_NOFILE, RLIM_INFINITY
+	except ImportError:
+		# If the resource module is not available (it is available only on the unix platforms), then we do not limit the concurrency to the file descriptors available
+
+		getrlimit = None
 except Exception as e:
 	# If there are any errors during the importing of the modules, then we display the error on the console screen
 
 	input(f'\n[ Error : {e} ]\nPress enter key to continue...')
 	exit()
 
+class PortScanner:
+	""" The class which serves the port scanning engine used by the port scanning tools of the shell (the IP and Connections tools). Instead of checking the ports one after another with a blocking connect, this engine keeps a large number of non-blocking connects (asyncio) in flight at once, bounded by the concurrency limit, each of them with its own connect timeout. The probes are taken lazily from the (host, port) pairs provided, thus even the full port range sweeps never hold more than the concurrency limit worth of connects in memory. Usage is given below :
+
+	scanner = PortScanner(concurrency = 500, timeout = 1, rate = None)
+	scanner.scan(targets = [('127.0.0.1', port) for port in range(1, 1025)], callback = function)
+
+	The concurrency limit is global (shared by all of the hosts), while the rate (if specified) limits the number of probes started per second for each of the hosts separately, thus the sweeps of a whole network can be interleaved across the hosts without flooding any single one of them. The callback (if provided) is called with the arguments host, port, state and latency for each of the probes as soon as it is completed, where the state is either 'open', 'closed', 'filtered' or 'error' (the port could not be checked at all, e.g., out of file descriptors, even after retrying it with a short back-off). The latency (in seconds) is None for the filtered ports (no response before the timeout) and for the errors. The scan() method returns the list of the (host, port) pairs which were found open, and the number of the errors of the scan is stored in the class variable self.errors. On the unix platforms, the concurrency limit is lowered to the number of file descriptors available to the process (minus the class variable self.reservedfds), thus a large concurrency limit never runs the scan out of sockets.
+
+	The connect timeout adapts to each of the hosts, as the TCP retransmission timeout does (RFC 6298) : the round trip time of every response (open or closed port) updates the smoothed round trip time (SRTT) and its variation (RTTVAR) of the host, and the following connects to that host wait for SRTT + 4 * RTTVAR seconds, clamped between the class variable self.mintimeout and the timeout specified (which is also used for the hosts without any responses yet). As a shortened timeout is ambiguous (the port may be filtered, or the response may just be late), the probes which time out before the full timeout are retried (atmost self.retries times) with a doubled timeout. The global default socket timeout is never changed.
+
+	The discover() method serves a fast host discovery (liveness check) before the expensive port scans, by probing only a handful of common ports (the class variable commonports) of each of the hosts. """
+
+	# The ports probed during the host discovery
+	commonports = [80, 443, 22, 445, 139, 135, 3389, 8080, 21, 23, 25, 53, 8022, 8000]
+
+	# The number of file descriptors left for the rest of the shell (the concurrency limit never uses them), and the delays (in seconds) before the probes which could not create a socket are tried again
+	reservedfds = 64
+	backoffs = [0.05, 0.1, 0.2, 0.4, 0.8, 1.6]
+
+	def __init__(self, concurrency = 500, timeout = 1, rate = None, retries = 1, mintimeout = 0.05):
+		# Setting some class properties
+		# ----
+		try:
+			self.concurrency = int(concurrency)
+			self.timeout = float(timeout)
+			self.rate = None if rate == None else float(rate)
+			self.retries = int(retries)
+			self.mintimeout = min(float(mintimeout), self.timeout)
+		except ValueError:
+			# If there are errors in parsing the concurrency limit, the timeout, the rate or the retries to the numeric format, then we raise an error
+
+			raise ValueError('Invalid concurrency limit, timeout or rate specified. Requires to be a numeric value (atleast 1 for concurrency, more than 0 for timeout and rate).')
+		self.schedule = {}  # The time at which the next probe of each of the hosts is allowed to be started (used only if the rate is specified)
+		self.rtt = {}  # The smoothed round trip time and its variation, i.e., [SRTT, RTTVAR] of each of the hosts (in seconds)
+		# ----
+
+		# Validating the concurrency limit, the timeout and the rate
+		if self.concurrency < 1 or self.timeout <= 0 or (self.rate != None and self.rate <= 0) or self.retries < 0:
+			# If the concurrency limit, the timeout or the rate is out of the valid range, then we raise an error
+
+			raise ValueError('Invalid concurrency limit, timeout or rate specified. Requires to be a numeric value (atleast 1 for concurrency, more than 0 for timeout and rate).')
+
+		# Limiting the concurrency to the file descriptors available (each of the connects in flight holds a socket)
+		if getrlimit != None:
+			# If the limit of the file descriptors can be read, then we make sure that the connects in flight never exhaust it
+
+			limit = getrlimit(RLIMIT_NOFILE)[0]
+			if limit != RLIM_INFINITY and self.concurrency > limit - self.reservedfds:
+				# If the concurrency limit is more than the file descriptors available, then we lower it
+
+				self.concurrency = max(1, limit - self.reservedfds)
+
+	def discover(self, hosts, ports = None, callback = None):
+		""" This method / function serves the functionality of checking which of the specified hosts are up, and returns the list of them (in the same order as specified). The common ports (or the specified ports) of all of the hosts are probed concurrently, and a host is marked up as soon as any of its ports responds, either by accepting or by refusing the connection (a refused connection also means that the host is up). The probes left for a host are skipped once it is marked up. The callback (if specified) is called with the arguments host, port, state and latency of the first response of each of the hosts, as soon as it is marked up. """
+
+		# Setting the discovery state
+		self.live = set()
+		self.onlive = callback
+
+		# Probing the hosts
+		self.scan(targets = self.candidates(hosts, self.commonports if ports == None else ports), callback = self.markalive)
+		return [host for host in hosts if host in self.live]
+
+	def candidates(self, hosts, ports):
+		""" This method / function serves the functionality of generating the (host, port) pairs to be probed during the host discovery, interleaved across the hosts. The hosts which are already marked up are skipped. """
+
+		for port in ports:
+			# Iterating through each port number
+
+			for host in hosts:
+				# Iterating through each host
+
+				if host not in self.live:
+					# If the host is not yet marked up, then we probe it on the current port
+
+					yield host, port
+
+	def markalive(self, host, port, state, latency):
+		""" This method / function serves the functionality of handling the result of each of the probes made during the host discovery (it is the callback for the scan() method). The host is marked up if the port is either open or closed (i.e., the host responded). """
+
+		if state in ('open', 'closed') and host not in self.live:
+			# If the host responded and it is not yet marked up, then we mark it up
+
+			self.live.add(host)
+			if self.onlive != None:
+				# If the callback is specified, then we report the host to it
+
+				self.onlive(host, port, state, latency)
+
+	def scan(self, targets, callback = None):
+		""" This method / function serves the functionality of probing each of the (host, port) pairs of the targets (any iterable, even a generator) and returns the list of the (host, port) pairs which were found open. The callback (if specified) is called for each of the probe results as soon as they are available, see the class docstring for the arguments. """
+
+		return asyncio.run(self.run(iter(targets), callback))
+
+	async def run(self, targets, callback):
+		""" This method / function serves the functionality of starting self.concurrency number of worker coroutines, which share the same iterator of the (host, port) pairs, and waiting for them to be finished. Returns the list of the (host, port) pairs which were found open. """
+
+		found = []
+		self.errors = 0
+		await asyncio.gather(*[self.worker(targets, callback, found) for i in range(self.concurrency)])
+		return found
+
+	async def worker(self, targets, callback, found):
+		""" This method / function serves the functionality of probing the (host, port) pairs taken from the shared iterator one after another, until the iterator is exhausted. As all of the workers run on the same event loop, there is always atmost one of them taking the next pair from the iterator. """
+
+		for host, port in targets:
+			# Iterating through each (host, port) pair left in the shared iterator
+
+			await self.throttle(host)
+			state, latency = await self.probe(host, port)
+			if state == 'open':
+				# If the port was found open, then we append it to the list of the found ports
+
+				found.append((host, port))
+			elif state == 'error':
+				# If the port could not be checked at all, then we count it (the number of errors is reported in the scan summary)
+
+				self.errors += 1
+
+			# Checking for the callback
+			if callback != None:
+				# If the callback is specified, then we report the result of the probe to it
+
+				callback(host, port, state, latency)
+
+	async def throttle(self, host):
+		""" This method / function serves the functionality of limiting the number of probes started per second for the specified host to the rate stored in the class variable self.rate. Each call reserves the next free time slot of the host (the slots are 1 / rate seconds apart), and waits till that slot if it is in the future. If the rate is not specified, then the probes are never delayed. """
+
+		# Checking for the rate
+		if self.rate == None:
+			# If the rate is not specified, then we do not delay the probe
+
+			return
+
+		now = monotonic()
+		slot = max(now, self.schedule.get(host, now))
+		self.schedule[host] = slot + 1 / self.rate
+		if slot > now:
+			# If the reserved slot is in the future, then we wait till then
+
+			await asyncio.sleep(slot - now)
+
+	async def probe(self, host, port):
+		""" This method / function serves the functionality of checking a single port of the host, and returns the tuple (state, latency). The connect timeout is taken from the round trip time estimation of the host (see the connecttimeout() method), and the connects which time out before the full timeout are retried with a doubled timeout (atmost self.retries times). The round trip time estimation of the host is updated with the latency of every response. """
+
+		timeout = self.connecttimeout(host)
+		for attempt in range(self.retries + 1):
+			# Iterating through each attempt of the connect
+
+			state, latency = await self.tryconnect(host, port, timeout)
+			if state == 'error':
+				# If the port could not be checked at all (even after the back-off), then we return the error right away (there is no response to learn from)
+
+				return state, latency
+			elif state != 'filtered':
+				# If the host responded (the port is open or closed), then we update the round trip time estimation of the host and return the result
+
+				self.updatertt(host, latency)
+				return state, latency
+			elif timeout >= self.timeout:
+				# If the connect timed out even with the full timeout, then we mark the port as filtered (no more retries)
+
+				break
+			else:
+				# If the connect timed out with a shortened timeout (ambiguous), then we retry with a doubled timeout
+
+				timeout = min(timeout * 2, self.timeout)
+		return 'filtered', None
+
+	async def tryconnect(self, host, port, timeout):
+		""" This method / function serves the functionality of checking a single port of the host (see the connect() method), and returns the tuple (state, latency). If the socket could not be created (out of file descriptors, etc), then the connect is tried again after a short back-off (the delays listed in the class variable self.backoffs), giving the other connects in flight the time to release their sockets. The port is marked 'error' only if the socket could not be created even after the last back-off. """
+
+		for delay in self.backoffs:
+			# Iterating through each back-off delay
+
+			state, latency = await self.connect(host, port, timeout)
+			if state != 'error':
+				# If the port is checked, then we return the result
+
+				return state, latency
+			await asyncio.sleep(delay)
+		return await self.connect(host, port, timeout)
+
+	def connecttimeout(self, host):
+		""" This method / function serves the functionality of returning the connect timeout (in seconds) for the specified host, i.e., SRTT + 4 * RTTVAR clamped between self.mintimeout and self.timeout. The full timeout (self.timeout) is returned for the hosts without any round trip time samples yet. """
+
+		# Checking for the round trip time samples of the host
+		if host not in self.rtt:
+			# If there are no samples for the host yet, then we use the full timeout
+
+			return self.timeout
+
+		srtt, rttvar = self.rtt[host]
+		return min(max(srtt + 4 * rttvar, self.mintimeout), self.timeout)
+
+	def updatertt(self, host, sample):
+		""" This method / function serves the functionality of updating the smoothed round trip time (SRTT) and the round trip time variation (RTTVAR) of the specified host with a new round trip time sample (in seconds), as per specified in the RFC 6298 (alpha = 1/8, beta = 1/4). """
+
+		# Checking for the previous samples of the host
+		if host not in self.rtt:
+			# If this is the first sample of the host, then we initialize the estimation with it
+
+			self.rtt[host] = [sample, sample / 2]
+		else:
+			# If there are previous samples of the host, then we update the estimation with the new sample
+
+			srtt, rttvar = self.rtt[host]
+			rttvar = 0.75 * rttvar + 0.25 * abs(srtt - sample)
+			srtt = 0.875 * srtt + 0.125 * sample
+			self.rtt[host] = [srtt, rttvar]
+
+	async def connect(self, host, port, timeout):
+		""" This method / function serves the functionality of checking a single port of the host with a non-blocking connect (with the specified timeout in seconds), and returns the tuple (state, latency). The port is 'open' if the connection is made, 'closed' if the connection is refused (the host is up but nothing listens on the port) and 'filtered' if there is no response before the timeout (or the host is unreachable). If the socket itself could not be created (out of file descriptors, etc), then the port is marked 'error' instead of stopping the scan. The host should be an IP address, as the hostnames would be resolved on every connect. """
+
+		loop = asyncio.get_running_loop()
+		connection = None
+		started = monotonic()
+		try:
+			connection = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+			connection.setblocking(False)
+			await asyncio.wait_for(loop.sock_connect(connection, (host, port)), timeout)
+			latency = monotonic() - started
+
+			# Checking for a self connect (while scanning the local machine, the connect can land on its own source port, which is not a listening port)
+			try:
+				selfconnect = connection.getsockname() == connection.getpeername()
+			except OSError:
+				selfconnect = True
+		except asyncio.TimeoutError:
+			# If there is no response from the host before the timeout, then we mark the port as filtered
+
+			return 'filtered', None
+		except ConnectionRefusedError:
+			# If the connection is refused by the host, then we mark the port as closed
+
+			return 'closed', monotonic() - started
+		except OSError:
+			# If there are any other errors, then we check whether the socket was even created
+
+			if connection == None:
+				# If the socket could not be created (out of file descriptors, etc), then we mark the port as an error (the port is not checked at all)
+
+				return 'error', None
+			else:
+				# If the connect failed (host unreachable, etc), then we mark the port as filtered
+
+				return 'filtered', None
+		finally:
+			if connection != None:
+				connection.close()
+
+		# Checking the result of the connect
+		if selfconnect:
+			# If the connection is made to itself (or it is already reset), then we mark the port as closed
+
+			return 'closed', latency
+		else:
+			# If the connection is made to a listening port of the host, then we mark the port as open
+
+			return 'open', latency
+
+class ScanWriter:
+	""" The class which serves the structured output of the port scan results of the shell tools (IP and Connections), i.e., each of the results (host, port, state, latency) is written to the output file as soon as it is available, instead of only being displayed on the console screen. The format of the output file is chosen by its extension, either JSON lines (.jsonl, one JSON object per result) or CSV (.csv, with a header row). The latency is in seconds and is left empty (null) for the filtered ports. The writes are buffered, and the buffer is flushed atleast once per second, thus the output file can be followed (piped) while the scan is still running. Usage is given below :
+
+	writer = ScanWriter(filename = 'results.jsonl')
+	writer.write('127.0.0.1', 22, 'open', 0.001)
+	writer.close() """
+
+	def __init__(self, filename, buffersize = 1048576):
+		# Checking the format of the output file
+		extension = path.splitext(filename)[1].lower()
+		if extension == '.jsonl':
+			# If the output file is a JSON lines file, then we continue
+
+			self.format = 'jsonl'
+		elif extension == '.csv':
+			# If the output file is a CSV file, then we continue
+
+			self.format = 'csv'
+		else:
+			# If the output file is neither a JSON lines file nor a CSV file, then we raise an error
+
+			raise ValueError('Unsupported output file format. Requires to be a .jsonl or a .csv file.')
+
+		# Setting some class properties
+		# ----
+		self.filename = filename
+		self.file = open(filename, 'w', buffering = buffersize, newline = '')
+		self.lastflush = monotonic()
+		# ----
+
+		# Writing the header row (for the CSV files)
+		if self.format == 'csv':
+			# If the output file is a CSV file, then we write the header row
+
+			self.writer = csv.writer(self.file)
+			self.writer.writerow(['host', 'port', 'state', 'latency'])
+
+	def write(self, host, port, state, latency):
+		""" This method / function serves the functionality of writing a single result of the port scan to the output file (into the buffer). The buffer is flushed if it was not flushed in the last second. """
+
+		# Rounding off the latency (to microseconds)
+		if latency != None:
+			latency = round(latency, 6)
+
+		# Writing the result
+		if self.format == 'jsonl':
+			# If the output file is a JSON lines file, then we write the result as a JSON object
+
+			self.file.write(dumps({'host' : host, 'port' : port, 'state' : state, 'latency' : latency}) + '\n')
+		else:
+			# If the output file is a CSV file, then we write the result as a row
+
+			self.writer.writerow([host, port, state, '' if latency == None else latency])
+
+		# Flushing the buffer (atmost once per second)
+		now = monotonic()
+		if now - self.lastflush >= 1:
+			# If the buffer was not flushed in the last second, then we flush it
+
+			self.lastflush = now
+			self.file.flush()
+
+	def close(self):
+		""" This method / function serves the functionality of flushing the buffer and closing the output file. """
+
+		self.file.close()
+
 class IP:
 	""" The class which serves the features of the IP tools and commands of the shell. The class defines some functions / methods which serves some of the particular tasks as per specified. This class serves the commands relating to the ip, else. The tasks served by this class / tool are listed below :
 	1. IP tracking
 	2. Port Scanning
 	3. Local IP address information fetching
-	4. Get the particular IP address from a hostname. """
+	4. Get the particular IP address from a hostname.
 
-	def __init__(self, address = None):
+	The port scans are executed by the PortScanner engine, the concurrency limit (number of connects in flight at once) and the maximum per-connect timeout (in seconds, adapted to the response time of the host) of which can be specified either directly via the parameters concurrency and timeout, or via the argument tokens '--concurrency' / '-c' and '--timeout' / '-t'. If the host discovery is enabled (the parameter discover, or the argument token '--discover' / '-d'), then the host is first checked on a few common ports, and the full port scan is skipped if it is not up. The result of each of the ports scanned can also be streamed to a .jsonl or .csv file (the parameter output, or the argument token '--output' / '-o'), see the ScanWriter class. """
+
+	def __init__(self, address = None, arguments = [], concurrency = 500, timeout = 1, discover = False, output = None):
 
 		# Assigning the user specified address of the host as a class variable
 		self.address = address
 
+		# Setting some class properties
+		# ----
+		self.concurrency = concurrency
+		self.timeout = timeout
+		self.discover = discover
+		self.output = output
+		# ----
+
+		# Parsing the argument sent to this class while creating the object
+		for index, argument in enumerate(arguments):
+			# Iterating through each argument item
+
+			if argument == '--concurrency' or argument == '-c':
+				# If the argument is for specifying the concurrency limit of the port scans, then we continue to parse the next argument as the entered value
+
+				try:
+					self.concurrency = int(arguments[index + 1])
+				except IndexError:
+					# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
+
+					continue
+				except ValueError:
+					# If there are errors in parsing the concurrency limit input from the user to integer format, then we raise an error
+
+					raise ValueError('Invalid concurrency limit specified. Requires to be a numeric value (atleast 1).')
+			elif argument == '--timeout' or argument == '-t':
+				# If the argument is for specifying the per-connect timeout of the port scans, then we continue to parse the next argument as the entered value
+
+				try:
+					self.timeout = float(arguments[index + 1])
+				except IndexError:
+					# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
+
+					continue
+				except ValueError:
+					# If there are errors in parsing the timeout input from the user to float format, then we raise an error
+
+					raise ValueError('Invalid timeout specified. Requires to be a numeric value (in seconds).')
+			elif argument == '--discover' or argument == '-d':
+				# If the argument is for enabling the host discovery before the port scans, then we mark the discovery mode True
+
+				self.discover = True
+			elif argument == '--output' or argument == '-o':
+				# If the argument is for specifying the output file for the port scan results, then we continue to parse the next argument as the entered value
+
+				try:
+					self.output = arguments[index + 1]
+				except IndexError:
+					# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
+
+					continue
+			else:
+				# If the currently iterated argument is not recognized, then we skip the current iteration
+
+				continue
+
 	def track(self):
 		""" This method / function serves the task of tracking the information of the user specified IP address. The information is fetched using an external API service (http://ipinfo.io/). The user specified IP address is taken out from the class variable self.address. """
 
@@ -99,31 +494,21 @@ class IP:
 				print(f'[ Error : Unsupported value for port numbers. Numeric values required. ]')
 				return 0
 		
-		# Defining a list which will store the ports which were found open during port scan
-		openPorts = []
-
-		# Executing the attack
-		for port in range(initial, final + 1):
-			# Intiating a connection to the target host with the currently iterated port number
-			connection = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-			socket.setdefaulttimeout(1) 
-
-			# Returns an error indicator 
-			result = connection.connect_ex((self.address, port)) 
-			stdout.write('\r')
-			if result == 0:
-				# If the port is open
+		# Validating the port number range
+		if initial < 1 or final > 65535 or initial > final:
+			# If the port number range is not valid, then we display the error on the console screen
 
-				stdout.write('[!] Port %d : open' %port)
-				openPorts.append(port)
-			else:
-				# If the port is not open (i.e., closed)
+			print(f'[ Error : Invalid port number range specified. Port numbers should be in the range 1 to 65535. ]')
+			return 0
 
-				stdout.write('[!] Port %d : closed' %port)
-			stdout.flush()
+		# Executing the port scan
+		try:
+			openPorts = self.scanports(range(initial, final + 1))
+		except socket.gaierror:
+			# If the address of the target could not be resolved, then we display the error on the console screen
 
-			# Closing the initiated connection
-			connection.close()
+			print(f'[ Error : Failed to resolve the address "{self.address}". ]')
+			return 0
 
 		# Displaying the filtered and open ports on the console screen
 		print('\n\nThe ports which were found open during the port scan are listed below : ')
@@ -137,6 +522,12 @@ class IP:
 			for port in openPorts:
 				print(f'[#] {port}')
 
+		# Checking for the ports which could not be scanned
+		if self.errors != 0:
+			# If some of the ports could not be scanned at all (out of file descriptors, etc), then we display the number of them on the console screen
+
+			print(f'[ Error : {self.errors} ports could not be scanned (out of file descriptors, etc), their state is unknown. Try again with a lower concurrency limit (--concurrency). ]')
+
 	def localinfo(self):
 		""" This method / function serves the task of fetching the information about the local IP address. The self.address field might not be required to be present for using this particular function. We will directly call this function from the class. """
 
@@ -151,36 +542,11 @@ class IP:
 		# Displaying the fetched information on the console screen (Also fetching them during the print process)
 		print(f'\nLocal information :\n[#] Local hostname : {self.address}\n[#] Local IP address : {socket.gethostbyname(self.address)}')
 
-		# Scanning open ports on the local machine
-		ports = []  # The list to store the ports on the local machine which were found open during the port scan
-		stdout.write('\r')
-		for port in range(1, 65536):
-			# Iterating through each port number from 1 to 65535
-
-			# Displaying the port scan information on the console screen
-			stdout.write(f'[ Scanning ports : {port} ]')
-
-			# Intiating a connection to the target host with the currently iterated port number
-			connection = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-			socket.setdefaulttimeout(1) 
-
-			# Returns an error indicator 
-			result = connection.connect_ex((self.address, port)) 
-			stdout.write('\r')
-			if result == 0:
-				# If the port is open, then we append it to the ports list
-
-				openPorts.append(port)
-			else:
-				# If the port is not open (i.e., closed)
-
-				continue
-
-			# Closing the initiated connection
-			connection.close()
+		# Scanning open ports on the local machine (The list to store the ports on the local machine which were found open during the port scan)
+		ports = self.scanports(range(1, 65536))
 
 		# Checking the result of the port scan
-		stdout.write(f'[#] Ports found open : ',)
+		stdout.write(f'\r[#] Ports found open : ',)
 		stdout.flush()
 		if len(ports) == 0:
 			# If there are no open ports were found during the port scan
@@ -232,33 +598,11 @@ class IP:
 			final = 65535
 			print('[ Executing the port scanner with default ports (i.e., 1 to 65535) ]')
 		
-		# Defining a list which will store the ports which were found open during port scan
-		ports = []
-
-		# Executing the attack
-		for port in range(initial, final + 1):
-			# Intiating a connection to the target host with the currently iterated port number
-			connection = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-			socket.setdefaulttimeout(1) 
-
-			# Returns an error indicator 
-			result = connection.connect_ex((self.address, port)) 
-			stdout.write('\r')
-			if result == 0:
-				# If the port is open
-
-				stdout.write('[!] Port %d : open' %port)
-				ports.append(port)
-			else:
-				# If the port is not open (i.e., closed)
-
-				stdout.write('[!] Port %d : closed' %port)
-
-			# Closing the initiated connection
-			connection.close()
+		# Executing the port scan (Defining a list which will store the ports which were found open during port scan)
+		ports = self.scanports(range(initial, final + 1))
 
 		# Displaying the filtered and open ports on the console screen
-		stdout.write('Ports found open : ')
+		stdout.write('\rPorts found open : ')
 		stdout.flush()
 		if len(ports) == 0:
 			# If there are no open ports found on the target in the port scan, then we continue to display the no ports found message on the console screen
@@ -270,6 +614,60 @@ class IP:
 			for port in ports:
 				print(port, end = ', ')
 
+	def scanports(self, ports):
+		""" This method / function serves the functionality of scanning the specified ports (any sized iterable of port numbers, like a range) of the host stored in the class variable self.address, using the PortScanner engine with the concurrency limit and the timeout stored in the class variables self.concurrency and self.timeout. The address is resolved only once before the scan. The ports are displayed on the console screen as soon as they are found open, along with a progress line (see the report() method). If the host discovery is enabled (the class variable self.discover), then the port scan is skipped for the hosts which are not up. If the output file is specified (the class variable self.output), then the result of each of the ports is also written to it. Returns the sorted list of the port numbers which were found open. """
+
+		# Resolving the address of the target (if a hostname is specified, then it would be otherwise resolved on every probe)
+		address = socket.gethostbyname(self.address)
+
+		# Setting the progress counters
+		self.checked = 0
+		self.total = len(ports)
+		self.lastprogress = 0
+		self.errors = 0
+
+		# Checking whether the host is up (if the host discovery is enabled)
+		scanner = PortScanner(concurrency = self.concurrency, timeout = self.timeout)
+		if self.discover and len(scanner.discover(hosts = [address])) == 0:
+			# If the host did not respond on any of the common ports, then we skip the port scan
+
+			print(f'[!] The host {address} did not respond on any of the common ports, skipping the port scan (scan without --discover to force it)')
+			return []
+
+		# Executing the port scan (the results are also written to the output file, if specified)
+		self.writer = None if self.output == None else ScanWriter(filename = self.output)
+		try:
+			found = scanner.scan(targets = ((address, port) for port in ports), callback = self.report)
+			self.errors = scanner.errors
+		finally:
+			if self.writer != None:
+				# If the output file is opened, then we close it
+
+				self.writer.close()
+		return sorted([port for host, port in found])
+
+	def report(self, host, port, state, latency):
+		""" This method / function serves the functionality of handling the result of each of the probes made during the port scan (it is the callback for the PortScanner engine). The open ports are displayed on the console screen as soon as they are found (and all of the results are written to the output file, if specified), and the progress line (number of ports scanned) is updated atmost 4 times per second. """
+
+		self.checked += 1
+		if self.writer != None:
+			# If the output file is specified, then we write the result to it
+
+			self.writer.write(host, port, state, latency)
+		if state == 'open':
+			# If the port is found open, then we display it on the console screen
+
+			print('\r%-50s' %(f'[!] Port {port} : open'))
+
+		# Updating the progress line
+		now = monotonic()
+		if now - self.lastprogress >= 0.25 or self.checked == self.total:
+			# If the progress line was not updated in the last 0.25 seconds (or the scan is completed), then we update it
+
+			self.lastprogress = now
+			stdout.write(f'\r[ Scanned {self.checked} / {self.total} ports ]')
+			stdout.flush()
+
 class HttpServer:
 	""" The class which serves the features of the HttpServer tool / command of the shell. The class contains certain functions (methods) defined within itself. The simple server can be launched by just calling the class as an object. """
 
@@ -373,7 +771,10 @@ class Connections:
 	Some notable points for this class and internal defined variables :
 	1. Only IPv4 type address are accepted by this tool, and there are two types of addresses taken in by this function. 1st is the IP address in format xxx.xxx.xxx (Here all the combinations of 1-255 numbers are used post in order to check for connections), and 2nd type is xxx.xxx.xxx.xxx (Here only this single specified IP address is checked for connections).
 	2. If the port number 0 entered by the user, then the tool scans for all the port numbers ranging from 1 to 65535. Otherwise they check for a particular port numer. This port number is defined by the argument '-p' or '--port'.
-	3. Same if the user does not specifies the port number in the arguments, then the tool checks for all the port numbers ranging from 1 to 65535. """
+	3. Same if the user does not specifies the port number in the arguments, then the tool checks for all the port numbers ranging from 1 to 65535.
+	4. The 'discover' task (and the '--discover' / '-d' argument for the 'list' task) checks which of the devices are up by probing a few common ports, and the 'list' task then checks the connections of only those devices.
+	5. The result of each of the connections checked (or of each of the devices found up, for the 'discover' task) can also be streamed to a .jsonl or .csv file, specified by the argument '--output' / '-o' (see the ScanWriter class).
+	6. The connections are checked by the PortScanner engine, with the concurrency limit (number of connections checked at once, '--concurrency' / '-c'), the maximum connect timeout in seconds, adapted to the response time of each of the devices ('--timeout' / '-t') and the number of connections checked per second for each of the devices ('--rate' / '-r') specified by the user. """
 
 	def __init__(self, arguments = [], task = None):
 		# Setting the self.port and self.address class variables
@@ -381,6 +782,13 @@ class Connections:
 		self.address = None
 		self.documentation = False
 
+		# Setting the port scanner properties to their default values
+		self.concurrency = 500
+		self.timeout = 1
+		self.rate = None
+		self.discover = False
+		self.output = None
+
 		# Parsing the argument sent to this class while creating the object
 		for index, argument in enumerate(arguments):
 			# Iterating through each argument item
@@ -406,6 +814,58 @@ class Connections:
 				except IndexError:
 					# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
 
+					continue
+			elif argument == '--concurrency' or argument == '-c':
+				# If the argument is for specifying the number of connections checked at once, then we continue to parse the next argument as the entered value
+
+				try:
+					self.concurrency = int(arguments[index + 1])
+				except IndexError:
+					# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
+
+					continue
+				except ValueError:
+					# If there are errors in parsing the concurrency limit input from the user to integer format, then we raise an error
+
+					raise ValueError('Invalid concurrency limit specified. Requires to be a numeric value (atleast 1).')
+			elif argument == '--timeout' or argument == '-t':
+				# If the argument is for specifying the connect timeout, then we continue to parse the next argument as the entered value
+
+				try:
+					self.timeout = float(arguments[index + 1])
+				except IndexError:
+					# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
+
+					continue
+				except ValueError:
+					# If there are errors in parsing the timeout input from the user to float format, then we raise an error
+
+					raise ValueError('Invalid timeout specified. Requires to be a numeric value (in seconds).')
+			elif argument == '--rate' or argument == '-r':
+				# If the argument is for specifying the number of connections checked per second for each device, then we continue to parse the next argument as the entered value
+
+				try:
+					self.rate = float(arguments[index + 1])
+				except IndexError:
+					# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
+
+					continue
+				except ValueError:
+					# If there are errors in parsing the rate input from the user to float format, then we raise an error
+
+					raise ValueError('Invalid rate specified. Requires to be a numeric value (connections per second).')
+			elif argument == '--discover' or argument == '-d':
+				# If the argument is for checking which of the devices are up before listing the connections, then we mark the discovery mode True
+
+				self.discover = True
+			elif argument == '--output' or argument == '-o':
+				# If the argument is for specifying the output file for the results, then we continue to parse the next argument as the entered value
+
+				try:
+					self.output = arguments[index + 1]
+				except IndexError:
+					# If the next argument is out of the list index (i.e., it does not exists), then we continue for the next iteration
+
 					continue
 			elif argument == '--help':
 				# If the argument is for displaying the help information, then we mark the documentation mode True
@@ -420,7 +880,7 @@ class Connections:
 		if self.documentation:
 			# If the class object is called for displaying the documentation, then we continue displaying the help section contents
 
-			print('connections\nUsage : connections [task] <arguments>\n\n"connections" is a tool which provides the feature of serving various tasks related to networks and connections. Currently servers tasks are listed below with the specific command to invoke them.\n\nconnections list <arguments>    Lists all the active connections in the local address / user provided network address\nconnections check-ssh <arguments>    Checks for availablity of SSH connections on the network\n\nArguments that can be used are :\n--port, -p            Used to specify the port number\n--ip-address, -i     Used to specify the IP address of the device\n--help               Displays this text\n\nUsage :\n[Listing available connections on a network]\n1. For listing available connections in network with IP address format in 192.168.43.xxx, we may scan all the ports of each devices using the command specified below\nconnections list -i 192.168.43\n\n2. For listing available connections in network with IP address format in 192.168.43.xxx + fixed port number, we may scan all the ports of each devices using the command specified below\nconnections list -i 192.168.43 -p 80\n\n3. For listing available connections in a single device (the available ports) (device IP : 192.168.43.1 For example), we use the command specified below\nconnections list -i 192.68.43.1\n\n4. For listing available connections in a single device (the available ports) (device IP : 192.168.43.1 For example + fixed port number), we use the command specified below\nconnections list -i 192.68.43.1 -p 80\n\nSummary : Either you can scan all the devices on the network (192.xxx.xxx.1 to 192.xxx.xxx.255) or any particular device. Either you can scan all the ports ranging 1 to 65535, or just a specific port of the network devices.\n\n[Checking SSH connection availability]\n1. List all the available SSH connections on the network, with IP address format 192.168.43.xxx, use the below command (It checks for port 22 and 8022 for all the devices 1-255).\nconnections check-ssh -i 192.168.43\n\n2. Check for a particular port for SSH connection of all the devices in the network (with IP address of format 192.168.43.xxx), we use the below specified command.\nconnections check-ssh -i 192.168.43 -p 8022\n\n3. Check for a particular device on the network for SSH connection (For example, IP : 192.168.43.1 with all the ports), we use the below specified command.\nconnections check-ssh -i 192.168.43.1\n\n4. Check for a particular device on the network for SSH connection with a particular port number specified (For example, IP : 192.168.43.1, port : 22), we use the below specified command :\nconnections check-ssh -i 192.168.43.1 -p 22\n\nSummary : Either you can scan all the devices on the network (192.xxx.xxx.1 to 192.xxx.xxx.255) or any particular device. Either you can scan all the ports ranging 1 to 65535, or just a specific port of the network devices.\n\nSee the docs of this project for more information about this tool (connections).')
+			print('connections\nUsage : connections [task] <arguments>\n\n"connections" is a tool which provides the feature of serving various tasks related to networks and connections. Currently servers tasks are listed below with the specific command to invoke them.\n\nconnections list <arguments>    Lists all the active connections in the local address / user provided network address\nconnections check-ssh <arguments>    Checks for availablity of SSH connections on the network\nconnections discover <address>    Lists the devices which are up in the network\n\nArguments that can be used are :\n--port, -p            Used to specify the port number\n--ip-address, -i     Used to specify the IP address of the device\n--concurrency, -c    Used to specify the number of connections checked at once (default 500)\n--timeout, -t        Used to specify the maximum connect timeout in seconds, adapted to the response time of each device (default 1)\n--rate, -r           Used to limit the number of connections checked per second for each device\n--discover, -d       Used to check the connections of only the devices which are up\n--output, -o         Used to stream the results to a .jsonl or .csv file (host, port, state, latency)\n--help               Displays this text\n\nUsage :\n[Listing available connections on a network]\n1. For listing available connections in network with IP address format in 192.168.43.xxx, we may scan all the ports of each devices using the command specified below\nconnections list -i 192.168.43\n\n2. For listing available connections in network with IP address format in 192.168.43.xxx + fixed port number, we may scan all the ports of each devices using the command specified below\nconnections list -i 192.168.43 -p 80\n\n3. For listing available connections in a single device (the available ports) (device IP : 192.168.43.1 For example), we use the command specified below\nconnections list -i 192.68.43.1\n\n4. For listing available connections in a single device (the available ports) (device IP : 192.168.43.1 For example + fixed port number), we use the command specified below\nconnections list -i 192.68.43.1 -p 80\n\n5. For listing available connections of only the devices which are up in the network (checked on a few common ports first), we use the command specified below\nconnections list -i 192.168.43 --discover\n\n6. For saving the result of each of the connections checked to a file (JSON lines or CSV, written while the scan is running), we use the command specified below\nconnections list -i 192.168.43 -p 80 --output results.jsonl\n\nSummary : Either you can scan all the devices on the network (192.xxx.xxx.1 to 192.xxx.xxx.255) or any particular device. Either you can scan all the ports ranging 1 to 65535, or just a specific port of the network devices.\n\n[Discovering the devices on the network]\n1. For listing the devices which are up in the network with IP address format 192.168.43.xxx, we use the command specified below\nconnections discover 192.168.43\n\n[Checking SSH connection availability]\n1. List all the available SSH connections on the network, with IP address format 192.168.43.xxx, use the below command (It checks for port 22 and 8022 for all the devices 1-255).\nconnections check-ssh -i 192.168.43\n\n2. Check for a particular port for SSH connection of all the devices in the network (with IP address of format 192.168.43.xxx), we use the below specified command.\nconnections check-ssh -i 192.168.43 -p 8022\n\n3. Check for a particular device on the network for SSH connection (For example, IP : 192.168.43.1 with all the ports), we use the below specified command.\nconnections check-ssh -i 192.168.43.1\n\n4. Check for a particular device on the network for SSH connection with a particular port number specified (For example, IP : 192.168.43.1, port : 22), we use the below specified command :\nconnections check-ssh -i 192.168.43.1 -p 22\n\nSummary : Either you can scan all the devices on the network (192.xxx.xxx.1 to 192.xxx.xxx.255) or any particular device. Either you can scan all the ports ranging 1 to 65535, or just a specific port of the network devices.\n\nSee the docs of this project for more information about this tool (connections).')
 		else:
 			# If the class object is called for executing tasks instead of the documentation mode, then we continue
 
@@ -493,6 +953,10 @@ class Connections:
 				# If the task assigned by the user is to check for ssh connections, then we continue
 
 				self.checkSSH()
+			elif task == 'discover':
+				# If the task assigned by the user is to list the devices which are up, then we continue
+
+				self.discoverHosts()
 			else:
 				# If the task assigned by the user is not recognized, then we we display the error on the console screen
 
@@ -507,135 +971,180 @@ class Connections:
 
 		# Checking for the IP address type
 		if self.addressType == 'half':
-			# If the IP address entered by the user is half type address, then we continue
+			# If the IP address entered by the user is half type address, then we continue with all the devices on the network
+
+			hosts = [f'{self.address}{i}' for i in range(1, 256)]
+		elif self.addressType == 'full':
+			# If the IP address entered by the user is full type address, then we continue with the single device
+
+			hosts = [self.address]
+		else:
+			# If the IP address entered by the user is not recognized by any of the types, then we display the error message on the console screen
 
-			for i in range(1, 256):
-				# Checking for all the devices on the network
+			print(f'[ Error : Improper IP address provided or failed to render the input from the user. ]')
+			return 0
 
-				# Checking the port number input
-				if self.port == 0:
-					# If the port number is 0, then we check for all the ports ranging from 1 to 65535
+		# Checking the port number input
+		if self.port == 0:
+			# If the port number is 0, then we check for all the ports ranging from 1 to 65535
 
-					for port in range(1, 65536):
-						# Iterating through each port number
+			ports = range(1, 65536)
+		else:
+			# If the port number is something more specific, then we check for connection to that specific port number
 
-						# Establishing a connection to the currently iterated device (with the IP address) with the specified port number
-						connection = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-						socket.setdefaulttimeout(1)
-						result = connection.connect_ex((f'{self.address}{i}', port))
-						stdout.write('\r')
-						stdout.write('[!] Checking connection at %-20s' %(f'{self.address}{i}:{port}'))
-						if result == 0:
-							# If the connection is made successfully (i.e., port is open for this device), then we display it
+			ports = [self.port]
 
-							print(f'\r[#] {self.address}{i} | Port {port} -> available [{self.address}{i}:{port}]')
-						stdout.flush()
-				else:
-					# If the port number is something more specific, then we check for connection to that specific port number
-
-					# Establishing a connection to the currently iterated device (with the IP address) with the specified port number
-					connection = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-					socket.setdefaulttimeout(1)
-					result = connection.connect_ex((f'{self.address}{i}', self.port))
-					stdout.write('\r')
-					stdout.write('[!] Checking connection at %-20s' %(f'{self.address}:{self.port}'))
-					if result == 0:
-						# If the connection is made successfully (i.e., port is open for this device), then we display it
-
-						print(f'\r[#] {self.address}{i} | Port {self.port} -> available [{self.address}{i}:{self.port}]')
-					stdout.flush()
-			print('\r[================== Scan completed ==================]')
+		# Checking which of the devices are up (if the host discovery is enabled)
+		scanner = PortScanner(concurrency = self.concurrency, timeout = self.timeout, rate = self.rate)
+		if self.discover:
+			# If the host discovery is enabled, then we continue to check the connections of only the devices which are up
+
+			hosts = scanner.discover(hosts = hosts)
+			print(f'[!] Devices found up : {len(hosts)}')
+
+		# Checking the connections (the available ones are displayed as soon as they are found)
+		self.available = '[#] {host} | Port {port} -> available [{host}:{port}]'
+		self.checked = 0
+		self.total = len(hosts) * len(ports)
+		self.lastprogress = 0
+		self.runscan(scanner, hosts, ports)
+		print('\r[================== Scan completed ==================]')
+		self.reporterrors(scanner)
+
+	def discoverHosts(self):
+		""" The method / function which checks which of the devices at the user specified IP addresses (stored in the class variable self.address, half or full address) are up, by probing a few common ports of each of them concurrently (see the PortScanner.discover() method). The devices are displayed on the console screen as soon as they are found up. """
+
+		# Checking for the IP address type
+		if self.addressType == 'half':
+			# If the IP address entered by the user is half type address, then we continue with all the devices on the network
+
+			hosts = [f'{self.address}{i}' for i in range(1, 256)]
 		elif self.addressType == 'full':
-			# If the IP address entered by the user is full type address, then we continue
-
-			# Checking the port number input
-			if self.port == 0:
-				# If the port number is 0, then we check for all the ports ranging from 1 to 65535
-
-				for port in range(1, 65536):
-					# Iterating through each port number
-
-					# Establishing a connection to the device (with the IP address) with the currently iterated port number
-					connection = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-					socket.setdefaulttimeout(1)
-					result = connection.connect_ex((self.address, port))
-					stdout.write('\r')
-					stdout.write('[!] Checking connection at %-20s' %(f'{self.address}:{port}'))
-					if result == 0:
-						# If the connection is made successfully (i.e., port is open for this device), then we display it
-
-						print(f'\r[#] {self.address} | Port {port} -> available [{self.address}:{port}]')
-					stdout.flush()
-			else:
-				# If the port number is something more specific, then we check for connection to that specific port number
-
-				# Establishing a connection to the device (with the IP address) with the specified port number
-				connection = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-				socket.setdefaulttimeout(1)
-				result = connection.connect_ex((self.address, self.port))
-				stdout.write('\r')
-				stdout.write('[!] Checking connection at %-20s' %(f'{self.address}:{self.port}'))
-				if result == 0:
-					# If the connection is made successfully (i.e., port is open for this device), then we display it
-
-					print(f'\r[#] {self.address} | Port {self.port} -> available [{self.address}:{self.port}]')
-				stdout.flush()
-			print('\r[================== Scan completed ==================]')
+			# If the IP address entered by the user is full type address, then we continue with the single device
+
+			hosts = [self.address]
 		else:
 			# If the IP address entered by the user is not recognized by any of the types, then we display the error message on the console screen
 
 			print(f'[ Error : Improper IP address provided or failed to render the input from the user. ]')
 			return 0
 
+		# Discovering the devices
+		stdout.write(f'[!] Checking {len(hosts)} devices')
+		stdout.flush()
+		scanner = PortScanner(concurrency = self.concurrency, timeout = self.timeout, rate = self.rate)
+		self.writer = None if self.output == None else ScanWriter(filename = self.output)
+		try:
+			hosts = scanner.discover(hosts = hosts, callback = self.reportlive)
+		finally:
+			if self.writer != None:
+				# If the output file is opened, then we close it
+
+				self.writer.close()
+		print(f'\r[================== Scan completed ({len(hosts)} devices up) ==================]')
+		self.reporterrors(scanner)
+
+	def runscan(self, scanner, hosts, ports):
+		""" This method / function serves the functionality of checking the connections of each of the hosts on each of the ports (interleaved, see the sweep() method) using the specified PortScanner engine. The results are reported to the report() method as soon as they are available, and also written to the output file (if specified in the class variable self.output). """
+
+		self.writer = None if self.output == None else ScanWriter(filename = self.output)
+		try:
+			scanner.scan(targets = self.sweep(hosts, ports), callback = self.report)
+		finally:
+			if self.writer != None:
+				# If the output file is opened, then we close it
+
+				self.writer.close()
+
+	def reporterrors(self, scanner):
+		""" This method / function serves the functionality of displaying the number of connections which could not be checked at all during the last scan of the specified PortScanner engine (out of file descriptors, etc) on the console screen, as their state is unknown (neither available nor unavailable). Nothing is displayed if all of the connections were checked. """
+
+		if scanner.errors != 0:
+			# If some of the connections could not be checked, then we display the number of them on the console screen
+
+			print(f'[ Error : {scanner.errors} connections could not be checked (out of file descriptors, etc), their state is unknown. Try again with a lower concurrency limit (--concurrency). ]')
+
+	def reportlive(self, host, port, state, latency):
+		""" This method / function serves the functionality of handling each of the devices found up during the host discovery (it is the callback for the PortScanner.discover() method). The device is displayed on the console screen, and the response which marked it up is written to the output file (if specified). """
+
+		print('\r%-60s' %(f'[#] {host} -> up'))
+		if self.writer != None:
+			# If the output file is specified, then we write the result to it
+
+			self.writer.write(host, port, state, latency)
+
+	@staticmethod
+	def sweep(hosts, ports):
+		""" This method / function serves the functionality of generating the (host, port) pairs to be checked, interleaved across the hosts (i.e., each of the ports is checked on all of the hosts, before moving on to the next port). Thus the probes in flight at once are spread over the whole network instead of piling up on a single device, and the generator is consumed lazily by the PortScanner engine. """
+
+		for port in ports:
+			# Iterating through each port number
+
+			for host in hosts:
+				# Iterating through each host
+
+				yield host, port
+
+	def report(self, host, port, state, latency):
+		""" This method / function serves the functionality of handling the result of each of the connection checks (it is the callback for the PortScanner engine). The available connections are displayed on the console screen as soon as they are found (and all of the results are written to the output file, if specified), and the progress line (number of connections checked) is updated atmost 4 times per second. """
+
+		self.checked += 1
+		if self.writer != None:
+			# If the output file is specified, then we write the result to it
+
+			self.writer.write(host, port, state, latency)
+		if state == 'open':
+			# If the connection is made successfully (i.e., port is open for this device), then we display it
+
+			print('\r%-60s' %(self.available.format(host = host, port = port)))
+
+		# Updating the progress line
+		now = monotonic()
+		if now - self.lastprogress >= 0.25 or self.checked == self.total:
+			# If the progress line was not updated in the last 0.25 seconds (or the scan is completed), then we update it
+
+			self.lastprogress = now
+			stdout.write(f'\r[!] Checked {self.checked} / {self.total} connections')
+			stdout.flush()
+
 	def checkSSH(self):
-		""" This method / function checks whether the SSH connections are available for the user entered IP address. This function checks for the IP address stored in the class variable self.address, also uses the same algorithms for half and full addresses as per provided. We will check for the port numbers [22, 8022]. """
+		""" This method / function checks whether the SSH connections are available for the user entered IP address. This function checks for the IP address stored in the class variable self.address, also uses the same algorithms for half and full addresses as per provided. We will check for the port numbers [22, 8022] (or the port number specified by the user, if any). """
 
 		# Checking for the IP address type
 		if self.addressType == 'half':
-			# If the IP address entered by the user is half type address, then we continue
-
-			# Checking for the connectivity to the devices in the network via the particular HTTP ports (which are used for SSH)
-			for i in range(1, 256):
-				# Iterating through each number ranging from 1 to 255 in order to check for all available devices
-
-				for port in [22, 8022]:
-					# Iterating through each port number in the list
-
-					connection = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-					socket.setdefaulttimeout(1)
-					result = connection.connect_ex((f'{self.address}{i}', port))
-					stdout.write('\r')
-					stdout.write('[!] Checking SSH connection at %-20s' %(f'{self.address}{i}:{port}'))
-					if result == 0:
-						# If the connection is made successfully (i.e., port is open for this device), then we display it
-
-						print(f'\r[#] [{self.address}{i}:{port}] --> Available for connections')
-					stdout.flush()
-			print('\r[================== Scan completed ==================]')
+			# If the IP address entered by the user is half type address, then we continue with all the devices on the network
+
+			hosts = [f'{self.address}{i}' for i in range(1, 256)]
 		elif self.addressType == 'full':
-			# If the IP address entered by the user is a full type address, then we continue
-
-			# Checking for the connectivity to the specified device on the network via the particular HTTP ports (which are used for SSH)
-			for port in [22, 8022]:
-				# Iterating through each port number in the list
-
-				connection = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-				socket.setdefaulttimeout(1)
-				result = connection.connect_ex((self.address, port))
-				stdout.write('\r')
-				stdout.write('[!] Checking SSH connection at %-20s' %(f'{self.address}:{port}'))
-				if result == 0:
-					# If the connection is made successfully (i.e., port is open for this device), then we display it
-
-					print(f'\r[#] [{self.address}:{port}] --> Available for connections')
-				stdout.flush()
-			print('\r[================== Scan completed ==================]')
+			# If the IP address entered by the user is a full type address, then we continue with the single device
+
+			hosts = [self.address]
 		else:
 			# If the IP address entered by the user is not recognized by any of the types, then we display the error message on the console screen
 
 			print(f'[ Error : Improper IP address provided or failed to render the input from the user. ]')
 			return 0
 
+		# Checking the port number input
+		if self.port == 0:
+			# If the port number is not specified, then we check for the port numbers used for SSH
+
+			ports = [22, 8022]
+		else:
+			# If the port number is specified, then we check for that specific port number
+
+			ports = [self.port]
+
+		# Checking for the connectivity to the devices in the network via the SSH ports (the available ones are displayed as soon as they are found)
+		self.available = '[#] [{host}:{port}] --> Available for connections'
+		self.checked = 0
+		self.total = len(hosts) * len(ports)
+		self.lastprogress = 0
+		scanner = PortScanner(concurrency = self.concurrency, timeout = self.timeout, rate = self.rate)
+		self.runscan(scanner, hosts, ports)
+		print('\r[================== Scan completed ==================]')
+		self.reporterrors(scanner)
+
 class SSH:
 	""" The class which defines the functionality of the SSH commands of the shell. 
 